@@ -0,0 +1,105 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+
+from vng_api_common.authorizations.models import Applicatie
+from vng_api_common.models import JWTSecret
+from vng_api_common.tests.auth import generate_jwt_auth
+
+from ...notifications_benchmark import (
+    HANDLERS,
+    benchmark_environment,
+    generate_notifications,
+    run_test_client,
+    run_wsgi_server,
+)
+
+CLIENT_ID = "notifications-benchmark"
+SECRET = "notifications-benchmark"
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the latency and throughput of the notification webhook. Runs "
+        "against a new test database, an existing one is only replaced after "
+        "confirmation."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--handler",
+            choices=list(HANDLERS),
+            action="append",
+            help="Handler configuration to benchmark, can be repeated. Defaults "
+            "to all configurations.",
+        )
+        parser.add_argument(
+            "--transport",
+            choices=["client", "wsgi"],
+            action="append",
+            help="Post through the Django test client and/or a local WSGI "
+            "server. Defaults to both.",
+        )
+        parser.add_argument(
+            "--count", type=int, default=1000, help="Number of notifications."
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=8,
+            help="Number of concurrent clients for the WSGI server.",
+        )
+        parser.add_argument(
+            "--inbox",
+            action="store_true",
+            help="Store the notifications in the inbox instead of handling them.",
+        )
+        parser.add_argument("--seed", type=int, default=None)
+
+    def handle(self, **options):
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=False, serialize=False
+        )
+        try:
+            with override_settings(
+                COMMONGROUND_API_COMMON={"NOTIFICATIONS_INBOX": options["inbox"]}
+            ):
+                self._run(**options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def _run(self, **options):
+        JWTSecret.objects.create(identifier=CLIENT_ID, secret=SECRET)
+        Applicatie.objects.create(
+            client_ids=[CLIENT_ID], label="Benchmark", heeft_alle_autorisaties=True
+        )
+        authorization = generate_jwt_auth(CLIENT_ID, SECRET)
+
+        self.stdout.write(
+            f"{'handler':<10}{'transport':<11}{'requests':>9}{'errors':>8}"
+            f"{'req/s':>10}{'p50 ms':>9}{'p90 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        )
+        for handler in options["handler"] or list(HANDLERS):
+            _, kanalen = HANDLERS[handler]
+            for transport in options["transport"] or ["client", "wsgi"]:
+                notifications = generate_notifications(
+                    options["count"], kanalen, seed=options["seed"]
+                )
+                with benchmark_environment(handler):
+                    if transport == "client":
+                        result = run_test_client(notifications, authorization)
+                    else:
+                        result = run_wsgi_server(
+                            notifications,
+                            authorization,
+                            concurrency=options["concurrency"],
+                        )
+
+                self.stdout.write(
+                    f"{handler:<10}{transport:<11}{result.requests:>9}"
+                    f"{result.errors:>8}{result.throughput:>10.1f}"
+                    + "".join(
+                        f"{result.percentile(percent) * 1000:>9.2f}"
+                        for percent in (50, 90, 95, 99)
+                    )
+                )
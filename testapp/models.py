@@ -19,6 +19,9 @@ class Group(models.Model):
         optional=("field_2",),
     )
 
+    def unique_representation(self):
+        return self.name
+
 
 class Person(ETagMixin, models.Model):
     name = models.CharField(_("name"), max_length=50)
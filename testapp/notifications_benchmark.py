@@ -0,0 +1,318 @@
+"""
+Load test harness for the notification webhook.
+
+Used by the ``benchmark_notifications`` management command of the test project
+to find out how many notifications per second a webhook receiver can absorb.
+Notifications are posted to
+:class:`vng_api_common.notifications.api.views.NotificationView` through the
+Django test client or a local (threaded) WSGI server, for the handler
+configurations in :data:`HANDLERS`. The Autorisaties API is replaced by
+:class:`ACStubClient`.
+"""
+
+import json
+import random
+import statistics
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from socketserver import ThreadingMixIn
+from typing import Any
+from unittest.mock import patch
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.test import Client, override_settings
+from django.utils import timezone
+
+import requests
+
+from vng_api_common.constants import CommonResourceAction
+from vng_api_common.notifications.handlers import (
+    KANAAL_AUTORISATIES,
+    AuthHandler,
+    LoggingHandler,
+    RoutingHandler,
+)
+from vng_api_common.notifications.routing import Route, ThreadPoolRouteExecutor
+from vng_api_common.utils import get_uuid_from_path
+
+WEBHOOK_PATH = "/callbacks"
+
+AC_ROOT = "https://ac.example.com/api/v1/"
+ZRC_ROOT = "https://zrc.example.com/api/v1/"
+ZTC_ROOT = "https://ztc.example.com/api/v1/"
+
+
+def build_routed_handler() -> RoutingHandler:
+    logging_handler = LoggingHandler()
+    return RoutingHandler(
+        {KANAAL_AUTORISATIES: AuthHandler()},
+        default=logging_handler,
+        routes=[
+            Route(
+                [logging_handler],
+                kanaal="zaken",
+                resource="zaak",
+                kenmerken={"zaaktype": lambda value: value.startswith(ZTC_ROOT)},
+                executor=ThreadPoolRouteExecutor(max_workers=4),
+            )
+        ],
+    )
+
+
+#: Handler configurations that can be benchmarked: a factory for the handler and
+#: the kanalen of the generated notifications
+HANDLERS: dict[str, tuple[Callable[[], Any], list[str]]] = {
+    "logging": (LoggingHandler, ["zaken"]),
+    "auth": (AuthHandler, [KANAAL_AUTORISATIES]),
+    "routed": (build_routed_handler, ["zaken", KANAAL_AUTORISATIES]),
+}
+
+
+class ACStubClient:
+    """
+    Stand-in for the Autorisaties API, every applicatie has all authorizations.
+    """
+
+    def get(self, url: str, *args, **kwargs) -> requests.Response:
+        applicatie_uuid = get_uuid_from_path(url)
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(
+            {
+                "url": url,
+                "clientIds": [f"client-{applicatie_uuid}"],
+                "label": f"Applicatie {applicatie_uuid}",
+                "heeftAlleAutorisaties": True,
+                "autorisaties": [],
+            }
+        ).encode()
+        return response
+
+
+def generate_notification(kanaal: str, rng: random.Random | None = None) -> dict:
+    """
+    Generate a realistic notification (in the camelCase form that is posted).
+    """
+    rng = rng or random.Random()
+    now = timezone.now().isoformat()
+    resource_uuid = uuid.UUID(int=rng.getrandbits(128), version=4)
+
+    if kanaal == KANAAL_AUTORISATIES:
+        url = f"{AC_ROOT}applicaties/{resource_uuid}"
+        return {
+            "kanaal": kanaal,
+            "hoofdObject": url,
+            "resource": "applicatie",
+            "resourceUrl": url,
+            "actie": rng.choice(
+                [CommonResourceAction.create, CommonResourceAction.update]
+            ),
+            "aanmaakdatum": now,
+            "kenmerken": {},
+        }
+
+    zaak_url = f"{ZRC_ROOT}zaken/{resource_uuid}"
+    resource, resource_url = rng.choice(
+        [
+            ("zaak", zaak_url),
+            ("status", f"{ZRC_ROOT}statussen/{uuid.uuid4()}"),
+            ("rol", f"{ZRC_ROOT}rollen/{uuid.uuid4()}"),
+        ]
+    )
+    return {
+        "kanaal": kanaal,
+        "hoofdObject": zaak_url,
+        "resource": resource,
+        "resourceUrl": resource_url,
+        "actie": rng.choice(
+            [CommonResourceAction.create, CommonResourceAction.partial_update]
+        ),
+        "aanmaakdatum": now,
+        "kenmerken": {
+            "bronorganisatie": "517439943",
+            "zaaktype": f"{ZTC_ROOT}zaaktypen/{uuid.uuid4()}",
+            "vertrouwelijkheidaanduiding": "openbaar",
+        },
+    }
+
+
+def generate_notifications(
+    count: int, kanalen: list[str], seed: int | None = None
+) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        generate_notification(kanalen[index % len(kanalen)], rng)
+        for index in range(count)
+    ]
+
+
+@dataclass
+class BenchmarkResult:
+    requests: int
+    errors: int
+    duration: float
+    latencies: list[float]
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.duration if self.duration else 0.0
+
+    def percentile(self, percent: int) -> float:
+        if not self.latencies:
+            return 0.0
+        if len(self.latencies) == 1:
+            return self.latencies[0]
+        cut_points = statistics.quantiles(self.latencies, n=100, method="inclusive")
+        return cut_points[percent - 1]
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "throughput": self.throughput,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": max(self.latencies, default=0.0),
+        }
+
+
+def _measure(
+    post: Callable[[dict], int], notifications: list[dict], concurrency: int
+) -> BenchmarkResult:
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def send(notification: dict) -> None:
+        nonlocal errors
+        start = time.perf_counter()
+        status_code = post(notification)
+        latency = time.perf_counter() - start
+        with lock:
+            latencies.append(latency)
+            if status_code != 204:
+                errors += 1
+
+    start = time.perf_counter()
+    if concurrency <= 1:
+        for notification in notifications:
+            send(notification)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(send, notifications))
+    duration = time.perf_counter() - start
+
+    return BenchmarkResult(
+        requests=len(notifications),
+        errors=errors,
+        duration=duration,
+        latencies=latencies,
+    )
+
+
+def run_test_client(notifications: list[dict], authorization: str) -> BenchmarkResult:
+    """
+    Post the notifications in-process with the Django test client.
+    """
+    client = Client(HTTP_AUTHORIZATION=authorization)
+
+    def post(notification: dict) -> int:
+        response = client.post(
+            WEBHOOK_PATH,
+            data=json.dumps(notification),
+            content_type="application/json",
+        )
+        return response.status_code
+
+    return _measure(post, notifications, concurrency=1)
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class QuietWSGIRequestHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def wsgi_server() -> Iterator[str]:
+    """
+    Serve the Django project on a free local port, yields the base URL.
+    """
+    server = make_server(
+        "127.0.0.1",
+        0,
+        WSGIHandler(),
+        server_class=ThreadingWSGIServer,
+        handler_class=QuietWSGIRequestHandler,
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def run_wsgi_server(
+    notifications: list[dict], authorization: str, concurrency: int = 1
+) -> BenchmarkResult:
+    """
+    Post the notifications over HTTP to a local WSGI server.
+    """
+    sessions = threading.local()
+
+    with wsgi_server() as base_url:
+
+        def post(notification: dict) -> int:
+            if not hasattr(sessions, "session"):
+                sessions.session = requests.Session()
+                sessions.session.headers["Authorization"] = authorization
+            response = sessions.session.post(
+                f"{base_url}{WEBHOOK_PATH}", json=notification
+            )
+            return response.status_code
+
+        return _measure(post, notifications, concurrency=concurrency)
+
+
+@contextmanager
+def benchmark_environment(handler: str) -> Iterator[None]:
+    """
+    Route the webhook to a new instance of the handler configuration, with a
+    stand-in AC.
+    """
+    factory, _ = HANDLERS[handler]
+    instance = factory()
+    try:
+        with (
+            override_settings(
+                ROOT_URLCONF="vng_api_common.notifications.api.urls",
+                ALLOWED_HOSTS=["*"],
+            ),
+            patch(
+                "vng_api_common.notifications.api.views.get_notifications_handler",
+                return_value=instance,
+            ),
+            patch(
+                "vng_api_common.notifications.handlers.get_client",
+                side_effect=lambda url: ACStubClient(),
+            ),
+        ):
+            yield
+    finally:
+        for route in getattr(instance, "routes", []):
+            route.executor.shutdown()
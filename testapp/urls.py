@@ -12,6 +12,7 @@ from vng_api_common import routers
 from vng_api_common.views import ViewConfigView
 
 from .viewsets import (
+    CursorPaginateHobbyViewSet,
     GroupViewSet,
     HobbyViewSet,
     NotitieViewSet,
@@ -29,6 +30,11 @@ router.register(
     [routers.Nested("nested-person", PersonViewSet, basename="nested-person")],
 )
 router.register("paginate-hobbies", PaginateHobbyViewSet, basename="paginate-hobby")
+router.register(
+    "cursor-paginate-hobbies",
+    CursorPaginateHobbyViewSet,
+    basename="cursor-paginate-hobby",
+)
 
 urlpatterns = [
     path("admin/", admin.site.urls),
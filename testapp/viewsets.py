@@ -4,7 +4,11 @@ from rest_framework import viewsets
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.geo import GeoMixin
 from vng_api_common.notes.api.viewsets import NotitieViewSetMixin
-from vng_api_common.pagination import DynamicPageSizePagination
+from vng_api_common.pagination import (
+    DynamicCursorPagination,
+    DynamicPageSizePagination,
+)
+from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from .models import GeometryModel, Group, Hobby, MediaFileModel, Notitie, Person, Poly
 from .serializers import (
@@ -47,6 +51,12 @@ class PaginateHobbyViewSet(viewsets.ModelViewSet):
     pagination_class = DynamicPageSizePagination
 
 
+class CursorPaginateHobbyViewSet(CheckQueryParamsMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Hobby.objects.all().order_by("name")
+    serializer_class = HobbySerializer
+    pagination_class = DynamicCursorPagination
+
+
 class PolyViewSet(viewsets.ModelViewSet):
     queryset = Poly.objects.all()
     serializer_class = PolySerializer
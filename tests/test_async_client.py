@@ -0,0 +1,126 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+from ape_pie.exceptions import InvalidURLError
+from zgw_consumers.constants import AuthTypes
+from zgw_consumers.models import Service
+
+from vng_api_common.async_client import (
+    AsyncClient,
+    aget_client,
+    build_async_client,
+    to_internal_data,
+)
+from vng_api_common.client import ClientError, NoServiceConfigured
+from vng_api_common.client_registry import ServiceIndex
+
+ZRC_ROOT = "https://zrc.example.com/api/v1/"
+
+
+def _client(handler, **kwargs) -> AsyncClient:
+    return AsyncClient(
+        base_url=ZRC_ROOT, transport=httpx.MockTransport(handler), **kwargs
+    )
+
+
+def test_json_defaults():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(201, json={"url": f"{ZRC_ROOT}zaken/1"})
+
+    async def run():
+        async with _client(handler) as client:
+            response = await client.post("zaken", data={"bronorganisatie": "1"})
+            return to_internal_data(response)
+
+    assert asyncio.run(run()) == {"url": f"{ZRC_ROOT}zaken/1"}
+    request = requests[0]
+    assert str(request.url) == f"{ZRC_ROOT}zaken"
+    assert request.headers["Accept"] == "application/json"
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.content) == {"bronorganisatie": "1"}
+
+
+@pytest.mark.parametrize("status_code", [400, 404])
+def test_client_errors(status_code):
+    def handler(request):
+        return httpx.Response(status_code, json={"detail": "error"})
+
+    async def run():
+        async with _client(handler) as client:
+            return to_internal_data(await client.get("zaken"))
+
+    with pytest.raises(ClientError) as exc_info:
+        asyncio.run(run())
+
+    assert exc_info.value.args[0] == {"detail": "error"}
+
+
+def test_server_errors_are_reraised():
+    def handler(request):
+        return httpx.Response(502, text="Bad gateway")
+
+    async def run():
+        async with _client(handler) as client:
+            return to_internal_data(await client.get("zaken"))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run())
+
+
+def test_other_hosts_are_refused():
+    async def run():
+        async with _client(lambda request: httpx.Response(200)) as client:
+            await client.get("https://evil.example.com/api/v1/zaken")
+
+    with pytest.raises(InvalidURLError):
+        asyncio.run(run())
+
+
+def test_service_auth():
+    service = Service(
+        api_root=ZRC_ROOT,
+        auth_type=AuthTypes.api_key,
+        header_key="X-Api-Key",
+        header_value="secret",
+        timeout=5,
+    )
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=[])
+
+    async def run():
+        async with build_async_client(
+            service, transport=httpx.MockTransport(handler)
+        ) as client:
+            await client.get(f"{ZRC_ROOT}zaken")
+            return client
+
+    client = asyncio.run(run())
+
+    assert requests[0].headers["X-Api-Key"] == "secret"
+    assert client.timeout.read == 5
+
+
+def test_aget_client():
+    index = ServiceIndex([Service(api_root=ZRC_ROOT, auth_type=AuthTypes.no_auth)])
+
+    with patch(
+        "vng_api_common.client_registry.registry.get_service", side_effect=index.resolve
+    ):
+        client = asyncio.run(aget_client(f"{ZRC_ROOT}zaken/1"))
+        assert isinstance(client, AsyncClient)
+        assert str(client.base_url) == ZRC_ROOT
+
+        assert asyncio.run(aget_client("https://drc.example.com/api/v1/")) is None
+        with pytest.raises(NoServiceConfigured):
+            asyncio.run(
+                aget_client("https://drc.example.com/api/v1/", raise_exceptions=True)
+            )
@@ -0,0 +1,107 @@
+from django.core.management import call_command
+
+import pytest
+
+from vng_api_common.audittrails.api.serializers import AuditTrailSerializer
+from vng_api_common.audittrails.compaction import (
+    apply_patch,
+    expand_audittrails,
+    make_patch,
+)
+from vng_api_common.audittrails.models import AuditTrail
+
+URL = "http://testserver/api/v1/zaken/1"
+
+
+@pytest.mark.parametrize(
+    "source,target",
+    (
+        ({"a": 1, "b": {"c": 2}}, {"a": 1, "b": {"c": 3}}),
+        ({"a": 1, "b": 2}, {"a": 1}),
+        ({"a": 1}, {"a": 1, "a/b~c": [1, 2]}),
+        ({"a": [1, 2]}, {"a": [2]}),
+        ({"a": True}, {"a": 1}),
+        (None, {"a": 1}),
+    ),
+)
+def test_patch_roundtrip(source, target):
+    patch = make_patch(source, target)
+
+    assert apply_patch(source, patch) == target
+
+
+def test_apply_patch_does_not_modify_source():
+    source = {"a": {"b": 1}}
+
+    apply_patch(source, make_patch(source, {"a": {"b": 2}}))
+
+    assert source == {"a": {"b": 1}}
+
+
+def _create_chain(length: int) -> list[AuditTrail]:
+    trails = []
+    previous = None
+    for index in range(length):
+        version = {"url": URL, "omschrijving": f"versie {index}", "vast": "waarde"}
+        trails.append(
+            AuditTrail.objects.create(
+                bron="ZRC",
+                actie="update" if previous else "create",
+                resultaat=200,
+                hoofd_object=URL,
+                resource="zaak",
+                resource_url=URL,
+                resource_weergave="ZAAK-1",
+                oud=previous,
+                nieuw=version,
+            )
+        )
+        previous = version
+    return trails
+
+
+@pytest.mark.django_db
+def test_compaction_keeps_representation():
+    _create_chain(5)
+    expected = AuditTrailSerializer(AuditTrail.objects.all(), many=True).data
+
+    call_command("compact_audittrails", snapshot_interval=3)
+
+    records = AuditTrail.objects.order_by("pk")
+    assert [record.is_compact for record in records] == [
+        False,
+        True,
+        True,
+        False,
+        True,
+    ]
+    assert AuditTrailSerializer(records, many=True).data == expected
+    # access through the gegevensgroep
+    assert records[4].wijzigingen == expected[4]["wijzigingen"]
+
+
+@pytest.mark.django_db
+def test_compaction_is_idempotent():
+    _create_chain(4)
+    call_command("compact_audittrails", snapshot_interval=2)
+    expected = AuditTrailSerializer(AuditTrail.objects.all(), many=True).data
+
+    call_command("compact_audittrails", snapshot_interval=2)
+
+    assert AuditTrailSerializer(AuditTrail.objects.all(), many=True).data == expected
+
+
+@pytest.mark.django_db
+def test_expansion_starts_from_latest_snapshot(django_assert_num_queries):
+    trails = _create_chain(5)
+    call_command("compact_audittrails", snapshot_interval=3)
+    expected = AuditTrailSerializer(AuditTrail.objects.get(pk=trails[4].pk)).data
+    # the records before the snapshot are not needed
+    AuditTrail.objects.filter(pk__in=[trail.pk for trail in trails[:3]]).delete()
+
+    record = AuditTrail.objects.get(pk=trails[4].pk)
+    with django_assert_num_queries(2):
+        expand_audittrails([record])
+
+    assert record.nieuw == expected["wijzigingen"]["nieuw"]
+    assert record.oud == expected["wijzigingen"]["oud"]
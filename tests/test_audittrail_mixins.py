@@ -0,0 +1,143 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+from rest_framework import serializers, viewsets
+from rest_framework.test import APIRequestFactory
+
+from testapp.factories import GroupFactory
+from testapp.models import Group
+from vng_api_common.audittrails.audits import Audit
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.audittrails.viewsets import AuditTrailViewsetMixin
+from vng_api_common.authorizations.middleware import AuthMiddleware
+from vng_api_common.serializers import CachedHyperlinkedIdentityField
+from vng_api_common.tests import JWTAuthMixin, generate_jwt_auth
+
+
+class AuditGroupSerializer(serializers.ModelSerializer):
+    url = CachedHyperlinkedIdentityField(view_name="group-detail", lookup_field="pk")
+
+    class Meta:
+        model = Group
+        fields = ("url", "name")
+
+
+class AuditGroupViewSet(AuditTrailViewsetMixin, viewsets.ModelViewSet):
+    queryset = Group.objects.all()
+    serializer_class = AuditGroupSerializer
+    permission_classes = ()
+    audit = Audit(component_name="ZRC", main_resource="group")
+
+
+class AuditSubgroupViewSet(AuditGroupViewSet):
+    audittrail_main_resource_key = "url"
+
+
+def _get_request(method: str, group: Group, **kwargs):
+    JWTAuthMixin._create_credentials(
+        "testsuite",
+        "letmein",
+        heeft_alle_autorisaties=True,
+        max_vertrouwelijkheidaanduiding="zeer_geheim",
+    )
+    request = getattr(APIRequestFactory(), method)(
+        f"/api/groups/{group.pk}",
+        format="json",
+        HTTP_AUTHORIZATION=generate_jwt_auth("testsuite", "letmein"),
+        **kwargs,
+    )
+    AuthMiddleware().extract_jwt_payload(request)
+    return request
+
+
+def _count_group_fetches(queries) -> int:
+    return sum(
+        1
+        for query in queries
+        if query["sql"].startswith("SELECT") and '"testapp_group"' in query["sql"]
+    )
+
+
+@pytest.mark.django_db
+def test_update_records_version_before_edit():
+    group = GroupFactory.create(name="old")
+    view = AuditGroupViewSet.as_view({"put": "update"}, basename="group")
+    request = _get_request("put", group, data={"name": "new"})
+
+    with CaptureQueriesContext(connection) as context:
+        response = view(request, pk=group.pk)
+
+    assert response.status_code == 200
+    assert _count_group_fetches(context.captured_queries) == 1
+
+    trail = AuditTrail.objects.get()
+    assert trail.actie == "update"
+    assert trail.resource_weergave == "old"
+    assert trail.applicatie_weergave == "for test"
+    assert trail.gebruikers_id == "test_user_id"
+    assert trail.oud["name"] == "old"
+    assert trail.nieuw["name"] == "new"
+    assert trail.hoofd_object == f"http://testserver/api/groups/{group.pk}"
+
+
+@pytest.mark.django_db
+def test_partial_update_records_version_before_edit():
+    group = GroupFactory.create(name="old")
+    view = AuditGroupViewSet.as_view({"patch": "partial_update"}, basename="group")
+    request = _get_request("patch", group, data={"name": "new"})
+
+    response = view(request, pk=group.pk)
+
+    assert response.status_code == 200
+    trail = AuditTrail.objects.get()
+    assert trail.actie == "partial_update"
+    assert trail.resource_weergave == "old"
+    assert trail.oud["name"] == "old"
+    assert trail.nieuw["name"] == "new"
+
+
+@pytest.mark.django_db
+def test_destroy_records_version_before_edit():
+    group = GroupFactory.create(name="old")
+    view = AuditSubgroupViewSet.as_view({"delete": "destroy"}, basename="subgroup")
+    request = _get_request("delete", group)
+
+    with CaptureQueriesContext(connection) as context:
+        response = view(request, pk=group.pk)
+
+    assert response.status_code == 204
+    assert _count_group_fetches(context.captured_queries) == 1
+
+    trail = AuditTrail.objects.get()
+    assert trail.actie == "destroy"
+    assert trail.resource_weergave == "old"
+    assert trail.oud["name"] == "old"
+    assert trail.nieuw is None
+
+
+@pytest.mark.django_db
+def test_destroy_main_resource_deletes_audittrails(
+    django_capture_on_commit_callbacks,
+):
+    group, other = GroupFactory.create_batch(2)
+    for instance in (group, other):
+        url = f"http://testserver/api/groups/{instance.pk}"
+        AuditTrail.objects.create(
+            bron="ZRC",
+            actie="create",
+            resultaat=201,
+            hoofd_object=url,
+            resource_url=url,
+        )
+    view = AuditGroupViewSet.as_view({"delete": "destroy"}, basename="group")
+    request = _get_request("delete", group)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = view(request, pk=group.pk)
+
+    assert response.status_code == 204
+    assert not Group.objects.filter(pk=group.pk).exists()
+    assert list(AuditTrail.objects.values_list("hoofd_object", flat=True)) == [
+        f"http://testserver/api/groups/{other.pk}"
+    ]
@@ -0,0 +1,136 @@
+import gzip
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from django.core.management import call_command
+
+import pytest
+from freezegun import freeze_time
+
+from vng_api_common.audittrails.compaction import compact_audittrails
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.audittrails.partitioning import (
+    _rebase_chains,
+    get_month_start,
+    get_partition_name,
+    get_partitions,
+    is_partitioned,
+)
+from vng_api_common.checks import check_partitioned_audittrails_migrations
+
+
+@pytest.mark.parametrize(
+    "moment,months,expected",
+    [
+        (datetime(2026, 10, 19, 12, tzinfo=timezone.utc), 0, datetime(2026, 10, 1)),
+        (datetime(2026, 10, 19, 12, tzinfo=timezone.utc), 3, datetime(2027, 1, 1)),
+        (datetime(2026, 1, 31, 23, tzinfo=timezone.utc), -1, datetime(2025, 12, 1)),
+        (datetime(2026, 12, 31, 23, tzinfo=timezone.utc), 1, datetime(2027, 1, 1)),
+    ],
+)
+def test_get_month_start(moment, months, expected):
+    assert get_month_start(moment, months) == expected.replace(tzinfo=timezone.utc)
+
+
+def test_get_partition_name():
+    month_start = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+    assert get_partition_name(month_start) == "audittrails_audittrail_p202603"
+
+
+@pytest.mark.django_db
+def test_partition_and_archive(tmp_path):
+    with freeze_time("2026-01-15T12:00:00Z"):
+        old = AuditTrail.objects.create(
+            bron="ZRC",
+            actie="create",
+            resultaat=201,
+            hoofd_object="http://example.com/zaken/1",
+            resource="zaak",
+            resource_url="http://example.com/zaken/1",
+        )
+
+        call_command("partition_audittrails", months_ahead=2)
+
+        assert is_partitioned()
+        assert (
+            check_partitioned_audittrails_migrations(None, databases=["default"]) == []
+        )
+        assert {partition.name for partition in get_partitions()} == {
+            "audittrails_audittrail_legacy",
+            "audittrails_audittrail_default",
+            "audittrails_audittrail_p202602",
+            "audittrails_audittrail_p202603",
+        }
+
+    with freeze_time("2026-03-15T12:00:00Z"):
+        recent = AuditTrail.objects.create(
+            bron="ZRC",
+            actie="update",
+            resultaat=200,
+            hoofd_object="http://example.com/zaken/1",
+            resource="zaak",
+            resource_url="http://example.com/zaken/1",
+        )
+
+        call_command("archive_audittrails", retention_months=1, output_dir=tmp_path)
+
+    assert list(AuditTrail.objects.values_list("pk", flat=True)) == [recent.pk]
+    with gzip.open(tmp_path / "audittrails_audittrail_legacy.jsonl.gz", "rt") as f:
+        records = [json.loads(line) for line in f]
+    assert [record["id"] for record in records] == [old.pk]
+
+
+@pytest.mark.django_db
+def test_partitioned_table_blocks_migrations():
+    call_command("partition_audittrails", months_ahead=0)
+
+    with patch(
+        "vng_api_common.audittrails.partitioning.get_unapplied_migrations",
+        return_value=["0099_change"],
+    ):
+        errors = check_partitioned_audittrails_migrations(None, databases=["default"])
+
+    assert [error.id for error in errors] == ["vng_api_common.audittrails.E001"]
+
+
+@pytest.mark.django_db
+def test_rebase_chains_in_primary_key_order():
+    url = "http://example.com/zaken/1"
+    versions = [{"url": url, "omschrijving": f"versie {index}"} for index in range(4)]
+    trails = [
+        AuditTrail.objects.create(
+            bron="ZRC",
+            actie="update",
+            resultaat=200,
+            hoofd_object=url,
+            resource="zaak",
+            resource_url=url,
+            oud=versions[index - 1] if index else None,
+            nieuw=version,
+        )
+        for index, version in enumerate(versions)
+    ]
+    compact_audittrails(snapshot_interval=10)
+    # the third record was written late, e.g. by the outbox sink
+    january, march = (
+        datetime(2026, 1, 15, tzinfo=timezone.utc),
+        datetime(2026, 3, 15, tzinfo=timezone.utc),
+    )
+    for trail, aanmaakdatum in zip(trails, [january, march, january, march]):
+        AuditTrail.objects.filter(pk=trail.pk).update(aanmaakdatum=aanmaakdatum)
+
+    _rebase_chains(datetime(2026, 2, 1, tzinfo=timezone.utc))
+    AuditTrail.objects.filter(
+        aanmaakdatum__lt=datetime(2026, 2, 1, tzinfo=timezone.utc)
+    ).delete()
+
+    remaining = list(AuditTrail.objects.order_by("pk"))
+    assert [trail.pk for trail in remaining] == [trails[1].pk, trails[3].pk]
+    for trail in remaining:
+        assert not trail.is_compact
+    assert [(trail.oud, trail.nieuw) for trail in remaining] == [
+        (versions[0], versions[1]),
+        (versions[2], versions[3]),
+    ]
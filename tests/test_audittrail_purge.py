@@ -0,0 +1,123 @@
+import uuid
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from vng_api_common.audittrails.models import AuditTrail, AuditTrailPurge
+from vng_api_common.audittrails.purge import (
+    delete_audittrails,
+    destroy_related_audittrails,
+    get_audittrails_for_main_object,
+    is_purged,
+)
+
+
+def _create_trails(url: str, amount: int) -> None:
+    for _ in range(amount):
+        AuditTrail.objects.create(
+            bron="ZRC",
+            actie="update",
+            resultaat=200,
+            hoofd_object=url,
+            resource="zaak",
+            resource_url=url,
+            resource_weergave="ZAAK-1",
+        )
+
+
+@pytest.mark.django_db
+def test_delete_audittrails_in_chunks():
+    url = f"http://testserver/api/v1/zaken/{uuid.uuid4()}"
+    other_url = f"http://testserver/api/v1/zaken/{uuid.uuid4()}"
+    _create_trails(url, 5)
+    _create_trails(other_url, 1)
+
+    with CaptureQueriesContext(connection) as queries:
+        deleted = delete_audittrails(get_audittrails_for_main_object(url), chunk_size=2)
+
+    assert deleted == 5
+    # one DELETE per chunk, the primary keys are not fetched first
+    assert len(queries) == 3
+    assert all(query["sql"].startswith("DELETE") for query in queries)
+    assert list(AuditTrail.objects.values_list("hoofd_object", flat=True)) == [
+        other_url
+    ]
+
+
+@pytest.mark.django_db
+def test_destroy_related_audittrails_after_commit(django_capture_on_commit_callbacks):
+    url = f"http://testserver/api/v1/zaken/{uuid.uuid4()}"
+    _create_trails(url, 2)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        destroy_related_audittrails(url)
+
+    # nothing is deleted in the transaction of the main object
+    assert AuditTrail.objects.count() == 2
+    assert AuditTrailPurge.objects.count() == 1
+
+    for callback in callbacks:
+        callback()
+
+    assert not AuditTrail.objects.exists()
+    assert not AuditTrailPurge.objects.exists()
+
+
+@pytest.mark.django_db
+def test_interrupted_purge_is_finished_by_command(django_capture_on_commit_callbacks):
+    url = f"http://testserver/api/v1/zaken/{uuid.uuid4()}"
+    _create_trails(url, 2)
+
+    with (
+        patch(
+            "vng_api_common.audittrails.purge.delete_audittrails",
+            side_effect=RuntimeError("interrupted"),
+        ),
+        django_capture_on_commit_callbacks(execute=True),
+    ):
+        destroy_related_audittrails(url)
+
+    assert AuditTrail.objects.count() == 2
+
+    call_command("purge_audittrails")
+
+    assert not AuditTrail.objects.exists()
+    assert not AuditTrailPurge.objects.exists()
+
+
+@pytest.mark.django_db
+@override_settings(COMMONGROUND_API_COMMON={"AUDITTRAIL_DEFERRED_PURGE": True})
+def test_deferred_purge():
+    zaak_uuid = str(uuid.uuid4())
+    url = f"http://testserver/api/v1/zaken/{zaak_uuid}"
+    _create_trails(url, 2)
+
+    destroy_related_audittrails(url)
+
+    assert AuditTrail.objects.count() == 2
+    assert is_purged(zaak_uuid)
+
+    call_command("purge_audittrails")
+
+    assert not AuditTrail.objects.exists()
+    assert not is_purged(zaak_uuid)
+
+
+@pytest.mark.django_db
+@override_settings(COMMONGROUND_API_COMMON={"AUDITTRAIL_DEFERRED_PURGE": True})
+def test_purge_records_without_hoofd_object_uuid():
+    url = f"http://testserver/api/v1/zaken/{uuid.uuid4()}"
+    _create_trails(url, 2)
+    # not populated yet by the data migration
+    AuditTrail.objects.update(hoofd_object_uuid=None)
+    destroy_related_audittrails(url)
+
+    call_command("purge_audittrails", chunk_size=1)
+
+    assert not AuditTrail.objects.exists()
+    assert not AuditTrailPurge.objects.exists()
@@ -0,0 +1,127 @@
+import datetime
+import uuid
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import override_settings
+
+import pytest
+from freezegun import freeze_time
+
+from vng_api_common.audittrails.models import AuditTrail, AuditTrailOutbox
+from vng_api_common.audittrails.sinks import (
+    BufferedAuditSink,
+    DirectAuditSink,
+    OutboxAuditSink,
+    get_audit_sink,
+)
+
+ZAAK_UUID = uuid.UUID("e0c464e4-727c-41ef-948d-e3109ae870f4")
+
+
+def _build_trail(**kwargs) -> AuditTrail:
+    defaults = {
+        "bron": "ZRC",
+        "actie": "create",
+        "resultaat": 201,
+        "hoofd_object": f"http://testserver/api/v1/zaken/{ZAAK_UUID}",
+        "resource": "zaak",
+        "resource_url": "http://testserver/api/v1/zaken/1",
+        "resource_weergave": "ZAAK-1",
+        "nieuw": {"url": "http://testserver/api/v1/zaken/1"},
+    }
+    return AuditTrail(**{**defaults, **kwargs})
+
+
+@pytest.mark.django_db
+def test_direct_sink_saves_immediately():
+    DirectAuditSink().write(_build_trail())
+
+    assert AuditTrail.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_buffered_sink_writes_on_commit(django_capture_on_commit_callbacks):
+    sink = BufferedAuditSink()
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        sink.write(_build_trail(resource_weergave="ZAAK-1"))
+        sink.write(_build_trail(resource_weergave="ZAAK-2"))
+
+        assert AuditTrail.objects.count() == 0
+
+    # a single flush for the whole transaction
+    assert len(callbacks) == 1
+    assert set(AuditTrail.objects.values_list("resource_weergave", flat=True)) == {
+        "ZAAK-1",
+        "ZAAK-2",
+    }
+    assert set(AuditTrail.objects.values_list("hoofd_object_uuid", flat=True)) == {
+        ZAAK_UUID
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_buffered_sink_discards_rolled_back_savepoints():
+    sink = BufferedAuditSink()
+
+    with transaction.atomic():
+        sink.write(_build_trail(resource_weergave="ZAAK-1"))
+        try:
+            with transaction.atomic():
+                sink.write(_build_trail(resource_weergave="ZAAK-2"))
+                raise RuntimeError("rollback")
+        except RuntimeError:
+            pass
+
+        with transaction.atomic():
+            sink.write(_build_trail(resource_weergave="ZAAK-3"))
+        sink.write(_build_trail(resource_weergave="ZAAK-4"))
+
+    assert set(AuditTrail.objects.values_list("resource_weergave", flat=True)) == {
+        "ZAAK-1",
+        "ZAAK-3",
+        "ZAAK-4",
+    }
+
+    with pytest.raises(RuntimeError), transaction.atomic():
+        sink.write(_build_trail(resource_weergave="ZAAK-5"))
+        raise RuntimeError("rollback")
+
+    # a buffer of a rolled back transaction is not reused
+    with transaction.atomic():
+        sink.write(_build_trail(resource_weergave="ZAAK-6"))
+
+    assert AuditTrail.objects.filter(resource_weergave="ZAAK-5").count() == 0
+    assert AuditTrail.objects.filter(resource_weergave="ZAAK-6").count() == 1
+
+
+def test_get_audit_sink():
+    assert isinstance(get_audit_sink(), DirectAuditSink)
+
+    with override_settings(
+        COMMONGROUND_API_COMMON={
+            "AUDITTRAIL_SINK": "vng_api_common.audittrails.sinks.BufferedAuditSink"
+        }
+    ):
+        assert isinstance(get_audit_sink(), BufferedAuditSink)
+
+
+@pytest.mark.django_db
+def test_outbox_sink_and_processing():
+    with freeze_time("2026-01-01T12:00:00Z"):
+        OutboxAuditSink().write(_build_trail())
+
+    assert AuditTrailOutbox.objects.count() == 1
+    assert AuditTrail.objects.count() == 0
+
+    call_command("process_audittrail_outbox", batch_size=10)
+
+    assert AuditTrailOutbox.objects.count() == 0
+    trail = AuditTrail.objects.get()
+    assert trail.resource_weergave == "ZAAK-1"
+    assert trail.hoofd_object_uuid == ZAAK_UUID
+    assert trail.nieuw == {"url": "http://testserver/api/v1/zaken/1"}
+    assert trail.aanmaakdatum == datetime.datetime(
+        2026, 1, 1, 12, 0, tzinfo=datetime.timezone.utc
+    )
@@ -0,0 +1,156 @@
+import uuid
+
+from django.test import override_settings
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from vng_api_common.audittrails.models import AuditTrail, AuditTrailPurge
+from vng_api_common.audittrails.viewsets import AuditTrailViewSet
+from vng_api_common.pagination import DynamicCursorPagination
+
+
+class ZaakAuditTrailViewSet(AuditTrailViewSet):
+    main_resource_lookup_field = "zaak_uuid"
+    permission_classes = ()
+
+
+def _create_trail(zaak_uuid: uuid.UUID) -> AuditTrail:
+    url = f"http://testserver/api/v1/zaken/{zaak_uuid}"
+    return AuditTrail.objects.create(
+        bron="ZRC",
+        actie="create",
+        resultaat=201,
+        hoofd_object=url,
+        resource="zaak",
+        resource_url=url,
+        resource_weergave="ZAAK-1",
+    )
+
+
+def test_get_hoofd_object_uuid():
+    zaak_uuid = "e0c464e4-727c-41ef-948d-e3109ae870f4"
+
+    assert (
+        AuditTrail.get_hoofd_object_uuid(f"http://testserver/zaken/{zaak_uuid}/")
+        == zaak_uuid
+    )
+    assert AuditTrail.get_hoofd_object_uuid("http://testserver/zaken/1") is None
+
+
+@pytest.mark.django_db
+def test_save_sets_hoofd_object_uuid():
+    zaak_uuid = uuid.uuid4()
+
+    trail = _create_trail(zaak_uuid)
+
+    trail.refresh_from_db()
+    assert trail.hoofd_object_uuid == zaak_uuid
+
+
+@pytest.mark.django_db
+def test_list_filters_on_hoofd_object_uuid():
+    zaak_uuid = uuid.uuid4()
+    trail = _create_trail(zaak_uuid)
+    _create_trail(uuid.uuid4())
+    view = ZaakAuditTrailViewSet.as_view({"get": "list"})
+    request = APIRequestFactory().get(f"/zaken/{zaak_uuid}/audittrail")
+
+    response = view(request, zaak_uuid=str(zaak_uuid))
+
+    assert response.status_code == 200
+    assert [item["uuid"] for item in response.data] == [str(trail.uuid)]
+
+
+@pytest.mark.django_db
+def test_list_unknown_main_object_404():
+    _create_trail(uuid.uuid4())
+    view = ZaakAuditTrailViewSet.as_view({"get": "list"})
+    zaak_uuid = uuid.uuid4()
+    request = APIRequestFactory().get(f"/zaken/{zaak_uuid}/audittrail")
+
+    response = view(request, zaak_uuid=str(zaak_uuid))
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_list_cursor_paginated():
+    class PaginatedZaakAuditTrailViewSet(ZaakAuditTrailViewSet):
+        pagination_class = DynamicCursorPagination
+
+    zaak_uuid = uuid.uuid4()
+    trails = [_create_trail(zaak_uuid) for _ in range(3)]
+    view = PaginatedZaakAuditTrailViewSet.as_view({"get": "list"})
+    request = APIRequestFactory().get(f"/zaken/{zaak_uuid}/audittrail", {"pageSize": 2})
+
+    response = view(request, zaak_uuid=str(zaak_uuid))
+
+    assert response.status_code == 200
+    assert [item["uuid"] for item in response.data["results"]] == [
+        str(trail.uuid) for trail in trails[:2]
+    ]
+    assert response.data["next"] is not None
+
+
+@pytest.mark.django_db
+def test_list_cursor_past_the_end():
+    class PaginatedZaakAuditTrailViewSet(ZaakAuditTrailViewSet):
+        pagination_class = DynamicCursorPagination
+
+    zaak_uuid = uuid.uuid4()
+    _, last_trail = _create_trail(zaak_uuid), _create_trail(zaak_uuid)
+    view = PaginatedZaakAuditTrailViewSet.as_view({"get": "list"})
+    request = APIRequestFactory().get(f"/zaken/{zaak_uuid}/audittrail", {"pageSize": 1})
+    response = view(request, zaak_uuid=str(zaak_uuid))
+    last_trail.delete()
+    next_request = APIRequestFactory().get(response.data["next"])
+
+    response = view(next_request, zaak_uuid=str(zaak_uuid))
+
+    assert response.status_code == 200
+    assert response.data["results"] == []
+
+
+@pytest.mark.django_db
+@override_settings(COMMONGROUND_API_COMMON={"AUDITTRAIL_DEFERRED_PURGE": True})
+def test_list_purged_main_object():
+    class PaginatedZaakAuditTrailViewSet(ZaakAuditTrailViewSet):
+        pagination_class = DynamicCursorPagination
+
+    zaak_uuid = uuid.uuid4()
+    trail = _create_trail(zaak_uuid)
+    _create_trail(zaak_uuid)
+    AuditTrailPurge.objects.create(
+        hoofd_object=trail.hoofd_object, hoofd_object_uuid=zaak_uuid
+    )
+    view = PaginatedZaakAuditTrailViewSet.as_view({"get": "list"})
+    request = APIRequestFactory().get(f"/zaken/{zaak_uuid}/audittrail", {"pageSize": 1})
+
+    # the records are listed until they are purged
+    response = view(request, zaak_uuid=str(zaak_uuid))
+    assert response.status_code == 200
+
+    # a partial purge removed the records of the next page
+    AuditTrail.objects.exclude(pk=trail.pk).delete()
+    next_request = APIRequestFactory().get(response.data["next"])
+    response = view(next_request, zaak_uuid=str(zaak_uuid))
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_list_filters_on_aanmaakdatum():
+    zaak_uuid = uuid.uuid4()
+    old, recent = _create_trail(zaak_uuid), _create_trail(zaak_uuid)
+    AuditTrail.objects.filter(pk=old.pk).update(aanmaakdatum="2026-01-15T12:00:00Z")
+    AuditTrail.objects.filter(pk=recent.pk).update(aanmaakdatum="2026-03-15T12:00:00Z")
+    view = ZaakAuditTrailViewSet.as_view({"get": "list"})
+    request = APIRequestFactory().get(
+        f"/zaken/{zaak_uuid}/audittrail",
+        {"aanmaakdatum__gte": "2026-02-01T00:00:00Z"},
+    )
+
+    response = view(request, zaak_uuid=str(zaak_uuid))
+
+    assert response.status_code == 200
+    assert [item["uuid"] for item in response.data] == [str(recent.uuid)]
@@ -0,0 +1,68 @@
+import io
+import json
+from collections import OrderedDict
+
+from django.http import QueryDict
+from django.utils.datastructures import MultiValueDict
+from django.utils.translation import gettext_lazy as _
+
+import pytest
+from djangorestframework_camel_case import util
+
+from vng_api_common.camelize import camelize, underscoreize
+from vng_api_common.parsers import CamelCaseJSONParser
+from vng_api_common.renderers import CamelCaseJSONRenderer
+
+DATA = {
+    "snake_case": 1,
+    "nested_value": OrderedDict(
+        [("some_list", [{"a_b": 1}, "plain_string"]), ("key_1", None)]
+    ),
+    "with_tuple": ({"in_tuple": True},),
+    _("lazy_key"): _("lazy_value"),
+    1: "int_key",
+    "a_1_b": 2,
+}
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"ignore_fields": ["nested_value"]},
+        {"ignore_keys": ["snake_case"]},
+    ],
+)
+def test_camelize_matches_library(options):
+    assert camelize(DATA, **options) == util.camelize(DATA, **options)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"camelCase": {"nestedKey": [{"aB": 1}]}, "key1": 2, "HTTPHeader": 3},
+        QueryDict("someParam=1&someParam=2&other=3"),
+        MultiValueDict({"fileField": ["a", "b"]}),
+    ],
+)
+@pytest.mark.parametrize(
+    "options", [{}, {"no_underscore_before_number": True}, {"ignore_keys": ["key1"]}]
+)
+def test_underscoreize_matches_library(data, options):
+    result = underscoreize(data, **options)
+    expected = util.underscoreize(data, **options)
+
+    assert type(result) is type(expected)
+    if isinstance(expected, MultiValueDict):
+        assert dict(result.lists()) == dict(expected.lists())
+    else:
+        assert result == expected
+
+
+def test_renderer_and_parser_round_trip():
+    rendered = CamelCaseJSONRenderer().render({"some_field": {"other_field": 1}})
+
+    assert json.loads(rendered) == {"someField": {"otherField": 1}}
+    assert CamelCaseJSONParser().parse(io.BytesIO(rendered)) == {
+        "some_field": {"other_field": 1}
+    }
@@ -0,0 +1,200 @@
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import override_settings
+
+import pytest
+import requests_mock
+from zgw_consumers.constants import AuthTypes
+from zgw_consumers.models import Service
+from zgw_consumers.test.factories import ServiceFactory
+
+from vng_api_common.client import get_auth_headers, get_client
+from vng_api_common.client_registry import (
+    ClientRegistry,
+    PooledClient,
+    ServiceIndex,
+    clear_registry,
+    normalize_url,
+    registry,
+)
+
+ZRC_ROOT = "https://zrc.example.com/api/v1/"
+
+
+@pytest.fixture
+def clean_registry():
+    clear_registry()
+    yield registry
+    clear_registry()
+
+
+def test_service_index_resolves_longest_prefix():
+    zrc = Service(api_root=ZRC_ROOT)
+    zrc_v2 = Service(api_root="https://zrc.example.com/api/v2/")
+    root = Service(api_root="https://zrc.example.com/")
+    index = ServiceIndex([root, zrc, zrc_v2])
+
+    assert index.resolve(f"{ZRC_ROOT}zaken/1") is zrc
+    assert index.resolve("https://zrc.example.com/api/v2/zaken/1") is zrc_v2
+    assert index.resolve("https://zrc.example.com/other/1") is root
+    assert index.resolve("https://drc.example.com/api/v1/") is None
+    assert index.resolve("https://zrc.example.com") is None
+
+
+def test_service_index_normalizes_urls():
+    zrc = Service(api_root="HTTPS://ZRC.example.com:443/api/v1/")
+    index = ServiceIndex([zrc])
+
+    assert index.resolve(f"{ZRC_ROOT}zaken/1") is zrc
+    assert index.resolve("https://zrc.EXAMPLE.com/api/v1/zaken/1") is zrc
+    assert index.resolve("https://zrc.example.com:8443/api/v1/zaken/1") is None
+    assert index.resolve("https://zrc.example.com/API/v1/zaken/1") is None
+
+
+@pytest.mark.parametrize(
+    "url,normalized",
+    [
+        ("HTTPS://Zrc.Example.com/api/v1/", "https://zrc.example.com/api/v1/"),
+        ("http://zrc.example.com:80/api/", "http://zrc.example.com/api/"),
+        ("https://zrc.example.com:8000/api/", "https://zrc.example.com:8000/api/"),
+        ("https://zrc.example.com/a?b=1", "https://zrc.example.com/a?b=1"),
+    ],
+)
+def test_normalize_url(url, normalized):
+    assert normalize_url(url) == normalized
+
+
+def test_pooled_client_keeps_session_open():
+    client = PooledClient(ZRC_ROOT)
+
+    with (
+        patch.object(client, "close") as close,
+        requests_mock.Mocker() as m,
+    ):
+        m.get(f"{ZRC_ROOT}zaken", json=[])
+        with client:
+            client.get("zaken")
+        client.get("zaken")
+
+    close.assert_not_called()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_client_reuses_client(clean_registry, django_assert_num_queries):
+    service = ServiceFactory.create(api_root=ZRC_ROOT, auth_type=AuthTypes.no_auth)
+
+    client = get_client(f"{ZRC_ROOT}zaken/1")
+    with django_assert_num_queries(0):
+        assert get_client(f"{ZRC_ROOT}zaken/2") is client
+        assert get_client("https://drc.example.com/api/v1/") is None
+
+    assert isinstance(client, PooledClient)
+    assert client.base_url == service.api_root
+    assert get_client(ZRC_ROOT, timeout=1) is not client
+
+
+@pytest.mark.django_db(transaction=True)
+def test_service_change_invalidates_registry(clean_registry):
+    service = ServiceFactory.create(api_root=ZRC_ROOT, auth_type=AuthTypes.no_auth)
+    client = get_client(ZRC_ROOT)
+
+    service.api_root = "https://zrc.example.com/api/v2/"
+    service.save()
+
+    assert get_client(ZRC_ROOT) is None
+    new_client = get_client("https://zrc.example.com/api/v2/")
+    assert new_client is not client
+    assert get_client("https://zrc.example.com/api/v2/") is new_client
+
+    service.delete()
+
+    assert get_client("https://zrc.example.com/api/v2/") is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_uncommitted_changes_bypass_registry(clean_registry):
+    with pytest.raises(RuntimeError), transaction.atomic():
+        ServiceFactory.create(api_root=ZRC_ROOT, auth_type=AuthTypes.no_auth)
+
+        # the transaction reads its own changes, but they are not cached
+        client = get_client(ZRC_ROOT)
+        assert not isinstance(client, PooledClient)
+        assert get_client(ZRC_ROOT) is not client
+        assert clean_registry._index is None
+
+        raise RuntimeError("rollback")
+
+    assert get_client(ZRC_ROOT) is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_registry_is_used_after_commit(clean_registry):
+    with transaction.atomic():
+        service = ServiceFactory.create(api_root=ZRC_ROOT, auth_type=AuthTypes.no_auth)
+        with transaction.atomic():
+            service.save()
+        assert not isinstance(get_client(ZRC_ROOT), PooledClient)
+
+    client = get_client(ZRC_ROOT)
+    assert isinstance(client, PooledClient)
+    assert get_client(ZRC_ROOT) is client
+
+
+@pytest.mark.django_db
+def test_changes_in_test_transaction_bypass_registry(clean_registry):
+    ServiceFactory.create(api_root=ZRC_ROOT, auth_type=AuthTypes.no_auth)
+
+    assert get_client(ZRC_ROOT) is not get_client(ZRC_ROOT)
+
+
+@pytest.mark.django_db
+def test_registry_expires_clients():
+    service = ServiceFactory.create(
+        api_root=ZRC_ROOT,
+        auth_type=AuthTypes.zgw,
+        client_id="client",
+        secret="secret",
+        jwt_valid_for=60,
+    )
+    registry = ClientRegistry()
+    client = registry.get_client(service)
+
+    with patch("vng_api_common.client_registry.time.monotonic") as monotonic:
+        monotonic.return_value = registry._clients[service.pk][1] - 1
+        assert registry.get_client(service) is client
+
+        monotonic.return_value += 2
+        assert registry.get_client(service) is not client
+
+
+@pytest.mark.django_db
+@override_settings(COMMONGROUND_API_COMMON={"CLIENT_REGISTRY_TIMEOUT": 0})
+def test_registry_disabled(clean_registry):
+    ServiceFactory.create(api_root=ZRC_ROOT, auth_type=AuthTypes.no_auth)
+
+    client = get_client(ZRC_ROOT)
+    assert not isinstance(client, PooledClient)
+    assert get_client(ZRC_ROOT) is not client
+
+
+@pytest.mark.django_db
+def test_get_auth_headers(clean_registry):
+    ServiceFactory.create(
+        api_root=ZRC_ROOT,
+        auth_type=AuthTypes.api_key,
+        header_key="X-Api-Key",
+        header_value="secret",
+    )
+    ServiceFactory.create(
+        api_root="https://ztc.example.com/api/v1/",
+        auth_type=AuthTypes.zgw,
+        client_id="client",
+        secret="secret",
+    )
+
+    assert get_auth_headers(f"{ZRC_ROOT}zaken/1") == {"X-Api-Key": "secret"}
+    assert get_auth_headers("https://ztc.example.com/api/v1/zaaktypen/1")[
+        "Authorization"
+    ].startswith("Bearer ")
+    assert get_auth_headers("https://drc.example.com/api/v1/") == {}
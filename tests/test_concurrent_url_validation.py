@@ -0,0 +1,165 @@
+import threading
+from unittest.mock import Mock
+
+from django.test import override_settings
+
+import pytest
+from rest_framework import serializers
+
+from vng_api_common.serializers import (
+    ConcurrentURLValidationListSerializer,
+    ConcurrentURLValidationMixin,
+    get_url_validations,
+)
+from vng_api_common.validators import URLValidator, prefetch_urls
+
+ZTC_ROOT = "https://ztc.example.com/api/v1/"
+FETCHER = "tests.test_concurrent_url_validation.fetch"
+
+fetched: list[str] = []
+barrier: threading.Barrier | None = None
+
+
+def fetch(url: str, **kwargs):
+    fetched.append(url)
+    # every fetch waits for the others, so this only succeeds concurrently
+    if barrier is not None:
+        barrier.wait(timeout=5)
+    if url.endswith("/error"):
+        raise ConnectionError("connection refused")
+    return Mock(status_code=404 if url.endswith("/404") else 200)
+
+
+@pytest.fixture
+def fetches():
+    global barrier
+    fetched.clear()
+    yield fetched
+    barrier = None
+
+
+def expect_concurrent_fetches(count: int) -> None:
+    global barrier
+    barrier = threading.Barrier(count)
+
+
+class InformatieObjectSerializer(serializers.Serializer):
+    informatieobjecttype = serializers.URLField(validators=[URLValidator()])
+
+
+class RelatedSerializer(serializers.Serializer):
+    url = serializers.URLField(validators=[URLValidator()])
+
+    class Meta:
+        list_serializer_class = ConcurrentURLValidationListSerializer
+
+
+class ZaakSerializer(ConcurrentURLValidationMixin, serializers.Serializer):
+    zaaktype = serializers.URLField(validators=[URLValidator()])
+    informatieobjecten = InformatieObjectSerializer(many=True, required=False)
+    relevante_andere_zaken = serializers.ListField(
+        child=serializers.URLField(validators=[URLValidator()]), required=False
+    )
+    omschrijving = serializers.CharField(required=False)
+
+
+def test_get_url_validations():
+    data = {
+        "zaaktype": f" {ZTC_ROOT}zaaktypen/1 ",
+        "informatieobjecten": [
+            {"informatieobjecttype": f"{ZTC_ROOT}informatieobjecttypen/1"},
+            {"informatieobjecttype": None},
+        ],
+        "relevante_andere_zaken": ["https://zrc.example.com/zaken/1"],
+        "omschrijving": "https://example.com",
+    }
+
+    validations = get_url_validations(ZaakSerializer(), data)
+
+    assert [url for _, url in validations] == [
+        f"{ZTC_ROOT}zaaktypen/1",
+        f"{ZTC_ROOT}informatieobjecttypen/1",
+        "https://zrc.example.com/zaken/1",
+    ]
+    assert all(isinstance(validator, URLValidator) for validator, _ in validations)
+
+
+@override_settings(LINK_FETCHER=FETCHER)
+def test_urls_are_fetched_concurrently(fetches):
+    expect_concurrent_fetches(4)
+    serializer = ZaakSerializer(
+        data={
+            "zaaktype": f"{ZTC_ROOT}zaaktypen/1",
+            "informatieobjecten": [
+                {"informatieobjecttype": f"{ZTC_ROOT}informatieobjecttypen/1"},
+                {"informatieobjecttype": f"{ZTC_ROOT}informatieobjecttypen/2"},
+                # fetched once
+                {"informatieobjecttype": f"{ZTC_ROOT}informatieobjecttypen/2"},
+            ],
+            "relevante_andere_zaken": ["https://zrc.example.com/zaken/1"],
+        }
+    )
+
+    assert serializer.is_valid(), serializer.errors
+    assert len(fetches) == 4
+
+
+@override_settings(LINK_FETCHER=FETCHER)
+def test_errors_are_reported_per_field(fetches):
+    expect_concurrent_fetches(3)
+    serializer = ZaakSerializer(
+        data={
+            "zaaktype": f"{ZTC_ROOT}zaaktypen/404",
+            "informatieobjecten": [
+                {"informatieobjecttype": f"{ZTC_ROOT}informatieobjecttypen/1"},
+                {"informatieobjecttype": f"{ZTC_ROOT}informatieobjecttypen/error"},
+            ],
+        }
+    )
+
+    assert not serializer.is_valid()
+    assert serializer.errors["zaaktype"][0].code == "bad-url"
+    assert "HTTP 404" in serializer.errors["zaaktype"][0]
+    errors = serializer.errors["informatieobjecten"]
+    assert list(errors) == [1]
+    assert errors[1]["informatieobjecttype"][0].code == "bad-url"
+    assert "connection refused" in errors[1]["informatieobjecttype"][0]
+
+
+@override_settings(LINK_FETCHER=FETCHER)
+def test_many_serializer(fetches):
+    expect_concurrent_fetches(3)
+    serializer = RelatedSerializer(
+        data=[{"url": f"https://zrc.example.com/zaken/{index}"} for index in range(3)],
+        many=True,
+    )
+
+    assert isinstance(serializer, ConcurrentURLValidationListSerializer)
+    assert serializer.is_valid(), serializer.errors
+
+
+@override_settings(LINK_FETCHER=FETCHER)
+def test_prefetch_uses_auth_headers(fetches):
+    validator = URLValidator(get_auth=lambda url: {"Authorization": "Bearer token"})
+    other = URLValidator(get_auth=lambda url: {"Authorization": "Bearer other"})
+    url = f"{ZTC_ROOT}zaaktypen/1"
+
+    with prefetch_urls([(validator, url), (other, url)], max_workers=2):
+        validator(url)
+        other(url)
+
+    # a different auth identity is fetched separately
+    assert fetches == [url, url]
+
+
+@override_settings(LINK_FETCHER=FETCHER)
+def test_prefetch_computes_auth_headers_once(fetches):
+    get_auth = Mock(return_value={"Authorization": "Bearer token"})
+    validator = URLValidator(get_auth=get_auth)
+    url = f"{ZTC_ROOT}zaaktypen/1"
+
+    with prefetch_urls([(validator, url)], max_workers=1):
+        validator(url)
+
+    get_auth.assert_called_once_with(url)
+    assert fetches == [url]
@@ -1,10 +1,18 @@
 from django.core.exceptions import ValidationError
+from django.db.models.sql.where import NothingNode
 
 import pytest
 
-from testapp.models import Person
+from testapp.models import Group, Person
 from vng_api_common.constants import FILTER_URL_DID_NOT_RESOLVE
-from vng_api_common.filters import URLModelChoiceField
+from vng_api_common.filters import (
+    ResolvedURL,
+    URLModelChoiceField,
+    URLModelChoiceFilter,
+    URLModelMultipleChoiceField,
+    URLModelMultipleChoiceFilter,
+)
+from vng_api_common.filtersets import FilterSet
 from vng_api_common.utils import NotAViewSet
 
 
@@ -26,3 +34,162 @@ def test_filter_field_to_python_invalid_url_raises_error():
         field.to_python("thisisnotaurl")
 
     assert exc.value.code == "invalid"
+
+
+class PersonFilterSet(FilterSet):
+    class Meta:
+        model = Person
+        fields = {"group": ["exact", "in"]}
+
+
+def test_filterset_uses_multiple_choice_filter_for_in_lookup():
+    filterset = PersonFilterSet()
+
+    assert isinstance(filterset.filters["group__in"], URLModelMultipleChoiceFilter)
+
+
+def test_multiple_choice_field_resolves_without_queries():
+    field = URLModelMultipleChoiceField(queryset=Group.objects.all())
+
+    resolved = field.to_python("http://testserver.com/api/groups/1")
+
+    assert isinstance(resolved, ResolvedURL)
+    assert resolved.value == "1"
+
+
+def test_multiple_choice_field_invalid_type():
+    field = URLModelMultipleChoiceField(queryset=Group.objects.all())
+
+    with pytest.raises(ValidationError) as exc:
+        field.to_python("http://testserver.com/api/hobbies/1")
+
+    assert exc.value.code == "invalid-type"
+
+
+def test_multiple_choice_filter_single_in_lookup(rf):
+    request = rf.get("/api/persons", HTTP_HOST="testserver.com")
+    filterset = PersonFilterSet(
+        data={
+            "group__in": (
+                "http://testserver.com/api/groups/1,"
+                "http://testserver.com/api/groups/2,"
+                "https://example.com/api/groups/3"
+            )
+        },
+        queryset=Person.objects.all(),
+        request=request,
+    )
+
+    query = str(filterset.qs.query)
+
+    assert '"testapp_person"."group_id" IN (1, 2)' in query
+    assert "testapp_group" not in query
+
+
+def test_multiple_choice_filter_no_resolved_urls(rf):
+    request = rf.get("/api/persons", HTTP_HOST="testserver.com")
+    filterset = PersonFilterSet(
+        data={"group__in": "https://example.com/api/groups/1"},
+        queryset=Person.objects.all(),
+        request=request,
+    )
+
+    assert filterset.is_valid()
+    assert isinstance(filterset.qs.query.where.children[0], NothingNode)
+
+
+def test_multiple_choice_filter_invalid_type(rf):
+    request = rf.get("/api/persons", HTTP_HOST="testserver.com")
+    filterset = PersonFilterSet(
+        data={"group__in": "http://testserver.com/api/hobbies/1"},
+        queryset=Person.objects.all(),
+        request=request,
+    )
+
+    assert not filterset.is_valid()
+    assert "group__in" in filterset.errors
+
+
+@pytest.mark.django_db
+def test_multiple_choice_filter_results(rf, django_assert_num_queries):
+    group1, group2, group3 = Group.objects.bulk_create(
+        [Group(name="one"), Group(name="two"), Group(name="three")]
+    )
+    person1 = Person.objects.create(name="a", group=group1)
+    person2 = Person.objects.create(name="b", group=group2)
+    Person.objects.create(name="c", group=group3)
+    request = rf.get("/api/persons", HTTP_HOST="testserver.com")
+    filterset = PersonFilterSet(
+        data={
+            "group__in": (
+                f"http://testserver.com/api/groups/{group1.pk},"
+                f"http://testserver.com/api/groups/{group2.pk}"
+            )
+        },
+        queryset=Person.objects.order_by("pk"),
+        request=request,
+    )
+
+    with django_assert_num_queries(1):
+        results = list(filterset.qs)
+
+    assert results == [person1, person2]
+
+
+def test_choice_filter_join_lookup(rf):
+    request = rf.get("/api/persons", HTTP_HOST="testserver.com")
+    filterset = PersonFilterSet(
+        data={"group": "http://testserver.com/api/groups/1"},
+        queryset=Person.objects.all(),
+        request=request,
+    )
+
+    query = str(filterset.qs.query)
+
+    assert query.endswith('WHERE "testapp_person"."group_id" = 1')
+
+
+class SameGroupFilterSet(FilterSet):
+    same_group_as = URLModelChoiceFilter(
+        field_name="group",
+        queryset=Group.objects.all(),
+        instance_path="group",
+    )
+
+    class Meta:
+        model = Person
+        fields = ("same_group_as",)
+
+
+def test_choice_filter_instance_path_lookup(rf):
+    request = rf.get("/api/persons", HTTP_HOST="testserver.com")
+    filterset = SameGroupFilterSet(
+        data={"same_group_as": "http://testserver.com/api/persons/1"},
+        queryset=Person.objects.all(),
+        request=request,
+    )
+
+    query = str(filterset.qs.query)
+
+    assert (
+        '"testapp_person"."group_id" IN (SELECT U0."group_id" AS "group" '
+        'FROM "testapp_person" U0 WHERE U0."id" IN (1))'
+    ) in query
+
+
+@pytest.mark.django_db
+def test_choice_filter_results(rf, django_assert_num_queries):
+    group1, group2 = Group.objects.bulk_create([Group(name="one"), Group(name="two")])
+    person = Person.objects.create(name="a", group=group1)
+    Person.objects.create(name="b", group=group2)
+    request = rf.get("/api/persons", HTTP_HOST="testserver.com")
+    filterset = PersonFilterSet(
+        data={"group": f"http://testserver.com/api/groups/{group1.pk}"},
+        queryset=Person.objects.all(),
+        request=request,
+    )
+
+    with django_assert_num_queries(1):
+        results = list(filterset.qs)
+
+    assert results == [person]
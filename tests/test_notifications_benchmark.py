@@ -0,0 +1,80 @@
+import pytest
+from notifications_api_common.api.serializers import NotificatieSerializer
+
+from testapp.notifications_benchmark import (
+    HANDLERS,
+    ACStubClient,
+    BenchmarkResult,
+    benchmark_environment,
+    generate_notifications,
+    run_test_client,
+)
+from vng_api_common.authorizations.models import Applicatie
+from vng_api_common.camelize import underscoreize
+from vng_api_common.models import JWTSecret
+from vng_api_common.notifications.api import views
+from vng_api_common.tests.auth import generate_jwt_auth
+
+
+@pytest.mark.parametrize("handler", list(HANDLERS))
+def test_generated_notifications_are_valid(handler):
+    _, kanalen = HANDLERS[handler]
+
+    notifications = generate_notifications(20, kanalen, seed=1)
+
+    for notification in notifications:
+        serializer = NotificatieSerializer(data=underscoreize(notification))
+        assert serializer.is_valid(), serializer.errors
+    assert {notification["kanaal"] for notification in notifications} == set(kanalen)
+
+
+def test_benchmark_result():
+    result = BenchmarkResult(
+        requests=100,
+        errors=0,
+        duration=2.0,
+        latencies=[index / 1000 for index in range(1, 101)],
+    )
+
+    assert result.throughput == 50
+    assert result.percentile(50) == pytest.approx(0.0505)
+    assert result.percentile(99) == pytest.approx(0.09901)
+    assert result.as_dict()["max"] == 0.1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("handler", list(HANDLERS))
+def test_run_test_client(handler):
+    JWTSecret.objects.create(identifier="benchmark", secret="secret")
+    Applicatie.objects.create(
+        client_ids=["benchmark"], label="Benchmark", heeft_alle_autorisaties=True
+    )
+    _, kanalen = HANDLERS[handler]
+    notifications = generate_notifications(10, kanalen, seed=1)
+
+    with benchmark_environment(handler):
+        result = run_test_client(
+            notifications, generate_jwt_auth("benchmark", "secret")
+        )
+
+    assert result.requests == 10
+    assert result.errors == 0
+
+
+def test_ac_stub_client():
+    url = (
+        "https://ac.example.com/api/v1/applicaties/5a8f1bd4-7a8e-4a2f-9b1c-2f3d4e5f6a7b"
+    )
+
+    data = ACStubClient().get(url).json()
+
+    assert data["url"] == url
+    assert data["label"] == "Applicatie 5a8f1bd4-7a8e-4a2f-9b1c-2f3d4e5f6a7b"
+
+
+def test_benchmark_environment_builds_handler_per_run():
+    with benchmark_environment("routed"):
+        handler = views.get_notifications_handler()
+
+    with benchmark_environment("routed"):
+        assert views.get_notifications_handler() is not handler
@@ -0,0 +1,133 @@
+import uuid
+
+import pytest
+import requests_mock
+from zgw_consumers.constants import AuthTypes
+from zgw_consumers.test.factories import ServiceFactory
+
+from vng_api_common.authorizations.models import Applicatie
+from vng_api_common.authorizations.signals import applicaties_synchronized
+from vng_api_common.client import ClientError
+from vng_api_common.notifications.handlers import AuthHandler, RoutingHandler
+
+AC_ROOT = "https://ac.example.com/api/v1/"
+
+
+def _message(applicatie_uuid, actie: str = "update") -> dict:
+    url = f"{AC_ROOT}applicaties/{applicatie_uuid}"
+    return {
+        "kanaal": "autorisaties",
+        "hoofd_object": url,
+        "resource": "applicatie",
+        "resource_url": url,
+        "actie": actie,
+        "kenmerken": {},
+    }
+
+
+@pytest.mark.django_db
+def test_auth_handler_applies_batch(django_capture_on_commit_callbacks):
+    ServiceFactory.create(api_root=AC_ROOT, auth_type=AuthTypes.no_auth)
+    updated, destroyed = uuid.uuid4(), uuid.uuid4()
+    Applicatie.objects.create(uuid=destroyed, client_ids=["old"], label="Old")
+    received = []
+
+    def receiver(sender, uuids, **kwargs):
+        received.append(uuids)
+
+    applicaties_synchronized.connect(receiver)
+    try:
+        with (
+            requests_mock.Mocker() as m,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            m.get(
+                f"{AC_ROOT}applicaties/{updated}",
+                json={
+                    "url": f"{AC_ROOT}applicaties/{updated}",
+                    "clientIds": ["client"],
+                    "label": "Client",
+                    "heeftAlleAutorisaties": True,
+                    "autorisaties": [],
+                },
+            )
+
+            errors = AuthHandler().handle_batch(
+                [
+                    _message(updated, actie="create"),
+                    _message(updated),
+                    _message(destroyed, actie="destroy"),
+                ]
+            )
+    finally:
+        applicaties_synchronized.disconnect(receiver)
+
+    assert errors == [None, None, None]
+    assert m.call_count == 1
+    assert list(Applicatie.objects.values_list("uuid", "label")) == [
+        (updated, "Client")
+    ]
+    assert received == [[str(updated), str(destroyed)]]
+
+
+@pytest.mark.django_db
+def test_auth_handler_reports_errors_per_message():
+    ServiceFactory.create(api_root=AC_ROOT, auth_type=AuthTypes.no_auth)
+    found, missing = uuid.uuid4(), uuid.uuid4()
+
+    with requests_mock.Mocker() as m:
+        m.get(
+            f"{AC_ROOT}applicaties/{found}",
+            json={
+                "url": f"{AC_ROOT}applicaties/{found}",
+                "clientIds": ["client"],
+                "label": "Client",
+                "heeftAlleAutorisaties": True,
+                "autorisaties": [],
+            },
+        )
+        m.get(f"{AC_ROOT}applicaties/{missing}", status_code=404, json={})
+
+        errors = AuthHandler().handle_batch(
+            [_message(missing, actie="create"), _message(found), _message(missing)]
+        )
+        with pytest.raises(ClientError):
+            AuthHandler().handle(_message(missing))
+
+    assert isinstance(errors[0], ClientError)
+    assert errors[1] is None
+    assert errors[2] is errors[0]
+    assert list(Applicatie.objects.values_list("uuid", flat=True)) == [found]
+
+
+class BatchHandler:
+    def __init__(self):
+        self.batches = []
+
+    def handle(self, message: dict) -> None:
+        raise AssertionError("expected a batch")
+
+    def handle_batch(self, messages):
+        self.batches.append(list(messages))
+        return [None] * len(messages)
+
+
+class FailingHandler:
+    def handle(self, message: dict) -> None:
+        raise RuntimeError("handler failed")
+
+
+@pytest.mark.django_db
+def test_routing_handler_passes_batches_to_routes():
+    batch_handler = BatchHandler()
+    router = RoutingHandler({"autorisaties": batch_handler, "zaken": FailingHandler()})
+    auth1, auth2 = _message(uuid.uuid4()), _message(uuid.uuid4())
+    zaak = {**auth1, "kanaal": "zaken"}
+
+    errors = router.handle_batch([auth1, zaak, auth2])
+
+    assert batch_handler.batches == [[auth1, auth2]]
+    assert errors[0] is None and errors[2] is None
+    assert isinstance(errors[1], RuntimeError)
+    assert router.metrics["autorisaties:*:*"]["succeeded"] == 2
+    assert router.metrics["zaken:*:*"]["failed"] == 1
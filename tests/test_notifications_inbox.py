@@ -0,0 +1,208 @@
+import datetime
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.utils import timezone
+
+import pytest
+from freezegun import freeze_time
+
+from vng_api_common.notifications.api.views import NotificationView
+from vng_api_common.notifications.constants import InboxStatus
+from vng_api_common.notifications.inbox import (
+    DEFAULT_HANDLER,
+    _import_handler,
+    enqueue_notification,
+    get_idempotency_key,
+    get_notifications_handler,
+    process_inbox,
+)
+from vng_api_common.notifications.models import NotificationInbox
+
+MESSAGE = {
+    "kanaal": "autorisaties",
+    "hoofd_object": "https://ac.example.com/api/v1/applicaties/1",
+    "resource": "applicatie",
+    "resource_url": "https://ac.example.com/api/v1/applicaties/1",
+    "actie": "update",
+    "aanmaakdatum": datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.UTC),
+    "kenmerken": {},
+}
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.messages = []
+        self.fail = False
+
+    def handle(self, message: dict) -> None:
+        if self.fail:
+            raise RuntimeError("handler failed")
+        self.messages.append(message)
+
+
+handler = RecordingHandler()
+
+
+@pytest.fixture
+def recording_handler(settings):
+    settings.DEFAULT_NOTIFICATIONS_HANDLER = "tests.test_notifications_inbox.handler"
+    handler.messages, handler.fail = [], False
+    return handler
+
+
+def test_idempotency_key_is_stable():
+    assert get_idempotency_key(MESSAGE) == get_idempotency_key(dict(MESSAGE))
+    assert get_idempotency_key(MESSAGE) != get_idempotency_key(
+        {**MESSAGE, "actie": "destroy"}
+    )
+
+
+def test_handler_is_imported_once(settings):
+    settings.DEFAULT_NOTIFICATIONS_HANDLER = "tests.test_notifications_inbox.handler"
+    _import_handler.cache_clear()
+
+    with patch(
+        "vng_api_common.notifications.inbox.import_string", return_value=handler
+    ) as mock_import:
+        get_notifications_handler()
+        get_notifications_handler()
+
+    mock_import.assert_called_once_with("tests.test_notifications_inbox.handler")
+
+
+def test_view_handles_synchronously_by_default(recording_handler):
+    NotificationView().handle_notification(MESSAGE)
+
+    assert recording_handler.messages == [MESSAGE]
+
+
+@pytest.mark.django_db
+def test_view_stores_notification_in_inbox(settings, recording_handler):
+    settings.COMMONGROUND_API_COMMON = {"NOTIFICATIONS_INBOX": True}
+
+    NotificationView().handle_notification(MESSAGE)
+
+    assert recording_handler.messages == []
+    entry = NotificationInbox.objects.get()
+    assert entry.status == InboxStatus.pending
+    assert entry.idempotency_key == get_idempotency_key(MESSAGE)
+
+
+@pytest.mark.django_db
+def test_redelivered_notification_is_ignored():
+    assert enqueue_notification(MESSAGE)
+    assert not enqueue_notification(dict(MESSAGE))
+
+    assert NotificationInbox.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_process_inbox(recording_handler):
+    enqueue_notification(MESSAGE)
+
+    handled, failed = process_inbox()
+
+    assert (handled, failed) == (1, 0)
+    assert recording_handler.messages[0]["aanmaakdatum"] == MESSAGE["aanmaakdatum"]
+    entry = NotificationInbox.objects.get()
+    assert entry.status == InboxStatus.processed
+    assert entry.attempts == 1
+
+
+@pytest.mark.django_db
+def test_process_inbox_retries_with_backoff(recording_handler):
+    recording_handler.fail = True
+
+    with freeze_time("2024-01-01T12:00:00Z"):
+        enqueue_notification(MESSAGE)
+        assert process_inbox(backoff=10) == (0, 1)
+        # not due yet
+        assert process_inbox(backoff=10) == (0, 0)
+
+    entry = NotificationInbox.objects.get()
+    assert entry.status == InboxStatus.pending
+    assert entry.available_at == datetime.datetime(
+        2024, 1, 1, 12, 0, 10, tzinfo=datetime.UTC
+    )
+    assert "handler failed" in entry.last_error
+
+    with freeze_time("2024-01-01T12:00:10Z"):
+        assert process_inbox(backoff=10) == (0, 1)
+
+    entry.refresh_from_db()
+    assert entry.attempts == 2
+    assert entry.available_at == datetime.datetime(
+        2024, 1, 1, 12, 0, 30, tzinfo=datetime.UTC
+    )
+
+
+@pytest.mark.django_db
+def test_process_inbox_gives_up_after_max_attempts(recording_handler):
+    recording_handler.fail = True
+    enqueue_notification(MESSAGE)
+
+    assert process_inbox(max_attempts=2, backoff=0) == (0, 1)
+    assert process_inbox(max_attempts=2, backoff=0) == (0, 1)
+    assert process_inbox(max_attempts=2, backoff=0) == (0, 0)
+
+    assert NotificationInbox.objects.get().status == InboxStatus.failed
+
+
+@pytest.mark.django_db
+def test_process_notifications_command(recording_handler):
+    enqueue_notification(MESSAGE)
+    enqueue_notification({**MESSAGE, "actie": "destroy"})
+    NotificationInbox.objects.create(
+        idempotency_key="old",
+        message=MESSAGE,
+        status=InboxStatus.processed,
+        processed=timezone.now() - datetime.timedelta(days=8),
+    )
+
+    call_command("process_notifications", batch_size=1)
+
+    assert len(recording_handler.messages) == 2
+    assert not NotificationInbox.objects.filter(idempotency_key="old").exists()
+
+
+@pytest.mark.django_db
+def test_process_inbox_coalesces_applicatie_notifications(settings):
+    settings.DEFAULT_NOTIFICATIONS_HANDLER = DEFAULT_HANDLER
+    applicatie_url = "https://ac.example.com/api/v1/applicaties/1"
+    enqueue_notification({**MESSAGE, "actie": "create"})
+    enqueue_notification(MESSAGE)
+
+    with patch(
+        "vng_api_common.notifications.handlers.AuthHandler.handle_batch",
+        return_value=[None, None],
+    ) as mock_handle_batch:
+        assert process_inbox() == (2, 0)
+
+    (messages,) = mock_handle_batch.call_args.args
+    assert [message["actie"] for message in messages] == ["create", "update"]
+    assert [message["resource_url"] for message in messages] == [applicatie_url] * 2
+    assert set(NotificationInbox.objects.values_list("status", flat=True)) == {
+        InboxStatus.processed
+    }
+
+
+@pytest.mark.django_db
+def test_process_inbox_records_failures_per_notification(settings):
+    settings.DEFAULT_NOTIFICATIONS_HANDLER = DEFAULT_HANDLER
+    enqueue_notification(MESSAGE)
+    enqueue_notification({**MESSAGE, "resource_url": f"{MESSAGE['resource_url']}2"})
+
+    with patch(
+        "vng_api_common.notifications.handlers.AuthHandler.handle_batch",
+        return_value=[None, RuntimeError("not found")],
+    ):
+        assert process_inbox(backoff=0) == (1, 1)
+
+    statuses = dict(
+        NotificationInbox.objects.values_list("message__resource_url", "status")
+    )
+    assert statuses == {
+        MESSAGE["resource_url"]: InboxStatus.processed,
+        f"{MESSAGE['resource_url']}2": InboxStatus.pending,
+    }
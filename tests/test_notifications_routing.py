@@ -0,0 +1,180 @@
+import pytest
+from rest_framework.test import APIClient
+
+from vng_api_common.authorizations.models import Applicatie
+from vng_api_common.models import JWTSecret
+from vng_api_common.notifications.handlers import RoutingHandler
+from vng_api_common.notifications.routing import (
+    QueuedExecutor,
+    Route,
+    ThreadPoolRouteExecutor,
+)
+from vng_api_common.tests.auth import generate_jwt_auth
+
+
+def _message(**kwargs) -> dict:
+    return {
+        "kanaal": "zaken",
+        "hoofd_object": "https://zrc.example.com/api/v1/zaken/1",
+        "resource": "zaak",
+        "resource_url": "https://zrc.example.com/api/v1/zaken/1",
+        "actie": "create",
+        "kenmerken": {"bronorganisatie": "123456782", "zaaktype": "zt-1"},
+        **kwargs,
+    }
+
+
+class RecordingHandler:
+    def __init__(self, fail: bool = False):
+        self.messages = []
+        self.fail = fail
+
+    def handle(self, message: dict) -> None:
+        self.messages.append(message)
+        if self.fail:
+            raise RuntimeError("handler failed")
+
+
+@pytest.mark.parametrize(
+    "criteria,matches",
+    [
+        ({}, True),
+        ({"kanaal": "zaken"}, True),
+        ({"kanaal": "documenten"}, False),
+        ({"resource": ["zaak", "status"], "actie": "create"}, True),
+        ({"actie": ["update", "destroy"]}, False),
+        ({"kenmerken": {"zaaktype": "zt-1"}}, True),
+        ({"kenmerken": {"zaaktype": {"zt-2", "zt-3"}}}, False),
+        ({"kenmerken": {"bronorganisatie": lambda value: value.startswith("1")}}, True),
+        ({"kenmerken": {"vertrouwelijkheidaanduiding": "openbaar"}}, False),
+    ],
+)
+def test_route_matches(criteria, matches):
+    assert Route([], **criteria).matches(_message()) is matches
+
+
+def test_routing_handler_fans_out_to_matching_routes():
+    zaken, statussen, everything, log = (RecordingHandler() for _ in range(4))
+    router = RoutingHandler({"zaken": zaken}, default=log)
+    router.register(statussen, kanaal="zaken", resource="status")
+    router.register(everything)
+
+    router.handle(_message())
+    router.handle(_message(resource="status"))
+    router.handle(_message(kanaal="documenten"))
+
+    assert len(zaken.messages) == 2
+    assert len(statussen.messages) == 1
+    assert len(everything.messages) == 3
+    assert log.messages == []
+
+
+def test_routing_handler_default_and_dropped():
+    log = RecordingHandler()
+    router = RoutingHandler({}, default=log)
+    router.handle(_message())
+    assert log.messages == [_message()]
+
+    router = RoutingHandler({})
+    router.handle(_message())
+    assert router.dropped == 1
+
+
+def test_route_metrics():
+    failing, handler, other = (
+        RecordingHandler(fail=True),
+        RecordingHandler(),
+        RecordingHandler(),
+    )
+    router = RoutingHandler({})
+    router.register(failing, handler, kanaal="zaken", name="zaken")
+    router.register(other, name="other")
+
+    with pytest.raises(RuntimeError):
+        router.handle(_message())
+
+    # the other handlers and routes still get the message
+    assert handler.messages == [_message()]
+    assert other.messages == [_message()]
+    metrics = router.metrics["zaken"]
+    assert metrics["matched"] == 1
+    assert metrics["succeeded"] == 1
+    assert metrics["failed"] == 1
+
+
+@pytest.mark.django_db
+def test_routing_handler_batch_reports_errors_of_inline_routes():
+    failing, handler = RecordingHandler(fail=True), RecordingHandler()
+    router = RoutingHandler({"zaken": handler})
+    router.register(failing, resource="status", name="statussen")
+
+    errors = router.handle_batch([_message(), _message(resource="status")])
+
+    assert errors[0] is None
+    assert isinstance(errors[1], RuntimeError)
+    assert len(handler.messages) == 2
+    assert router.metrics["statussen"]["failed"] == 1
+
+
+def test_thread_pool_executor():
+    handler = RecordingHandler()
+    executor = ThreadPoolRouteExecutor(max_workers=4)
+    router = RoutingHandler({})
+    route = router.register(handler, executor=executor)
+
+    for index in range(10):
+        router.handle(_message(resource_url=f"https://zrc.example.com/zaken/{index}"))
+    executor.shutdown()
+
+    assert len(handler.messages) == 10
+    assert route.metrics.as_dict()["succeeded"] == 10
+
+
+def test_queued_executor_keeps_order_and_logs_errors():
+    handler, failing = RecordingHandler(), RecordingHandler(fail=True)
+    executor = QueuedExecutor(maxsize=2)
+    router = RoutingHandler({})
+    route = router.register(failing, handler, executor=executor)
+
+    urls = [f"https://zrc.example.com/zaken/{index}" for index in range(5)]
+    for url in urls:
+        router.handle(_message(resource_url=url))
+    executor.join()
+    executor.shutdown()
+
+    assert [message["resource_url"] for message in handler.messages] == urls
+    assert route.metrics.as_dict()["failed"] == 5
+
+
+failing_router = RoutingHandler({"autorisaties": RecordingHandler(fail=True)})
+
+
+@pytest.mark.django_db
+def test_webhook_fails_when_an_inline_route_fails(settings):
+    settings.DEFAULT_NOTIFICATIONS_HANDLER = (
+        "tests.test_notifications_routing.failing_router"
+    )
+    settings.ROOT_URLCONF = "vng_api_common.notifications.api.urls"
+    JWTSecret.objects.create(identifier="nrc", secret="secret")
+    Applicatie.objects.create(
+        client_ids=["nrc"], label="NRC", heeft_alle_autorisaties=True
+    )
+    client = APIClient(raise_request_exception=False)
+    client.credentials(HTTP_AUTHORIZATION=generate_jwt_auth("nrc", "secret"))
+
+    response = client.post(
+        "/callbacks",
+        {
+            "kanaal": "autorisaties",
+            "hoofdObject": "https://ac.example.com/api/v1/applicaties/1",
+            "resource": "applicatie",
+            "resourceUrl": "https://ac.example.com/api/v1/applicaties/1",
+            "actie": "update",
+            "aanmaakdatum": "2024-01-01T12:00:00Z",
+            "kenmerken": {},
+        },
+        format="json",
+    )
+
+    # the notification is delivered again
+    assert response.status_code == 500
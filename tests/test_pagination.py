@@ -1,9 +1,17 @@
+from django.core.cache import caches
+
 import pytest
 from rest_framework import status
 from rest_framework.reverse import reverse
+from rest_framework.test import APIRequestFactory
 
 from testapp.factories import HobbyFactory
-from vng_api_common.pagination import DynamicPageSizeMixin
+from testapp.viewsets import PaginateHobbyViewSet
+from vng_api_common.pagination import (
+    DynamicPageSizeMixin,
+    DynamicPageSizePagination,
+    EstimatedCountPaginator,
+)
 
 
 @pytest.mark.django_db
@@ -45,3 +53,79 @@ def test_page_size_query_description_property():
         pagination.page_size_query_description
         == "Het aantal resultaten terug te geven per pagina. (default: 42, maximum: 500)."
     )
+
+
+@pytest.mark.django_db
+def test_cursor_pagination_follows_links(api_client):
+    hobbies = [HobbyFactory.create(name=f"hobby {i}") for i in range(5)]
+    path = reverse("cursor-paginate-hobby-list")
+
+    first = api_client.get(path, {"pageSize": 2}).json()
+    second = api_client.get(first["next"]).json()
+    third = api_client.get(second["next"]).json()
+    back = api_client.get(third["previous"]).json()
+
+    assert [item["name"] for item in first["results"]] == ["hobby 0", "hobby 1"]
+    assert first["previous"] is None
+    assert [item["name"] for item in second["results"]] == ["hobby 2", "hobby 3"]
+    assert [item["name"] for item in third["results"]] == [hobbies[4].name]
+    assert third["next"] is None
+    assert back["results"] == second["results"]
+
+
+@pytest.mark.django_db
+def test_cursor_pagination_tampered_cursor(api_client):
+    path = reverse("cursor-paginate-hobby-list")
+
+    response = api_client.get(path, {"cursor": "not-a-signed-cursor"})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_cursor_pagination_unknown_query_param(api_client):
+    path = reverse("cursor-paginate-hobby-list")
+
+    response = api_client.get(path, {"page": 2})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_estimated_count_paginator_fetches_extra_record():
+    paginator = EstimatedCountPaginator(list(range(5)), 2, count=100)
+
+    assert paginator.page(2).has_next()
+    assert not paginator.page(3).has_next()
+    assert paginator.page(3).object_list == [4]
+
+
+def test_estimated_count_paginator_ignores_underestimate():
+    paginator = EstimatedCountPaginator(list(range(5)), 2, count=1)
+
+    page = paginator.page(2)
+
+    assert page.object_list == [2, 3]
+    assert page.next_page_number() == 3
+
+
+@pytest.mark.django_db
+def test_list_with_cached_count():
+    class CachedCountPagination(DynamicPageSizePagination):
+        count_cache_timeout = 60
+
+    class CachedCountHobbyViewSet(PaginateHobbyViewSet):
+        pagination_class = CachedCountPagination
+
+    caches["default"].clear()
+    HobbyFactory.create_batch(2)
+    view = CachedCountHobbyViewSet.as_view({"get": "list"})
+
+    first = view(APIRequestFactory().get("/", {"pageSize": 2})).data
+    HobbyFactory.create()
+    second = view(APIRequestFactory().get("/", {"pageSize": 2})).data
+
+    assert (first["count"], first["count_is_exact"]) == (2, True)
+    assert first["next"] is None
+    assert (second["count"], second["count_is_exact"]) == (2, False)
+    # the links do not depend on the cached count
+    assert second["next"] == "http://testserver/?page=2&pageSize=2"
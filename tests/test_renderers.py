@@ -0,0 +1,78 @@
+import io
+import json
+import math
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from django.utils.translation import gettext_lazy as _
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from vng_api_common import parsers, renderers
+from vng_api_common.parsers import CamelCaseJSONParser, CamelCaseORJSONParser
+from vng_api_common.renderers import CamelCaseJSONRenderer, CamelCaseORJSONRenderer
+
+DATA = {
+    "some_uuid": uuid.UUID("8e09b5f1-1d21-4b0a-8a8a-1c3e8b1a6b36"),
+    "aware_datetime": datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+    "naive_datetime": datetime(2024, 1, 2, 3, 4, 5),
+    "some_date": date(2024, 1, 2),
+    "some_decimal": Decimal("1.50"),
+    "duration": relativedelta(years=1, days=2),
+    "lazy_string": _("Invalid input."),
+    "nested_list": [{"inner_key": "line\u2028separator"}],
+    "floats": [0.0, -0.0, 0.1, 1.5, 1e-4, 1e15, 1e-5, 1e-7, 1e16, -1.5e22],
+    1: "integer key",
+}
+
+
+def test_orjson_renderer_matches_json_renderer():
+    assert CamelCaseORJSONRenderer().render(DATA) == CamelCaseJSONRenderer().render(
+        DATA
+    )
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+@pytest.mark.parametrize("strict", [True, False])
+def test_orjson_renderer_matches_json_renderer_non_finite(value, strict):
+    data = {**DATA, "some_float": value}
+    orjson_renderer, json_renderer = CamelCaseORJSONRenderer(), CamelCaseJSONRenderer()
+    orjson_renderer.strict = json_renderer.strict = strict
+
+    if not strict:
+        assert orjson_renderer.render(data) == json_renderer.render(data)
+    else:
+        with pytest.raises(ValueError):
+            orjson_renderer.render(data)
+        with pytest.raises(ValueError):
+            json_renderer.render(data)
+
+
+def test_orjson_renderer_falls_back_for_indent():
+    rendered = CamelCaseORJSONRenderer().render(
+        {"some_key": 1}, "application/json; indent=4"
+    )
+
+    assert rendered == b'{\n    "someKey": 1\n}'
+
+
+def test_orjson_renderer_without_orjson(monkeypatch):
+    monkeypatch.setattr(renderers, "orjson", None)
+
+    assert CamelCaseORJSONRenderer().render(DATA) == CamelCaseJSONRenderer().render(
+        DATA
+    )
+
+
+@pytest.mark.parametrize("orjson_installed", [True, False])
+def test_orjson_parser(monkeypatch, orjson_installed):
+    if not orjson_installed:
+        monkeypatch.setattr(parsers, "orjson", None)
+    content = json.dumps({"someKey": [{"innerKey": "ë"}]}).encode()
+
+    parsed = CamelCaseORJSONParser().parse(io.BytesIO(content))
+
+    assert parsed == CamelCaseJSONParser().parse(io.BytesIO(content))
+    assert parsed == {"some_key": [{"inner_key": "ë"}]}
@@ -1,4 +1,4 @@
-from vng_api_common.scopes import Scope
+from vng_api_common.scopes import Scope, scopes_to_mask
 
 SCOPE_A = Scope("A", "scope a")
 SCOPE_B = Scope("B", "scope b")
@@ -79,3 +79,37 @@ def test_multi_and():
     assert not a_and_b_and_c.is_contained_in(["C"])
     assert not a_and_b_and_c.is_contained_in(["A", "C"])
     assert a_and_b_and_c.is_contained_in(["A", "B", "C"])
+
+
+def test_compiled_scope_clauses():
+    a_and_b_or_c = SCOPE_A & (SCOPE_B | SCOPE_C)
+
+    compiled = a_and_b_or_c.compiled
+
+    assert compiled.labels == {"A", "B", "C"}
+    assert len(compiled.clauses) == 2
+    assert a_and_b_or_c.compiled is compiled
+
+
+def test_compiled_scope_absorption():
+    a_or_a_and_b = SCOPE_A | (SCOPE_A & SCOPE_B)
+
+    assert len(a_or_a_and_b.compiled.clauses) == 1
+    assert a_or_a_and_b.is_contained_in(["A"])
+    assert not a_or_a_and_b.is_contained_in(["B"])
+
+
+def test_scope_contained_in_set_and_unknown_labels():
+    a_and_b = SCOPE_A & SCOPE_B
+
+    assert a_and_b.is_contained_in({"A", "B", "unknown"})
+    assert not a_and_b.is_contained_in({"A", "unknown"})
+    assert not a_and_b.is_contained_in(set())
+
+
+def test_scopes_to_mask():
+    a_or_b = SCOPE_A | SCOPE_B
+    compiled = a_or_b.compiled
+
+    assert compiled.matches(scopes_to_mask(["B"]))
+    assert not compiled.matches(scopes_to_mask(["C", "unknown"]))
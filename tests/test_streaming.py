@@ -0,0 +1,117 @@
+import json
+
+import pytest
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.test import APIRequestFactory
+
+from testapp.factories import HobbyFactory
+from testapp.viewsets import (
+    CursorPaginateHobbyViewSet,
+    HobbyViewSet,
+    PaginateHobbyViewSet,
+)
+from vng_api_common.renderers import CamelCaseORJSONRenderer
+from vng_api_common.search import SearchMixin
+from vng_api_common.viewsets import StreamingListMixin
+
+
+class StreamingPaginateHobbyViewSet(StreamingListMixin, PaginateHobbyViewSet):
+    streaming_chunk_size = 2
+
+
+def _get_json(viewset, accept="application/json", **params):
+    view = viewset.as_view({"get": "list"})
+    response = view(APIRequestFactory().get("/hobbies", params, HTTP_ACCEPT=accept))
+    if response.streaming:
+        return json.loads(b"".join(response.streaming_content))
+    return json.loads(response.render().content)
+
+
+@pytest.mark.django_db
+def test_streaming_paginated_list_matches_regular_list():
+    HobbyFactory.create_batch(5)
+
+    streamed = _get_json(StreamingPaginateHobbyViewSet, page=2, pageSize=3)
+
+    assert streamed == _get_json(PaginateHobbyViewSet, page=2, pageSize=3)
+    assert len(streamed["results"]) == 2
+
+
+@pytest.mark.django_db
+def test_streaming_cursor_paginated_list_matches_regular_list():
+    class StreamingCursorPaginateHobbyViewSet(
+        StreamingListMixin, CursorPaginateHobbyViewSet
+    ):
+        pass
+
+    HobbyFactory.create_batch(5)
+
+    assert _get_json(StreamingCursorPaginateHobbyViewSet, pageSize=3) == _get_json(
+        CursorPaginateHobbyViewSet, pageSize=3
+    )
+
+
+@pytest.mark.django_db
+def test_streaming_unpaginated_list():
+    class StreamingHobbyViewSet(StreamingListMixin, HobbyViewSet):
+        streaming_chunk_size = 2
+
+    HobbyFactory.create_batch(3)
+
+    streamed = _get_json(StreamingHobbyViewSet)
+
+    assert sorted(streamed, key=str) == sorted(_get_json(HobbyViewSet), key=str)
+    assert len(streamed) == 3
+
+
+@pytest.mark.django_db
+def test_streaming_uses_negotiated_renderer():
+    HobbyFactory.create_batch(3)
+    accept = "application/json; indent=4"
+
+    streamed = _get_json(StreamingPaginateHobbyViewSet, accept=accept, pageSize=2)
+
+    assert streamed == _get_json(PaginateHobbyViewSet, accept=accept, pageSize=2)
+
+
+@pytest.mark.django_db
+def test_streaming_skips_non_json_renderers():
+    class BrowsableStreamingHobbyViewSet(StreamingListMixin, HobbyViewSet):
+        renderer_classes = (CamelCaseORJSONRenderer, BrowsableAPIRenderer)
+
+    HobbyFactory.create()
+    view = BrowsableStreamingHobbyViewSet.as_view({"get": "list"})
+
+    response = view(APIRequestFactory().get("/hobbies", HTTP_ACCEPT="text/html"))
+
+    assert not response.streaming
+    assert response.accepted_media_type == "text/html"
+
+
+class SearchHobbyViewSet(StreamingListMixin, SearchMixin, HobbyViewSet):
+    renderer_classes = (CamelCaseORJSONRenderer, BrowsableAPIRenderer)
+
+    def search(self, request, *args, **kwargs):
+        return self.get_search_output(self.get_queryset())
+
+
+@pytest.mark.django_db
+def test_streaming_search():
+    HobbyFactory.create_batch(2)
+    view = SearchHobbyViewSet.as_view({"post": "search"})
+
+    response = view(APIRequestFactory().post("/hobbies/_zoek"))
+
+    assert response.streaming
+    assert len(json.loads(b"".join(response.streaming_content))) == 2
+
+
+@pytest.mark.django_db
+def test_streaming_search_skips_non_json_renderers():
+    HobbyFactory.create()
+    view = SearchHobbyViewSet.as_view({"post": "search"})
+
+    response = view(APIRequestFactory().post("/hobbies/_zoek", HTTP_ACCEPT="text/html"))
+
+    assert not response.streaming
+    assert response.accepted_media_type == "text/html"
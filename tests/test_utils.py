@@ -5,13 +5,17 @@ from django.urls import reverse
 
 import pytest
 
-from testapp.models import Group, Record
+from testapp.models import Group, Hobby, Record
 from testapp.viewsets import GroupViewSet
 from vng_api_common.api.views import CreateJWTSecretView
 from vng_api_common.utils import (
     generate_unique_identification,
+    get_lookup_plan,
+    get_resource_for_path,
+    get_resources_by_path,
     get_resources_for_paths,
     get_viewset_for_path,
+    resolve_path,
 )
 
 
@@ -40,6 +44,42 @@ def test_viewset_for_path_with_subpath(script_path):
     assert isinstance(viewset, GroupViewSet)
 
 
+def test_resolve_path_is_cached():
+    path = reverse("group-detail", kwargs={"pk": 1})
+
+    assert resolve_path(path) is resolve_path(path)
+
+
+def test_get_viewset_for_path_does_not_share_kwargs():
+    path = reverse("group-detail", kwargs={"pk": 1})
+
+    get_viewset_for_path(path).kwargs["pk"] = "2"
+
+    assert get_viewset_for_path(path).kwargs["pk"] == "1"
+
+
+def test_lookup_plan():
+    class CustomGroupViewSet(GroupViewSet):
+        def get_queryset(self):
+            return super().get_queryset().none()
+
+    plan = get_lookup_plan(GroupViewSet)
+
+    assert plan.model is Group
+    assert plan.lookup_field == plan.lookup_url_kwarg == "pk"
+    assert plan.queryset is GroupViewSet.queryset
+    assert get_lookup_plan(CustomGroupViewSet).queryset is None
+
+
+@pytest.mark.django_db
+def test_get_resource_for_path(django_assert_num_queries):
+    group = Group.objects.create()
+    path = reverse("group-detail", kwargs={"pk": group.pk})
+
+    with django_assert_num_queries(1):
+        assert get_resource_for_path(path) == group
+
+
 @pytest.mark.django_db
 def test_get_resources_for_paths(django_assert_num_queries):
     group1, group2 = [
@@ -79,6 +119,32 @@ def test_no_resolution():
         get_resources_for_paths(paths)
 
 
+@pytest.mark.django_db
+def test_get_resources_by_path(django_assert_num_queries):
+    group1, group2 = Group.objects.create(), Group.objects.create()
+    hobby = Hobby.objects.create(name="Fishing")
+    paths = [
+        f"/api/groups/{group2.pk}",
+        f"/api/hobbies/{hobby.pk}",
+        "/api/groups/-3",
+        "/api/groups/not-a-pk",
+        "/",
+        f"/api/groups/{group1.pk}",
+    ]
+
+    with django_assert_num_queries(2):
+        resources = get_resources_by_path(paths)
+
+    assert list(resources.items()) == [
+        (f"/api/groups/{group2.pk}", group2),
+        (f"/api/hobbies/{hobby.pk}", hobby),
+        ("/api/groups/-3", None),
+        ("/api/groups/not-a-pk", None),
+        ("/", None),
+        (f"/api/groups/{group1.pk}", group1),
+    ]
+
+
 @pytest.mark.django_db
 def test_generate_unique_identification():
     record1 = Record(create_date=date(2023, 3, 3))
@@ -0,0 +1,211 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import override_settings
+
+import pytest
+import requests
+import requests_mock
+from freezegun import freeze_time
+from rest_framework.serializers import ValidationError
+
+from vng_api_common.tests.auth import generate_jwt_auth
+from vng_api_common.validation_cache import (
+    CachedResponse,
+    ValidationCache,
+    _get_cache,
+    get_freshness,
+)
+from vng_api_common.validators import ResourceValidator, URLValidator
+
+URL = "https://ztc.example.com/api/v1/zaaktypen/1"
+
+
+@pytest.fixture(autouse=True)
+def validation_cache():
+    _get_cache.cache_clear()
+    caches["default"].clear()
+    with override_settings(
+        COMMONGROUND_API_COMMON={
+            "URL_VALIDATION_CACHE": True,
+            "URL_VALIDATION_CACHE_ALIAS": "default",
+        }
+    ):
+        yield
+    _get_cache.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "status_code,cache_control,freshness",
+    [
+        (200, "", 300),
+        (200, "public, max-age=60", 60),
+        (200, "max-age=invalid", 300),
+        (200, "no-cache", 0),
+        (200, "no-store", None),
+        (404, "", 30),
+        (404, "no-store", None),
+        (500, "max-age=60", None),
+    ],
+)
+def test_get_freshness(status_code, cache_control, freshness):
+    headers = {"Cache-Control": cache_control} if cache_control else {}
+    assert get_freshness(status_code, headers) == freshness
+
+
+def test_responses_are_cached():
+    validator = URLValidator()
+
+    with requests_mock.Mocker() as m, freeze_time("2026-01-01T12:00:00"):
+        m.get(URL, json={"url": URL}, headers={"Cache-Control": "max-age=60"})
+
+        validator(URL)
+        response = validator(URL)
+
+    assert m.call_count == 1
+    assert isinstance(response, requests.Response)
+    assert response.ok
+    assert response.json() == {"url": URL}
+    assert response.text == f'{{"url": "{URL}"}}'
+    assert response.headers["cache-control"] == "max-age=60"
+    response.raise_for_status()
+
+
+def test_cache_is_keyed_by_auth():
+    validator = URLValidator(get_auth=lambda url: {"Authorization": "Bearer a"})
+    other = URLValidator(get_auth=lambda url: {"Authorization": "Bearer b"})
+
+    with requests_mock.Mocker() as m:
+        m.get(URL, json={})
+
+        validator(URL)
+        other(URL)
+        validator(URL)
+
+    assert m.call_count == 2
+
+
+def test_cache_is_keyed_by_jwt_client_id():
+    tokens = {
+        "first": generate_jwt_auth("client", "secret"),
+        "second": generate_jwt_auth("client", "secret", user_id="another"),
+        "other": generate_jwt_auth("other", "secret"),
+    }
+    validators = {
+        name: URLValidator(get_auth=lambda url, token=token: {"Authorization": token})
+        for name, token in tokens.items()
+    }
+
+    with requests_mock.Mocker() as m:
+        m.get(URL, json={})
+
+        validators["first"](URL)
+        validators["second"](URL)
+        validators["other"](URL)
+
+    # a new token for the same client hits the cache
+    assert m.call_count == 2
+
+
+def test_stale_responses_are_revalidated():
+    validator = URLValidator()
+
+    with requests_mock.Mocker() as m, freeze_time("2026-01-01T12:00:00") as frozen:
+        m.get(
+            URL,
+            json={"url": URL},
+            headers={"Cache-Control": "max-age=60", "ETag": '"v1"'},
+        )
+        validator(URL)
+
+        frozen.tick(61)
+        m.get(URL, status_code=304, headers={"Cache-Control": "max-age=60"})
+        response = validator(URL)
+
+        assert m.last_request.headers["If-None-Match"] == '"v1"'
+        assert response.json() == {"url": URL}
+
+        # fresh again after the revalidation
+        validator(URL)
+
+    assert m.call_count == 2
+
+
+def test_not_found_responses_are_cached_briefly():
+    validator = URLValidator()
+
+    with requests_mock.Mocker() as m, freeze_time("2026-01-01T12:00:00") as frozen:
+        m.get(URL, status_code=404)
+
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                validator(URL)
+        assert m.call_count == 1
+
+        cached = validator.fetch(URL)
+        assert not cached.ok
+        with pytest.raises(requests.HTTPError):
+            cached.raise_for_status()
+
+        frozen.tick(31)
+        m.get(URL, json={})
+        validator(URL)
+
+    assert m.call_count == 2
+
+
+def test_no_store_responses_are_not_cached():
+    validator = URLValidator()
+
+    with requests_mock.Mocker() as m:
+        m.get(URL, json={}, headers={"Cache-Control": "no-store"})
+        validator(URL)
+        validator(URL)
+
+    assert m.call_count == 2
+
+
+@patch("vng_api_common.validators.obj_has_shape", return_value=True)
+@patch("vng_api_common.validators.fetcher")
+def test_resource_validator_reuses_cached_body(*mocks):
+    validator = ResourceValidator("ZaakType", "https://ztc.example.com/api/v1/schema")
+
+    with requests_mock.Mocker() as m:
+        m.get(URL, json={"url": URL, "omschrijving": "Melding"})
+
+        assert validator(URL) == {"url": URL, "omschrijving": "Melding"}
+        assert validator(URL) == {"url": URL, "omschrijving": "Melding"}
+
+    assert m.call_count == 1
+
+
+def test_shared_django_cache():
+    validator = URLValidator()
+
+    with requests_mock.Mocker() as m:
+        m.get(URL, json={})
+        validator(URL)
+
+        # another process only has the Django cache
+        _get_cache.cache_clear()
+        validator(URL)
+
+    assert m.call_count == 1
+
+
+def test_lru_eviction():
+    cache = ValidationCache(max_entries=2)
+    entries = [
+        CachedResponse(
+            url=str(index), status_code=200, content=b"", headers={}, expires=0
+        )
+        for index in range(3)
+    ]
+    cache.set("0", entries[0])
+    cache.set("1", entries[1])
+    cache.get("0")
+    cache.set("2", entries[2])
+
+    assert cache.get("0") is entries[0]
+    assert cache.get("1") is None
+    assert cache.get("2") is entries[2]
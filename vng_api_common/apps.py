@@ -1,6 +1,6 @@
 import logging
 
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
 from django.core.exceptions import ImproperlyConfigured
 from django.db import models
 from django.forms.fields import CharField
@@ -41,6 +41,7 @@ class CommonGroundAPICommonConfig(AppConfig):
         ensure_text_choice_descriptions(TextChoicesWithDescriptions)
         register_geojson_field_extension()
         register_base64_field_extension()
+        connect_client_registry_signals()
 
 
 def register_serializer_field():
@@ -115,3 +116,16 @@ def register_base64_field_extension() -> None:
         return
 
     from .extensions import file  # noqa
+
+
+def connect_client_registry_signals() -> None:
+    """
+    Invalidate the clients of ``get_client`` when services change, if
+    zgw-consumers is installed
+    """
+    if not apps.is_installed("zgw_consumers"):
+        return
+
+    from .client_registry import connect_signals
+
+    connect_signals()
@@ -0,0 +1,153 @@
+"""
+Async counterpart of :mod:`vng_api_common.client`, built on `httpx`_.
+
+Requires the ``async`` extra: ``pip install commonground-api-common[async]``.
+
+.. _httpx: https://www.python-httpx.org/
+"""
+
+import logging
+import ssl
+from typing import Any
+
+import httpx
+from ape_pie.exceptions import InvalidURLError
+from asgiref.sync import sync_to_async
+from requests.auth import AuthBase
+from zgw_consumers.client import ServiceConfigAdapter
+from zgw_consumers.models import Service
+
+from .client import ClientError, NoServiceConfigured
+
+logger = logging.getLogger(__name__)
+
+
+def to_internal_data(response: httpx.Response) -> dict | list | None:
+    """
+    Same as :func:`vng_api_common.client.to_internal_data`, for a response of an
+    :class:`AsyncClient`.
+    """
+    try:
+        response_json = response.json()
+    except ValueError:
+        logger.exception("Unable to parse json from response")
+        response_json = None
+
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        if response.status_code >= 500:
+            raise
+        raise ClientError(response_json if response_json is not None else {}) from exc
+
+    return response_json
+
+
+class RequestsAuth(httpx.Auth):
+    """
+    Apply a :class:`requests.auth.AuthBase` that only sets headers, like the auth
+    classes of zgw-consumers, to httpx requests.
+
+    Fetching an OAuth2 token blocks the event loop, the token is cached though.
+    """
+
+    def __init__(self, auth: AuthBase):
+        self.auth = auth
+
+    def auth_flow(self, request: httpx.Request):
+        self.auth(request)  # type: ignore
+        yield request
+
+
+def _get_ssl_context(verify: bool | str, cert: str | tuple[str, str] | None):
+    if isinstance(verify, bool) and cert is None:
+        return verify
+
+    context = ssl.create_default_context(
+        cafile=verify if isinstance(verify, str) else None
+    )
+    if cert is not None:
+        if isinstance(cert, str):
+            context.load_cert_chain(cert)
+        else:
+            context.load_cert_chain(*cert)
+    return context
+
+
+class AsyncClient(httpx.AsyncClient):
+    """
+    Async client for a remote API, with the same defaults as
+    :class:`vng_api_common.client.Client`.
+
+    Relative URLs are relative to ``base_url``. Absolute URLs outside of
+    ``base_url`` are refused, to not leak the credentials to other hosts. Use the
+    client as an async context manager to close its connections.
+    """
+
+    async def request(self, method: str, url: httpx.URL | str, **kwargs) -> Any:
+        absolute_url = str(url)
+        if httpx.URL(absolute_url).is_absolute_url and not absolute_url.startswith(
+            str(self.base_url)
+        ):
+            raise InvalidURLError(
+                f"Target URL {absolute_url} has a different base URL than the "
+                f"client ({self.base_url})."
+            )
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers.setdefault("Accept", "application/json")
+        headers.setdefault("Content-Type", "application/json")
+        kwargs["headers"] = headers
+
+        if data := kwargs.pop("data", None):
+            kwargs["json"] = data
+
+        return await super().request(method, url, **kwargs)
+
+    @classmethod
+    def configure_from(cls, adapter: ServiceConfigAdapter, **kwargs) -> "AsyncClient":
+        session_kwargs = adapter.get_client_session_kwargs()
+
+        if auth := session_kwargs.get("auth"):
+            kwargs.setdefault("auth", RequestsAuth(auth))
+        if timeout := session_kwargs.get("timeout"):
+            kwargs.setdefault("timeout", timeout)
+        kwargs.setdefault(
+            "verify",
+            _get_ssl_context(
+                session_kwargs.get("verify", True), session_kwargs.get("cert")
+            ),
+        )
+
+        return cls(base_url=adapter.get_client_base_url(), **kwargs)
+
+
+def build_async_client(service: Service, **client_kwargs) -> AsyncClient:
+    return AsyncClient.configure_from(ServiceConfigAdapter(service), **client_kwargs)
+
+
+def _get_client(url: str, raise_exceptions: bool, **client_kwargs):
+    from .client_registry import registry
+
+    service = registry.get_service(url)
+
+    if not service:
+        logger.warning(f"No service configured for {url}")
+        if raise_exceptions:
+            raise NoServiceConfigured(f"{url} API should be added to Service model")
+        return
+
+    return build_async_client(service, **client_kwargs)
+
+
+async def aget_client(
+    url: str, raise_exceptions: bool = False, **client_kwargs
+) -> AsyncClient | None:
+    """
+    Get an async client instance for the given URL.
+    If no suitable client is found, ``None`` is returned.
+
+    The service is resolved like :func:`vng_api_common.client.get_client`. The
+    client is not shared, since its connections are bound to the event loop.
+    """
+    return await sync_to_async(_get_client)(url, raise_exceptions, **client_kwargs)
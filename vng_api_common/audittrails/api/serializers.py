@@ -1,10 +1,21 @@
+from django.db import models
+
 from rest_framework import serializers
 
 from ...constants import CommonResourceAction, ComponentTypes
 from ...serializers import GegevensGroepSerializer, add_choice_values_help_text
+from ..compaction import expand_audittrails
 from ..models import AuditTrail
 
 
+class AuditTrailListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        # expand the compacted records in bulk rather than one by one
+        trails = list(data.all() if isinstance(data, models.Manager) else data)
+        expand_audittrails(trails)
+        return super().to_representation(trails)
+
+
 class WijzigingenSerializer(GegevensGroepSerializer):
     class Meta:
         model = AuditTrail
@@ -34,6 +45,7 @@ class AuditTrailSerializer(serializers.ModelSerializer):
             "aanmaakdatum",
             "wijzigingen",
         )
+        list_serializer_class = AuditTrailListSerializer
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -0,0 +1,260 @@
+"""
+Compact storage of the audit trail changes.
+
+Every audit trail record stores the full representation of the resource before
+(``oud``) and after (``nieuw``) the action. Records of the same resource form a
+chain (ordered by primary key), in which the ``oud`` of a record is usually equal
+to the ``nieuw`` of the previous record. Compaction replaces the full snapshots
+with JSON-patch style diffs:
+
+* ``oud_patch`` transforms the ``nieuw`` of the previous record into ``oud``
+* ``nieuw_patch`` transforms ``oud`` into ``nieuw``
+
+Every ``snapshot_interval`` records of a chain keep their full snapshots, which
+bounds the number of records needed for the reconstruction. Compacted records are
+expanded transparently when reading the ``wijzigingen`` of a record.
+
+.. warning:: Deleting individual records from a compacted chain breaks the
+   reconstruction of the records after it. Deleting all the records of a main
+   object is safe.
+"""
+
+import operator
+from collections import defaultdict
+from collections.abc import Iterable
+from functools import reduce
+from typing import TYPE_CHECKING, Any
+
+from django.db import transaction
+from django.db.models import Max, Q
+
+if TYPE_CHECKING:
+    from .models import AuditTrail
+
+JSONValue = Any
+Patch = list[dict[str, JSONValue]]
+
+DEFAULT_SNAPSHOT_INTERVAL = 10
+
+
+def _escape(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(source: JSONValue, target: JSONValue, path: str = "") -> Patch:
+    """
+    Calculate the JSON-patch operations to transform ``source`` into ``target``.
+
+    Objects are compared key by key, any other changed values (including arrays)
+    are replaced as a whole.
+    """
+    if isinstance(source, dict) and isinstance(target, dict):
+        operations = []
+        for key, value in source.items():
+            key_path = f"{path}/{_escape(key)}"
+            if key not in target:
+                operations.append({"op": "remove", "path": key_path})
+            else:
+                operations += make_patch(value, target[key], key_path)
+        for key, value in target.items():
+            if key not in source:
+                key_path = f"{path}/{_escape(key)}"
+                operations.append({"op": "add", "path": key_path, "value": value})
+        return operations
+
+    # bool is a subclass of int, so compare the types as well
+    if type(source) is type(target) and source == target:
+        return []
+    return [{"op": "replace", "path": path, "value": target}]
+
+
+def apply_patch(source: JSONValue, patch: Patch) -> JSONValue:
+    """
+    Apply the JSON-patch operations produced by :func:`make_patch` to ``source``.
+
+    The ``source`` document is not modified.
+    """
+    document = source
+    # objects along the path are copied before they are modified
+    copied: set[int] = set()
+
+    def _copy(value: dict) -> dict:
+        copy = dict(value)
+        copied.add(id(copy))
+        return copy
+
+    for operation in patch:
+        path = operation["path"]
+        if not path:
+            document = operation["value"]
+            continue
+
+        tokens = [_unescape(token) for token in path.split("/")[1:]]
+        if id(document) not in copied:
+            document = _copy(document)
+        parent = document
+        for token in tokens[:-1]:
+            child = parent[token]
+            if id(child) not in copied:
+                child = parent[token] = _copy(child)
+            parent = child
+
+        if operation["op"] == "remove":
+            del parent[tokens[-1]]
+        else:
+            parent[tokens[-1]] = operation["value"]
+
+    return document
+
+
+def _expand(trail: "AuditTrail", previous_nieuw: JSONValue) -> None:
+    if trail.oud_patch is not None:
+        trail.oud = apply_patch(previous_nieuw, trail.oud_patch)
+    if trail.nieuw_patch is not None:
+        trail.nieuw = apply_patch(trail.oud, trail.nieuw_patch)
+    trail._expanded = True  # type: ignore[attr-defined]
+
+
+def expand_audittrails(trails: Iterable["AuditTrail"]) -> None:
+    """
+    Reconstruct the full ``oud`` and ``nieuw`` values of compacted records in place.
+
+    Every chain is replayed from the latest full snapshot before the requested
+    records, so at most ``snapshot_interval`` records per chain are fetched.
+    """
+    from .models import AuditTrail
+
+    to_expand = {
+        trail.pk: trail
+        for trail in trails
+        if trail.is_compact and not getattr(trail, "_expanded", False)
+    }
+    if not to_expand:
+        return
+
+    pk_ranges: dict[str, tuple[int, int]] = {}
+    for trail in to_expand.values():
+        min_pk, max_pk = pk_ranges.get(trail.resource_url, (trail.pk, trail.pk))
+        pk_ranges[trail.resource_url] = (min(min_pk, trail.pk), max(max_pk, trail.pk))
+
+    snapshots = (
+        AuditTrail.objects.filter(
+            reduce(
+                operator.or_,
+                (
+                    Q(resource_url=url, pk__lte=min_pk)
+                    for url, (min_pk, _) in pk_ranges.items()
+                ),
+            ),
+            oud_patch__isnull=True,
+            nieuw_patch__isnull=True,
+        )
+        .values("resource_url")
+        .annotate(start=Max("pk"))
+        .values_list("resource_url", "start")
+    )
+    starts = dict(snapshots)
+
+    chains = (
+        AuditTrail.objects.filter(
+            reduce(
+                operator.or_,
+                (
+                    Q(resource_url=url, pk__gte=starts.get(url, 0), pk__lte=max_pk)
+                    for url, (_, max_pk) in pk_ranges.items()
+                ),
+            )
+        )
+        .order_by("resource_url", "pk")
+        .only("pk", "resource_url", "oud", "nieuw", "oud_patch", "nieuw_patch")
+    )
+
+    previous_nieuw: dict[str, JSONValue] = {}
+    for record in chains.iterator():
+        url = record.resource_url
+        _expand(record, previous_nieuw.get(url))
+        previous_nieuw[url] = record.nieuw
+
+        if (trail := to_expand.get(record.pk)) is not None:
+            trail.oud, trail.nieuw = record.oud, record.nieuw
+            trail._expanded = True  # type: ignore[attr-defined]
+
+
+def compact_audittrails(
+    snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+    batch_size: int = 500,
+    queryset=None,
+) -> int:
+    """
+    Convert the full snapshots of audit trail records into diffs.
+
+    Compaction is idempotent, already compacted records are left untouched. Returns
+    the number of compacted records.
+
+    :param snapshot_interval: keep the full snapshots of every n-th record in a
+      chain.
+    :param batch_size: the number of records to update per query.
+    :param queryset: optionally limit the compaction to a subset of the records.
+      Must contain complete chains.
+    """
+    from .models import AuditTrail
+
+    assert snapshot_interval >= 1, "The snapshot interval must be at least 1"
+
+    if queryset is None:
+        queryset = AuditTrail.objects.all()
+
+    records = queryset.order_by("resource_url", "pk").only(
+        "pk", "resource_url", "oud", "nieuw", "oud_patch", "nieuw_patch"
+    )
+
+    compacted = 0
+    to_update: list[AuditTrail] = []
+    previous_nieuw: dict[str, JSONValue] = {}
+    chain_position: dict[str, int] = defaultdict(int)
+
+    def _flush():
+        with transaction.atomic():
+            AuditTrail.objects.bulk_update(
+                to_update, ["oud", "nieuw", "oud_patch", "nieuw_patch"]
+            )
+        to_update.clear()
+
+    for record in records.iterator(chunk_size=batch_size):
+        url = record.resource_url
+        position = chain_position[url]
+        chain_position[url] += 1
+        previous = previous_nieuw.get(url)
+
+        if record.is_compact:
+            _expand(record, previous)
+            previous_nieuw[url] = record.nieuw
+            continue
+
+        oud, nieuw = record.oud, record.nieuw
+        previous_nieuw[url] = nieuw
+
+        if position % snapshot_interval == 0:
+            continue
+
+        if oud is not None and previous is not None:
+            record.oud_patch = make_patch(previous, oud)
+            record.oud = None
+        if nieuw is not None and oud is not None:
+            record.nieuw_patch = make_patch(oud, nieuw)
+            record.nieuw = None
+
+        if record.is_compact:
+            compacted += 1
+            to_update.append(record)
+            if len(to_update) >= batch_size:
+                _flush()
+
+    if to_update:
+        _flush()
+
+    return compacted
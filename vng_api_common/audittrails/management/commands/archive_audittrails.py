@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from ...partitioning import archive_partitions, is_partitioned
+
+
+class Command(BaseCommand):
+    help = (
+        "Export the audit trail partitions older than the retention period to "
+        "compressed JSONL files and drop them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            required=True,
+            help="Number of full months of audit trails to keep.",
+        )
+        parser.add_argument(
+            "--output-dir",
+            type=Path,
+            required=True,
+            help="Directory to write the exported partitions to.",
+        )
+
+    def handle(self, **options):
+        if connection.vendor != "postgresql" or not is_partitioned():
+            raise CommandError(
+                "The audit trail table is not partitioned, "
+                "run `partition_audittrails` first."
+            )
+
+        output_dir = options["output_dir"]
+        if not output_dir.is_dir():
+            raise CommandError(f"{output_dir} is not a directory.")
+
+        for path in archive_partitions(options["retention_months"], output_dir):
+            self.stdout.write(f"Archived to {path}.")
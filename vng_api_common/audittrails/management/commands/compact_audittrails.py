@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from ...compaction import DEFAULT_SNAPSHOT_INTERVAL, compact_audittrails
+
+
+class Command(BaseCommand):
+    help = (
+        "Replace the full snapshots of audit trail records with JSON-patch diffs, "
+        "keeping a full snapshot periodically."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--snapshot-interval",
+            type=int,
+            default=DEFAULT_SNAPSHOT_INTERVAL,
+            help="Keep the full snapshots of every n-th record of a resource.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of records to update per query.",
+        )
+
+    def handle(self, **options):
+        compacted = compact_audittrails(
+            snapshot_interval=options["snapshot_interval"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(f"Compacted {compacted} audit trail record(s).")
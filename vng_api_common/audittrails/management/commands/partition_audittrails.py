@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from ...partitioning import convert_to_partitioned, create_partitions, is_partitioned
+
+
+class Command(BaseCommand):
+    help = (
+        "Partition the audit trail table by month (PostgreSQL only) and create "
+        "the partitions for the upcoming months."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            help="Number of months to create partitions for in advance.",
+        )
+
+    def handle(self, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("Partitioning is only supported on PostgreSQL.")
+
+        if not is_partitioned():
+            convert_to_partitioned()
+            self.stdout.write("Converted the audit trail table to a partitioned table.")
+
+        created = create_partitions(months_ahead=options["months_ahead"])
+        for name in created:
+            self.stdout.write(f"Created partition {name}.")
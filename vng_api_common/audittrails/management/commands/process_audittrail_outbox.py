@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from ...sinks import process_outbox
+
+
+class Command(BaseCommand):
+    help = "Move the audit trail records from the outbox to the audit trail table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of records to write per transaction.",
+        )
+
+    def handle(self, **options):
+        total = 0
+        while processed := process_outbox(batch_size=options["batch_size"]):
+            total += processed
+
+        self.stdout.write(f"Processed {total} audit trail record(s).")
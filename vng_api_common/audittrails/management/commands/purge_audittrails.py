@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from ...purge import DEFAULT_CHUNK_SIZE, purge_audittrails
+
+
+class Command(BaseCommand):
+    help = "Delete the audit trails of main objects that were scheduled for purging."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of records to delete per query.",
+        )
+
+    def handle(self, **options):
+        deleted = purge_audittrails(chunk_size=options["chunk_size"])
+        self.stdout.write(f"Deleted {deleted} audit trail record(s).")
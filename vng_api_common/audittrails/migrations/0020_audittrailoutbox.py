@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:14
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audittrails', '0019_alter_audittrail_options'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditTrailOutbox',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('data', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='De velden van de audit regel.', verbose_name='data')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='created')),
+            ],
+            options={
+                'verbose_name': 'audit trail outbox entry',
+                'verbose_name_plural': 'audit trail outbox entries',
+                'ordering': ['pk'],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:16
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audittrails', '0020_audittrailoutbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='audittrail',
+            name='nieuw_patch',
+            field=models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='JSON-patch die de oude versie omzet naar de nieuwe versie.', null=True),
+        ),
+        migrations.AddField(
+            model_name='audittrail',
+            name='oud_patch',
+            field=models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='JSON-patch die de nieuwe versie uit de vorige audit regel van het object omzet naar de oude versie.', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='audittrail',
+            index=models.Index(fields=['resource_url'], name='audittrail_resource_url'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audittrails', '0021_audittrail_compaction'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='audittrail',
+            name='hoofd_object_uuid',
+            field=models.UUIDField(editable=False, help_text='De UUID uit de URL naar het hoofdobject.', null=True),
+        ),
+    ]
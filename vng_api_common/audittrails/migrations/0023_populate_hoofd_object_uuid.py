@@ -0,0 +1,54 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models, transaction
+
+from vng_api_common.utils import get_uuid_from_path
+
+BATCH_SIZE = 1000
+
+
+def populate_hoofd_object_uuid(apps, _) -> None:
+    AuditTrail = apps.get_model("audittrails", "AuditTrail")
+
+    trails = (
+        AuditTrail.objects.filter(hoofd_object_uuid__isnull=True)
+        .only("pk", "hoofd_object")
+        .order_by("pk")
+    )
+
+    batch = []
+    for trail in trails.iterator(chunk_size=BATCH_SIZE):
+        try:
+            trail.hoofd_object_uuid = get_uuid_from_path(trail.hoofd_object)
+        except ValueError:
+            continue
+
+        batch.append(trail)
+        if len(batch) >= BATCH_SIZE:
+            with transaction.atomic():
+                AuditTrail.objects.bulk_update(batch, ["hoofd_object_uuid"])
+            batch = []
+
+    if batch:
+        with transaction.atomic():
+            AuditTrail.objects.bulk_update(batch, ["hoofd_object_uuid"])
+
+
+class Migration(migrations.Migration):
+    # commit per batch and build the index without locking out writes, the audit
+    # trail table can be very large
+    atomic = False
+
+    dependencies = [
+        ("audittrails", "0022_audittrail_hoofd_object_uuid"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_hoofd_object_uuid, migrations.RunPython.noop),
+        AddIndexConcurrently(
+            model_name="audittrail",
+            index=models.Index(
+                fields=["hoofd_object_uuid", "aanmaakdatum"],
+                name="audittrail_hoofd_object_uuid",
+            ),
+        ),
+    ]
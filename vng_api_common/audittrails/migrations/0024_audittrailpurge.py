@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audittrails', '0023_populate_hoofd_object_uuid'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditTrailPurge',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hoofd_object', models.URLField(help_text='De URL naar het verwijderde hoofdobject.', max_length=1000, verbose_name='hoofd object')),
+                ('hoofd_object_uuid', models.UUIDField(db_index=True, null=True, verbose_name='hoofd object UUID')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='created')),
+            ],
+            options={
+                'verbose_name': 'audit trail purge',
+                'verbose_name_plural': 'audit trail purges',
+                'ordering': ['pk'],
+            },
+        ),
+    ]
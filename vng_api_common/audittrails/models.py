@@ -8,6 +8,19 @@ from django.utils.translation import gettext_lazy as _
 
 from ..constants import ComponentTypes
 from ..descriptors import GegevensGroepType
+from ..utils import get_uuid_from_path
+from .compaction import expand_audittrails
+
+
+class WijzigingenGegevensGroepType(GegevensGroepType):
+    """
+    Reconstruct the full ``oud`` and ``nieuw`` values of compacted records on access.
+    """
+
+    def __get__(self, obj, type=None):
+        if obj is not None and obj.is_compact:
+            expand_audittrails([obj])
+        return super().__get__(obj, type=type)
 
 
 class AuditTrail(models.Model):
@@ -41,6 +54,11 @@ class AuditTrail(models.Model):
     hoofd_object = models.URLField(
         max_length=1000, help_text=_("De URL naar het hoofdobject van een component.")
     )
+    hoofd_object_uuid = models.UUIDField(
+        null=True,
+        editable=False,
+        help_text=_("De UUID uit de URL naar het hoofdobject."),
+    )
     resource = models.CharField(
         max_length=50, help_text=_("Het type resource waarop de actie gebeurde.")
     )
@@ -73,6 +91,19 @@ class AuditTrail(models.Model):
         encoder=DjangoJSONEncoder,
         help_text=_("Volledige JSON body van het object na de actie."),
     )
+    oud_patch = models.JSONField(
+        null=True,
+        encoder=DjangoJSONEncoder,
+        help_text=_(
+            "JSON-patch die de nieuwe versie uit de vorige audit regel van het object "
+            "omzet naar de oude versie."
+        ),
+    )
+    nieuw_patch = models.JSONField(
+        null=True,
+        encoder=DjangoJSONEncoder,
+        help_text=_("JSON-patch die de oude versie omzet naar de nieuwe versie."),
+    )
     gebruikers_id = models.CharField(
         max_length=255,
         blank=True,
@@ -89,7 +120,7 @@ class AuditTrail(models.Model):
         blank=True,
         help_text=_("Toelichting waarom de handeling is uitgevoerd."),
     )
-    wijzigingen = GegevensGroepType(
+    wijzigingen = WijzigingenGegevensGroepType(
         {"oud": oud, "nieuw": nieuw}, optional=("oud", "nieuw"), none_for_empty=True
     )
 
@@ -100,5 +131,74 @@ class AuditTrail(models.Model):
                 fields=["hoofd_object"],
                 name="audittrail_hoofdobject_trgm",
                 opclasses=["gin_trgm_ops"],
-            )
+            ),
+            models.Index(
+                fields=["hoofd_object_uuid", "aanmaakdatum"],
+                name="audittrail_hoofd_object_uuid",
+            ),
+            # used to reconstruct compacted records, see .compaction
+            models.Index(fields=["resource_url"], name="audittrail_resource_url"),
         ]
+
+    @staticmethod
+    def get_hoofd_object_uuid(hoofd_object: str) -> str | None:
+        try:
+            return get_uuid_from_path(hoofd_object)
+        except ValueError:
+            return None
+
+    def set_hoofd_object_uuid(self) -> None:
+        self.hoofd_object_uuid = self.get_hoofd_object_uuid(self.hoofd_object)
+
+    def save(self, *args, **kwargs):
+        self.set_hoofd_object_uuid()
+        super().save(*args, **kwargs)
+
+    @property
+    def is_compact(self) -> bool:
+        return self.oud_patch is not None or self.nieuw_patch is not None
+
+
+class AuditTrailOutbox(models.Model):
+    """
+    Audit trail records waiting to be written to the :class:`AuditTrail` table.
+
+    Used by :class:`vng_api_common.audittrails.sinks.OutboxAuditSink`. The table has
+    no indexes apart from the primary key, which keeps the writes in the request
+    cheap.
+    """
+
+    data = models.JSONField(
+        _("data"),
+        encoder=DjangoJSONEncoder,
+        help_text=_("De velden van de audit regel."),
+    )
+    created = models.DateTimeField(_("created"), auto_now_add=True)
+
+    class Meta:
+        ordering = ["pk"]
+        verbose_name = _("audit trail outbox entry")
+        verbose_name_plural = _("audit trail outbox entries")
+
+
+class AuditTrailPurge(models.Model):
+    """
+    Tombstone for a deleted main object whose audit trails still need to be purged.
+
+    See :mod:`vng_api_common.audittrails.purge`.
+    """
+
+    hoofd_object = models.URLField(
+        _("hoofd object"),
+        max_length=1000,
+        help_text=_("De URL naar het verwijderde hoofdobject."),
+    )
+    hoofd_object_uuid = models.UUIDField(
+        _("hoofd object UUID"), null=True, db_index=True
+    )
+    created = models.DateTimeField(_("created"), auto_now_add=True)
+
+    class Meta:
+        ordering = ["pk"]
+        verbose_name = _("audit trail purge")
+        verbose_name_plural = _("audit trail purges")
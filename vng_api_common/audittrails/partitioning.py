@@ -0,0 +1,454 @@
+"""
+Optional monthly range partitioning of the audit trail table (PostgreSQL only).
+
+The audit trail table can be converted to a table partitioned on ``aanmaakdatum``
+with the ``partition_audittrails`` management command. The existing table is
+attached as the partition holding all the records up to the first new month, so
+no records are copied. Run the command periodically (e.g. monthly) to create the
+partitions for the upcoming months. Records without a matching partition end up in
+the default partition and are moved when their partition is created.
+
+The audit trails API only skips partitions for queries that are bounded on
+``aanmaakdatum``: the pages after the first page of the cursor pagination, and the
+``aanmaakdatum__gte``/``aanmaakdatum__lt`` filters of
+:class:`vng_api_common.audittrails.viewsets.AuditTrailViewSet`.
+
+Old partitions can then be archived with the ``archive_audittrails`` management
+command, which exports them to compressed JSONL files and drops them, instead of
+deleting the records one by one.
+
+.. warning:: PostgreSQL requires unique constraints on a partitioned table to
+   include the partition key. After the conversion, the primary key consists of
+   ``id`` and ``aanmaakdatum`` and ``uuid`` is indexed, but no longer unique at the
+   database level. The migrations of the ``audittrails`` app don't know about
+   this, so the conversion requires all of them to be applied, and new migrations
+   of the app have to be applied by hand on a partitioned table. The
+   ``vng_api_common.audittrails.E001`` system check blocks ``migrate`` until then.
+"""
+
+import gzip
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+
+from django.db import connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.db.models import Exists, F, OuterRef, Q, Subquery
+from django.utils import timezone
+
+from .compaction import expand_audittrails
+from .models import AuditTrail
+
+logger = logging.getLogger(__name__)
+
+LEGACY_SUFFIX = "_legacy"
+PARTITION_INDEX_SUFFIX = "_part"
+
+RE_CREATE_UNIQUE_INDEX = re.compile(r"^CREATE UNIQUE INDEX (\S+) ON ")
+
+RE_UPPER_BOUND = re.compile(r"TO \('([^']+)'\)")
+
+
+@dataclass
+class Partition:
+    name: str
+    # ``None`` for the default partition
+    upper_bound: datetime | None
+
+
+def get_table_name() -> str:
+    return AuditTrail._meta.db_table
+
+
+def get_month_start(moment: datetime, months: int = 0) -> datetime:
+    """
+    Return the start of the month (in UTC) of ``moment``, shifted by ``months``.
+    """
+    moment = moment.astimezone(dt_timezone.utc)
+    month_index = moment.year * 12 + (moment.month - 1) + months
+    return datetime(month_index // 12, month_index % 12 + 1, 1, tzinfo=dt_timezone.utc)
+
+
+def get_partition_name(month_start: datetime) -> str:
+    return f"{get_table_name()}_p{month_start:%Y%m}"
+
+
+def is_partitioned() -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+            [get_table_name()],
+        )
+        return cursor.fetchone() is not None
+
+
+def get_partitions() -> list[Partition]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = %s::regclass
+            ORDER BY child.relname
+            """,
+            [get_table_name()],
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, bound in rows:
+        match = RE_UPPER_BOUND.search(bound)
+        upper_bound = datetime.fromisoformat(match.group(1)) if match else None
+        partitions.append(Partition(name=name, upper_bound=upper_bound))
+    return partitions
+
+
+def _get_index_definitions(cursor, table: str) -> list[tuple[str, str, bool]]:
+    cursor.execute(
+        """
+        SELECT index_class.relname, pg_get_indexdef(pg_index.indexrelid),
+            pg_index.indisprimary
+        FROM pg_index
+        JOIN pg_class index_class ON index_class.oid = pg_index.indexrelid
+        WHERE pg_index.indrelid = %s::regclass
+        """,
+        [table],
+    )
+    return cursor.fetchall()
+
+
+def get_unapplied_migrations() -> list[str]:
+    """
+    Return the names of the migrations of the ``audittrails`` app that are not
+    applied yet.
+    """
+    executor = MigrationExecutor(connection)
+    plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+    return [
+        migration.name
+        for migration, _ in plan
+        if migration.app_label == AuditTrail._meta.app_label
+    ]
+
+
+def _truncate_name(name: str, suffix: str) -> str:
+    return f"{name[: 63 - len(suffix)]}{suffix}"
+
+
+def _prepare_legacy_table(boundary: datetime) -> None:
+    """
+    Do the work that scans the table before the table is locked for the conversion.
+
+    * a validated ``CHECK`` constraint matching the bound of the legacy partition
+      lets ``ATTACH PARTITION`` skip scanning the table
+    * the indexes required by the partitioned table are built in advance, so they
+      are attached rather than built: a unique index for the new primary key and
+      non-unique copies of the unique indexes
+
+    Outside of a transaction, this doesn't block writes to the table. Inside of a
+    transaction, the locks are held until it is committed.
+    """
+    table = get_table_name()
+    check = f"{table}_partition_bound"
+    quote = connection.ops.quote_name
+    # indexes can't be built concurrently inside of a transaction
+    concurrently = "" if connection.in_atomic_block else " CONCURRENTLY"
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"ALTER TABLE {quote(table)} DROP CONSTRAINT IF EXISTS {quote(check)}"
+        )
+        cursor.execute(
+            f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(check)} "
+            "CHECK (aanmaakdatum IS NOT NULL AND aanmaakdatum < %s) NOT VALID",
+            [boundary],
+        )
+        # validating only takes a SHARE UPDATE EXCLUSIVE lock
+        cursor.execute(f"ALTER TABLE {quote(table)} VALIDATE CONSTRAINT {quote(check)}")
+
+        cursor.execute(
+            f"CREATE UNIQUE INDEX{concurrently} IF NOT EXISTS "
+            f"{quote(_truncate_name(f'{table}_pkey', PARTITION_INDEX_SUFFIX))} "
+            f"ON {quote(table)} (id, aanmaakdatum)"
+        )
+        for index_name, definition, is_primary in _get_index_definitions(cursor, table):
+            if (
+                is_primary
+                or index_name.endswith(PARTITION_INDEX_SUFFIX)
+                or not RE_CREATE_UNIQUE_INDEX.match(definition)
+            ):
+                continue
+            partition_index_name = _truncate_name(index_name, PARTITION_INDEX_SUFFIX)
+            cursor.execute(
+                RE_CREATE_UNIQUE_INDEX.sub(
+                    f"CREATE INDEX{concurrently} IF NOT EXISTS "
+                    f"{quote(partition_index_name)} ON ",
+                    definition,
+                )
+            )
+
+
+def _get_boundary() -> datetime:
+    table = get_table_name()
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT MAX(aanmaakdatum) FROM {quote(table)}")
+        (max_aanmaakdatum,) = cursor.fetchone()
+    return get_month_start(max(max_aanmaakdatum or timezone.now(), timezone.now()), 1)
+
+
+def convert_to_partitioned() -> None:
+    """
+    Convert the audit trail table into a partitioned table.
+
+    The existing table becomes the partition for all records up to the start of the
+    month after the most recent record. Call this outside of a transaction, so
+    the existing table is only locked for the final swap.
+    """
+    if unapplied := get_unapplied_migrations():
+        raise RuntimeError(
+            "Apply the audittrails migrations before partitioning the audit trail "
+            f"table, unapplied: {', '.join(unapplied)}"
+        )
+
+    boundary = _get_boundary()
+    _prepare_legacy_table(boundary)
+    _swap_to_partitioned(boundary)
+
+
+@transaction.atomic
+def _swap_to_partitioned(boundary: datetime) -> None:
+    table = get_table_name()
+    legacy = f"{table}{LEGACY_SUFFIX}"
+    quote = connection.ops.quote_name
+    primary_key_index = _truncate_name(f"{table}_pkey", PARTITION_INDEX_SUFFIX)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {quote(table)} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {quote(table)}")
+        (max_id,) = cursor.fetchone()
+
+        # the primary key of the partition must match the partitioned table
+        index_definitions = _get_index_definitions(cursor, table)
+        for index_name, _, is_primary in index_definitions:
+            if is_primary:
+                cursor.execute(
+                    f"ALTER TABLE {quote(table)} DROP CONSTRAINT {quote(index_name)}"
+                )
+                cursor.execute(
+                    f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(index_name)} "
+                    f"PRIMARY KEY USING INDEX {quote(primary_key_index)}"
+                )
+        index_definitions = [
+            (index_name, definition, is_primary)
+            for index_name, definition, is_primary in _get_index_definitions(
+                cursor, table
+            )
+            if not index_name.endswith(PARTITION_INDEX_SUFFIX)
+        ]
+
+        # move the existing table (and its indexes) out of the way
+        cursor.execute(f"ALTER TABLE {quote(table)} RENAME TO {quote(legacy)}")
+        for index_name, _, _ in index_definitions:
+            cursor.execute(
+                f"ALTER INDEX {quote(index_name)} "
+                f"RENAME TO {quote(_truncate_name(index_name, LEGACY_SUFFIX))}"
+            )
+        cursor.execute(
+            f"ALTER TABLE {quote(legacy)} ALTER COLUMN id DROP IDENTITY IF EXISTS"
+        )
+        cursor.execute(f"ALTER TABLE {quote(legacy)} ALTER COLUMN id DROP DEFAULT")
+
+        cursor.execute(
+            f"CREATE TABLE {quote(table)} "
+            f"(LIKE {quote(legacy)} INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (aanmaakdatum)"
+        )
+        sequence = f"{table}_partitioned_id_seq"
+        cursor.execute(
+            f"CREATE SEQUENCE {quote(sequence)} START WITH %s OWNED BY {quote(table)}.id",
+            [max_id + 1],
+        )
+        cursor.execute(
+            f"ALTER TABLE {quote(table)} ALTER COLUMN id "
+            f"SET DEFAULT nextval('{sequence}'::regclass)"
+        )
+        cursor.execute(
+            f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(f'{table}_pkey')} "
+            "PRIMARY KEY (id, aanmaakdatum)"
+        )
+        for _, definition, is_primary in index_definitions:
+            if is_primary:
+                continue
+            # unique indexes must include the partition key
+            cursor.execute(definition.replace("CREATE UNIQUE INDEX", "CREATE INDEX", 1))
+
+        cursor.execute(
+            f"ALTER TABLE {quote(table)} ATTACH PARTITION {quote(legacy)} "
+            "FOR VALUES FROM (MINVALUE) TO (%s)",
+            [boundary],
+        )
+        cursor.execute(
+            f"ALTER TABLE {quote(legacy)} "
+            f"DROP CONSTRAINT {quote(f'{table}_partition_bound')}"
+        )
+        cursor.execute(
+            f"CREATE TABLE {quote(f'{table}_default')} "
+            f"PARTITION OF {quote(table)} DEFAULT"
+        )
+
+
+@transaction.atomic
+def create_partition(month_start: datetime) -> bool:
+    """
+    Create the partition for the month starting at ``month_start``.
+
+    Records in the default partition that belong to this month are moved to the new
+    partition. Returns ``False`` if the partition already exists.
+    """
+    table = get_table_name()
+    name = get_partition_name(month_start)
+    default = f"{table}_default"
+    month_end = get_month_start(month_start, 1)
+    quote = connection.ops.quote_name
+
+    if any(partition.name == name for partition in get_partitions()):
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE {quote(name)} (LIKE {quote(table)} INCLUDING DEFAULTS)"
+        )
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {quote(default)} "
+            "WHERE aanmaakdatum >= %s AND aanmaakdatum < %s RETURNING *) "
+            f"INSERT INTO {quote(name)} SELECT * FROM moved",
+            [month_start, month_end],
+        )
+        cursor.execute(
+            f"ALTER TABLE {quote(table)} ATTACH PARTITION {quote(name)} "
+            "FOR VALUES FROM (%s) TO (%s)",
+            [month_start, month_end],
+        )
+    return True
+
+
+def create_partitions(months_ahead: int = 3) -> list[str]:
+    """
+    Create the missing partitions from the current month up to ``months_ahead``.
+
+    Returns the names of the created partitions.
+    """
+    partitions = get_partitions()
+    bounds = [
+        partition.upper_bound
+        for partition in partitions
+        if partition.upper_bound is not None
+    ]
+    now = timezone.now()
+    # the (legacy) partitions may already cover the current month
+    month_start = max([get_month_start(now), *bounds])
+
+    created = []
+    while month_start <= get_month_start(now, months_ahead):
+        if create_partition(month_start):
+            created.append(get_partition_name(month_start))
+        month_start = get_month_start(month_start, 1)
+    return created
+
+
+def _rebase_chains(upper_bound: datetime) -> None:
+    """
+    Store full snapshots for the remaining compacted records that depend on records
+    before ``upper_bound``.
+
+    The records before ``upper_bound`` are about to be archived. Chains are ordered
+    by primary key, which doesn't have to follow ``aanmaakdatum`` (e.g. with the
+    outbox sink), so the remaining records between the archived records of a chain
+    and the first remaining record after them can no longer be reconstructed.
+    """
+    archived = AuditTrail.objects.filter(
+        aanmaakdatum__lt=upper_bound, resource_url=OuterRef("resource_url")
+    )
+    remaining = AuditTrail.objects.filter(aanmaakdatum__gte=upper_bound)
+
+    records = list(
+        remaining.filter(
+            resource_url__in=AuditTrail.objects.filter(
+                aanmaakdatum__lt=upper_bound
+            ).values("resource_url")
+        )
+        .annotate(
+            first_archived_pk=Subquery(archived.order_by("pk").values("pk")[:1]),
+            last_archived_pk=Subquery(archived.order_by("-pk").values("pk")[:1]),
+        )
+        .filter(Q(oud_patch__isnull=False) | Q(nieuw_patch__isnull=False))
+        .filter(pk__gt=F("first_archived_pk"))
+        # records after the first remaining record after the archived records are
+        # reconstructed from that record
+        .exclude(
+            Exists(
+                remaining.filter(
+                    resource_url=OuterRef("resource_url"),
+                    pk__gt=OuterRef("last_archived_pk"),
+                    pk__lt=OuterRef("pk"),
+                )
+            )
+        )
+    )
+    expand_audittrails(records)
+    for record in records:
+        record.oud_patch = record.nieuw_patch = None
+    AuditTrail.objects.bulk_update(
+        records, ["oud", "nieuw", "oud_patch", "nieuw_patch"], batch_size=500
+    )
+
+
+def export_partition(name: str, output_dir: Path, chunk_size: int = 1000) -> Path:
+    """
+    Export the records of a partition to a gzip compressed JSONL file.
+    """
+    quote = connection.ops.quote_name
+    path = output_dir / f"{name}.jsonl.gz"
+
+    with connection.cursor() as cursor, gzip.open(path, "wt") as output:
+        cursor.execute(
+            f"SELECT row_to_json(record)::text FROM {quote(name)} record ORDER BY id"
+        )
+        while rows := cursor.fetchmany(chunk_size):
+            for (row,) in rows:
+                output.write(f"{row}\n")
+
+    return path
+
+
+def archive_partitions(retention_months: int, output_dir: Path) -> list[Path]:
+    """
+    Export and drop the partitions with records older than the retention period.
+
+    Returns the paths of the exported files.
+    """
+    table = get_table_name()
+    cutoff = get_month_start(timezone.now(), -retention_months)
+    quote = connection.ops.quote_name
+
+    exported = []
+    for partition in get_partitions():
+        if partition.upper_bound is None or partition.upper_bound > cutoff:
+            continue
+
+        with transaction.atomic():
+            _rebase_chains(partition.upper_bound)
+            exported.append(export_partition(partition.name, output_dir))
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"ALTER TABLE {quote(table)} DETACH PARTITION {quote(partition.name)}"
+                )
+                cursor.execute(f"DROP TABLE {quote(partition.name)}")
+
+        logger.info("Archived audit trail partition %s", partition.name)
+
+    return exported
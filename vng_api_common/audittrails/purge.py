@@ -0,0 +1,108 @@
+"""
+Delete the audit trails of deleted main objects.
+
+Main objects with a long history can have many audit trail records. They are
+deleted in chunks, each with a single ``DELETE`` statement. A tombstone
+(:class:`AuditTrailPurge`) marks the main object as deleted, in the transaction
+that deletes the main object. The chunks are deleted after that transaction is
+committed, so every chunk is committed on its own, which keeps the locks and the
+write-ahead log of a single transaction small. The tombstone is deleted after the
+last chunk, the ``purge_audittrails`` management command finishes purges that
+were interrupted.
+
+When the ``AUDITTRAIL_DEFERRED_PURGE`` library setting is enabled, the deletion is
+not done during the request, but left to the ``purge_audittrails`` management
+command. The audit trails API only checks the tombstone when it has no records to
+list, so the records that are not purged yet are still listed.
+"""
+
+from django.db import connections, transaction
+from django.db.models import QuerySet
+
+from ..settings import get_setting
+from .models import AuditTrail, AuditTrailPurge
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def get_audittrails_for_main_object(main_object_url: str) -> QuerySet[AuditTrail]:
+    return AuditTrail.objects.filter(hoofd_object=main_object_url)
+
+
+def delete_audittrails(
+    queryset: QuerySet[AuditTrail], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """
+    Delete the audit trail records in chunks, with one ``DELETE`` statement per
+    chunk.
+
+    Outside of an atomic block, every chunk is committed on its own. Returns the
+    number of deleted records.
+    """
+    connection = connections[queryset.db]
+    quote = connection.ops.quote_name
+    chunk_sql, params = (
+        queryset.order_by().values("pk")[:chunk_size].query.sql_with_params()
+    )
+    sql = (
+        f"DELETE FROM {quote(AuditTrail._meta.db_table)} "
+        f"WHERE {quote(AuditTrail._meta.pk.column)} IN ({chunk_sql})"
+    )
+
+    deleted = 0
+    while True:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            count = cursor.rowcount
+        deleted += count
+        if count < chunk_size:
+            return deleted
+
+
+def _purge(purge: AuditTrailPurge, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    queryset = get_audittrails_for_main_object(purge.hoofd_object)
+    deleted = delete_audittrails(queryset, chunk_size=chunk_size)
+    purge.delete()
+    return deleted
+
+
+def destroy_related_audittrails(main_object_url: str) -> None:
+    """
+    Schedule the deletion of the audit trails of a deleted main object.
+
+    Unless the purge is deferred, the audit trails are deleted when the current
+    transaction is committed (or immediately, outside of a transaction).
+    """
+    purge = AuditTrailPurge.objects.create(
+        hoofd_object=main_object_url,
+        hoofd_object_uuid=AuditTrail.get_hoofd_object_uuid(main_object_url),
+    )
+    if get_setting("AUDITTRAIL_DEFERRED_PURGE"):
+        return
+
+    # an error leaves the tombstone for the purge_audittrails command, the main
+    # object is deleted already
+    transaction.on_commit(lambda: _purge(purge), robust=True)
+
+
+def is_purged(main_object_uuid: str) -> bool:
+    """
+    Check if the audit trails of the main object are scheduled for deletion.
+    """
+    if not get_setting("AUDITTRAIL_DEFERRED_PURGE"):
+        return False
+    return AuditTrailPurge.objects.filter(hoofd_object_uuid=main_object_uuid).exists()
+
+
+def purge_audittrails(chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Delete the audit trails of all the scheduled main objects.
+
+    The tombstone of a main object is deleted after all of its audit trails, so an
+    interrupted purge is picked up again by the next run. Returns the number of
+    deleted records.
+    """
+    deleted = 0
+    for purge in AuditTrailPurge.objects.order_by("pk").iterator():
+        deleted += _purge(purge, chunk_size=chunk_size)
+    return deleted
@@ -0,0 +1,167 @@
+"""
+Sinks that persist the audit trail records created by the viewset mixins.
+
+The sink is selected with the ``AUDITTRAIL_SINK`` library setting (see
+:ref:`ref_settings`), which takes the dotted path to an :class:`AuditSink`
+subclass. Writing each record directly is the default.
+"""
+
+import threading
+import weakref
+from functools import lru_cache
+from typing import Any
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from ..settings import get_setting
+from .models import AuditTrail, AuditTrailOutbox
+
+_buffers = threading.local()
+
+
+class AuditSink:
+    """
+    Base class for audit trail sinks.
+    """
+
+    def write(self, trail: AuditTrail) -> None:
+        raise NotImplementedError("You must implement `write`")
+
+
+class DirectAuditSink(AuditSink):
+    """
+    Save every audit trail record immediately.
+    """
+
+    def write(self, trail: AuditTrail) -> None:
+        trail.save()
+
+
+class _AuditTrailBuffer:
+    def __init__(self, using: str | None, batch_size: int):
+        self.using = using
+        self.batch_size = batch_size
+        self.trails: list[AuditTrail] = []
+
+    def flush(self) -> None:
+        trails, self.trails = self.trails, []
+        # ``bulk_create`` doesn't call ``save``
+        for trail in trails:
+            trail.set_hoofd_object_uuid()
+        AuditTrail.objects.using(self.using).bulk_create(
+            trails, batch_size=self.batch_size
+        )
+
+
+class BufferedAuditSink(AuditSink):
+    """
+    Collect the audit trail records and write them in bulk on transaction commit.
+
+    Outside of a transaction, records are saved immediately. The records are
+    collected per savepoint, with an ``on_commit`` callback per buffer, so the
+    records of a rolled back transaction or savepoint are discarded along with the
+    callback.
+    """
+
+    batch_size = 500
+
+    def __init__(self, using: str | None = None):
+        self.using = using
+
+    def _get_buffer(self, connection) -> _AuditTrailBuffer:
+        # the pending ``on_commit`` callback is the only strong reference to a
+        # buffer, so a buffer disappears once it is flushed or its callback is
+        # discarded by a rollback
+        buffers = getattr(_buffers, "buffers", None)
+        if buffers is None:
+            buffers = _buffers.buffers = weakref.WeakValueDictionary()
+
+        key = (connection.alias, *connection.savepoint_ids)
+        buffer = buffers.get(key)
+        if buffer is None:
+            buffer = _AuditTrailBuffer(using=self.using, batch_size=self.batch_size)
+            buffers[key] = buffer
+            connection.on_commit(buffer.flush)
+        return buffer
+
+    def write(self, trail: AuditTrail) -> None:
+        connection = transaction.get_connection(self.using)
+        if not connection.in_atomic_block:
+            trail.save(using=self.using)
+            return
+
+        self._get_buffer(connection).trails.append(trail)
+
+
+def serialize_audittrail(trail: AuditTrail) -> dict[str, Any]:
+    return {
+        field.attname: field.value_from_object(trail)
+        for field in AuditTrail._meta.concrete_fields
+        if not field.primary_key
+    }
+
+
+def deserialize_audittrail(data: dict[str, Any]) -> AuditTrail:
+    values = {}
+    for field in AuditTrail._meta.concrete_fields:
+        if field.attname in data:
+            values[field.attname] = field.to_python(data[field.attname])
+    return AuditTrail(**values)
+
+
+class OutboxAuditSink(AuditSink):
+    """
+    Write the audit trail records to the :class:`AuditTrailOutbox` table.
+
+    The records are moved to the audit trail table by the
+    ``process_audittrail_outbox`` management command, which decouples the index
+    maintenance of the (large) audit trail table from the API requests.
+    """
+
+    def write(self, trail: AuditTrail) -> None:
+        # record the moment of the action rather than the moment of processing
+        trail.aanmaakdatum = timezone.now()
+        AuditTrailOutbox.objects.create(data=serialize_audittrail(trail))
+
+
+def process_outbox(batch_size: int = 500) -> int:
+    """
+    Move a batch of records from the outbox to the audit trail table.
+
+    Rows locked by concurrent workers are skipped. Returns the number of processed
+    records.
+    """
+    with transaction.atomic():
+        entries = list(
+            AuditTrailOutbox.objects.select_for_update(skip_locked=True).order_by("pk")[
+                :batch_size
+            ]
+        )
+        if not entries:
+            return 0
+
+        trails = [deserialize_audittrail(entry.data) for entry in entries]
+        for trail in trails:
+            trail.set_hoofd_object_uuid()
+        timestamps = [trail.aanmaakdatum for trail in trails]
+        AuditTrail.objects.bulk_create(trails)
+
+        # ``auto_now`` overwrites the timestamps on insert, so restore them
+        for trail, timestamp in zip(trails, timestamps):
+            trail.aanmaakdatum = timestamp
+        AuditTrail.objects.bulk_update(trails, ["aanmaakdatum"])
+
+        AuditTrailOutbox.objects.filter(pk__in=[entry.pk for entry in entries]).delete()
+    return len(entries)
+
+
+@lru_cache(maxsize=None)
+def _import_sink(dotted_path: str) -> type[AuditSink]:
+    return import_string(dotted_path)
+
+
+def get_audit_sink() -> AuditSink:
+    sink_class = _import_sink(get_setting("AUDITTRAIL_SINK"))
+    return sink_class()
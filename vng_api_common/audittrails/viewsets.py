@@ -1,19 +1,24 @@
 import logging
+import uuid
 from typing import TYPE_CHECKING, cast
 
 from django.db import transaction
 from django.http import Http404
 
 from rest_framework import serializers, viewsets
+from rest_framework.response import Response
 
 from ..compat import get_header
 from ..constants import CommonResourceAction
+from ..filters_backend import Backend
 from ..permissions import AuthScopesRequired
 from ..utils import get_uuid_from_path
 from ..viewsets import NestedViewSetMixin
 from .api.scopes import SCOPE_AUDITTRAILS_LEZEN
 from .api.serializers import AuditTrailSerializer
 from .models import AuditTrail
+from .purge import destroy_related_audittrails, is_purged
+from .sinks import get_audit_sink
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +29,27 @@ if TYPE_CHECKING:
 
 class AuditTrailMixin:
     audit = None
+    _audittrail_object = None
+
+    def get_object(self):
+        """
+        Re-use the object that was fetched to capture the version before the edit.
+
+        This avoids running the lookup and permission checks twice for the same
+        request. The action modifies this instance, so everything that is recorded
+        from the version before the edit must be taken before the action runs.
+        """
+        if self._audittrail_object is not None:
+            return self._audittrail_object
+        return super().get_object()  # type: ignore
+
+    def get_audittrail_object(self):
+        """
+        Fetch the object and cache it for the remainder of the action.
+        """
+        instance = self.get_object()
+        self._audittrail_object = instance
+        return instance
 
     def get_audittrail_main_object_url(self, data, main_resource):
         """
@@ -108,7 +134,7 @@ class AuditTrailMixin:
             oud=version_before_edit,
             nieuw=version_after_edit,
         )
-        trail.save()
+        get_audit_sink().write(trail)
 
 
 class AuditTrailCreateMixin(AuditTrailMixin):
@@ -140,13 +166,12 @@ class AuditTrailCreateMixin(AuditTrailMixin):
 
 
 class AuditTrailUpdateMixin(AuditTrailMixin):
-    # TODO: cache serializer(s) via perform_update?
-
     def update(self, request, *args, **kwargs):
         # Retrieve the data stored in the object before updating
-        instance = self.get_object()  # type: ignore
+        instance = self.get_audittrail_object()
         serializer = self.get_serializer(instance)  # type: ignore
         version_before_edit = serializer.data
+        unique_representation = instance.unique_representation()
 
         action = (
             CommonResourceAction.partial_update
@@ -154,46 +179,52 @@ class AuditTrailUpdateMixin(AuditTrailMixin):
             else CommonResourceAction.update
         )
 
-        response = super().update(request, *args, **kwargs)  # type: ignore
+        try:
+            response = super().update(request, *args, **kwargs)  # type: ignore
+        finally:
+            self._audittrail_object = None
         self.create_audittrail(
             response.status_code,
             action,
             version_before_edit=version_before_edit,
             version_after_edit=response.data,
-            unique_representation=instance.unique_representation(),
+            unique_representation=unique_representation,
         )
         return response
 
 
 class AuditTrailDestroyMixin(AuditTrailMixin):
-    # TODO: cache serializer(s) via perform_update?
-
     def destroy(self, request, *args, **kwargs):
-        # Retrieve the data stored in the object before updating
-        instance = self.get_object()  # type: ignore
+        # Retrieve the data stored in the object before deleting
+        instance = self.get_audittrail_object()
         serializer = self.get_serializer(instance)  # type: ignore
         version_before_edit = serializer.data
+        unique_representation = instance.unique_representation()
+
+        try:
+            # If the resource being deleted is the main resource, delete all the
+            # audittrails associated with it
+            if self.basename == self.audit.main_resource:  # type: ignore
+                with transaction.atomic():
+                    response = super().destroy(request, *args, **kwargs)  # type: ignore
+                    self._destroy_related_audittrails(version_before_edit["url"])
+                    return response
 
-        # If the resource being deleted is the main resource, delete all the
-        # audittrails associated with it
-        if self.basename == self.audit.main_resource:  # type: ignore
-            with transaction.atomic():
-                response = super().destroy(request, *args, **kwargs)  # type: ignore
-                self._destroy_related_audittrails(version_before_edit["url"])
-                return response
-        else:
             response = super().destroy(request, *args, **kwargs)  # type: ignore
-            self.create_audittrail(
-                response.status_code,
-                CommonResourceAction.destroy,
-                version_before_edit=version_before_edit,
-                version_after_edit=None,
-                unique_representation=instance.unique_representation(),
-            )
-            return response
+        finally:
+            self._audittrail_object = None
+
+        self.create_audittrail(
+            response.status_code,
+            CommonResourceAction.destroy,
+            version_before_edit=version_before_edit,
+            version_after_edit=None,
+            unique_representation=unique_representation,
+        )
+        return response
 
     def _destroy_related_audittrails(self, main_object_url):
-        AuditTrail.objects.filter(hoofd_object=main_object_url).delete()
+        destroy_related_audittrails(main_object_url)
 
 
 class AuditTrailViewsetMixin(
@@ -215,10 +246,18 @@ class AuditTrailViewSet(NestedViewSetMixin, viewsets.ReadOnlyModelViewSet):
 
         class ZaakAuditTrailViewset(AuditTrailViewset):
             main_resource_lookup_field = 'zaak_uuid'
+
+    The audit trails are not paginated by default. Set the ``pagination_class`` to
+    :class:`vng_api_common.pagination.DynamicCursorPagination` to page through them
+    in order of ``aanmaakdatum``. The audit trails can be filtered on a range of
+    ``aanmaakdatum``, which limits the partitions that are scanned of a partitioned
+    audit trail table (see :mod:`vng_api_common.audittrails.partitioning`).
     """
 
     queryset = AuditTrail.objects.all().order_by("aanmaakdatum")
     serializer_class = AuditTrailSerializer
+    filter_backends = (Backend,)
+    filterset_fields = {"aanmaakdatum": ["gte", "lt"]}
     lookup_field = "uuid"
     permission_classes = (AuthScopesRequired,)
     required_scopes = {
@@ -232,22 +271,45 @@ class AuditTrailViewSet(NestedViewSetMixin, viewsets.ReadOnlyModelViewSet):
         if not self.kwargs:  # this happens during schema generation, and causes crashes
             return self.queryset.all()
 
-        qs = super().get_queryset()
-
         if not self.main_resource_lookup_field:
             raise ValueError("main_resource_lookup_field must be set in subclasses")
 
+        return super().get_queryset()
+
+    def _get_main_object_uuid(self) -> str | None:
         identifier = self.kwargs.get(self.main_resource_lookup_field)
-        if identifier:
-            filtered = qs.filter(hoofd_object__contains=identifier)
-            if filtered.exists():
-                return filtered
-            else:
+        try:
+            uuid.UUID(identifier)
+        except (TypeError, ValueError):
+            return None
+        return identifier
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        page = self.paginate_queryset(queryset)
+        trails = page if page is not None else list(queryset)
+
+        # an empty page can be past the end of the audit trails, or the result of
+        # the filters - only respond with a 404 if the main object has no audit
+        # trails at all, or they are being purged
+        if not trails and self.kwargs.get(self.main_resource_lookup_field):
+            main_object_uuid = self._get_main_object_uuid()
+            if (
+                main_object_uuid and is_purged(main_object_uuid)
+            ) or not self.get_queryset().exists():
                 raise Http404
-        return qs
+
+        serializer = self.get_serializer(trails, many=True)
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
 
     @property
     def parent_lookup_kwargs(self):
-        return {
-            self.main_resource_lookup_field: "hoofd_object__contains",
-        }
+        if self._get_main_object_uuid() is not None:
+            lookup = "hoofd_object_uuid"
+        else:
+            # not a UUID, fall back to matching the URL of the main object
+            lookup = "hoofd_object__contains"
+        return {self.main_resource_lookup_field: lookup}
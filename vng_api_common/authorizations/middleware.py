@@ -18,6 +18,7 @@ from vng_api_common.client import ClientError, to_internal_data
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
 
 from ..models import JWTSecret
+from ..scopes import Scope, scopes_to_mask
 from ..utils import get_uuid_from_path
 from .models import Applicatie, AuthorizationsConfig, Autorisatie
 from .serializers import ApplicatieUuidSerializer
@@ -251,12 +252,14 @@ class JWTAuth:
         return base.filter(**{name: value})
 
     def has_auth(
-        self, scopes: list[str], component: str | None = None, **fields
+        self, scopes: Scope | None, component: str | None = None, **fields
     ) -> bool:
         if scopes is None:
             return False
 
-        scopes_provided = set()
+        # compile before converting the provided scopes, so all labels are known
+        compiled = scopes.compiled
+        scopes_provided = 0
         config = AuthorizationsConfig.get_solo()
         if component is None:
             component = config.component
@@ -280,9 +283,9 @@ class JWTAuth:
                     )
 
             for autorisatie in autorisaties:
-                scopes_provided.update(autorisatie.scopes)
+                scopes_provided |= scopes_to_mask(autorisatie.scopes)
 
-        return scopes.is_contained_in(list(scopes_provided))  # type: ignore[attr-defined]
+        return compiled.matches(scopes_provided)
 
 
 class AuthMiddleware:
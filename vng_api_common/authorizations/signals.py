@@ -0,0 +1,11 @@
+"""
+Signals sent when the local copy of the authorizations changes.
+"""
+
+from django.dispatch import Signal
+
+#: Sent once per batch of applicaties synchronized from the Autorisaties API,
+#: after the transaction is committed. Receives the ``uuids`` of the updated and
+#: deleted applicaties, which makes it the place to invalidate caches of
+#: authorizations.
+applicaties_synchronized = Signal()
@@ -13,11 +13,11 @@ from django.db import DatabaseError, models, transaction
 from django.http import Http404, HttpRequest
 from django.utils.module_loading import import_string
 
-from djangorestframework_camel_case.render import CamelCaseJSONRenderer
 from rest_framework import serializers
 from rest_framework.request import Request
 from rest_framework.settings import api_settings
 
+from ..renderers import CamelCaseJSONRenderer
 from ..utils import get_domain, get_resource_for_path
 from .registry import MODEL_SERIALIZERS
 
@@ -90,7 +90,8 @@ def calculate_etag(instance: models.Model) -> str:
     """
     serializer = get_etag_serializer(instance)
 
-    # render the output to json, which is used as hash input
+    # render the output to json, which is used as hash input - always with the
+    # standard library, so the stored values don't depend on the installed extras
     renderer = CamelCaseJSONRenderer()
     rendered = renderer.render(serializer.data, "application/json")
 
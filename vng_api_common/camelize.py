@@ -0,0 +1,146 @@
+"""
+Translation of keys between snake_case and camelCase.
+
+Drop-in replacement for :func:`djangorestframework_camel_case.util.camelize` and
+:func:`djangorestframework_camel_case.util.underscoreize` with the same output.
+The keys of API payloads come from a limited set of serializer field names, so
+the translations of the keys are cached (in a bounded cache) instead of running
+the regular expressions for every key of every object. Plain dicts are built
+instead of ``OrderedDict`` instances.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+from django.core.files import File
+from django.http import QueryDict
+from django.utils.datastructures import MultiValueDict
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+
+from djangorestframework_camel_case.util import camel_to_underscore, camelize_re
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+from .utils import _underscore_to_camel
+
+KEY_CACHE_SIZE = 4096
+
+SCALAR_TYPES = (str, int, float, bool, type(None))
+UNDERSCOREIZE_LEAF_TYPES = (*SCALAR_TYPES, File)
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def camelize_key(key: str) -> str:
+    if "_" not in key:
+        return key
+    return camelize_re.sub(_underscore_to_camel, key)
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def underscoreize_key(key: str, no_underscore_before_number: bool = False) -> str:
+    return camel_to_underscore(
+        key, no_underscore_before_number=no_underscore_before_number
+    )
+
+
+def _is_iterable(obj) -> bool:
+    try:
+        iter(obj)
+    except TypeError:
+        return False
+    return True
+
+
+def camelize(data: Any, ignore_fields=None, ignore_keys=None, **options) -> Any:
+    """
+    Convert the keys of (nested) dicts to camelCase.
+    """
+    if isinstance(data, SCALAR_TYPES):
+        return data
+    if isinstance(data, Promise):
+        return force_str(data)
+
+    if isinstance(data, dict):
+        if isinstance(data, ReturnDict):
+            new_dict = ReturnDict(serializer=data.serializer)
+        else:
+            new_dict = {}
+
+        for key, value in data.items():
+            if isinstance(key, Promise):
+                key = force_str(key)
+            new_key = camelize_key(key) if isinstance(key, str) else key
+
+            if ignore_fields and (key in ignore_fields or new_key in ignore_fields):
+                result = value
+            else:
+                result = camelize(value, ignore_fields, ignore_keys)
+
+            if ignore_keys and (key in ignore_keys or new_key in ignore_keys):
+                new_dict[key] = result
+            else:
+                new_dict[new_key] = result
+        return new_dict
+
+    if isinstance(data, list | tuple) or _is_iterable(data):
+        return [camelize(item, ignore_fields, ignore_keys) for item in data]
+    return data
+
+
+def underscoreize(
+    data: Any,
+    ignore_fields=None,
+    ignore_keys=None,
+    no_underscore_before_number: bool = False,
+    **options,
+) -> Any:
+    """
+    Convert the keys of (nested) dicts, query dicts and multi value dicts to
+    snake_case.
+    """
+    if isinstance(data, UNDERSCOREIZE_LEAF_TYPES):
+        return data
+
+    if isinstance(data, dict):
+        if type(data) is MultiValueDict:
+            new_data = MultiValueDict()
+            for key in data:
+                new_data.setlist(
+                    underscoreize_key(key, no_underscore_before_number),
+                    data.getlist(key),
+                )
+            return new_data
+
+        items = data.lists() if isinstance(data, QueryDict) else data.items()
+        new_dict = {}
+        for key, value in items:
+            if isinstance(key, str):
+                new_key = underscoreize_key(key, no_underscore_before_number)
+            else:
+                new_key = key
+
+            if ignore_fields and (key in ignore_fields or new_key in ignore_fields):
+                result = value
+            else:
+                result = underscoreize(
+                    value, ignore_fields, ignore_keys, no_underscore_before_number
+                )
+
+            if ignore_keys and (key in ignore_keys or new_key in ignore_keys):
+                new_dict[key] = result
+            else:
+                new_dict[new_key] = result
+
+        if isinstance(data, QueryDict):
+            new_query = QueryDict(mutable=True)
+            for key, value in new_dict.items():
+                new_query.setlist(key, value)
+            return new_query
+        return new_dict
+
+    if isinstance(data, list | tuple) or _is_iterable(data):
+        return [
+            underscoreize(item, ignore_fields, ignore_keys, no_underscore_before_number)
+            for item in data
+        ]
+    return data
@@ -1,6 +1,8 @@
 import re
 
-from django.core.checks import Warning, register
+from django.apps import apps
+from django.core.checks import Error, Tags, Warning, register
+from django.db import DEFAULT_DB_ALIAS, connection
 from django.db.models import Choices
 
 from .utils import get_subclasses
@@ -40,3 +42,37 @@ def check_lowercased_constants(app_configs, **kwargs):
             )
 
     return warnings
+
+
+@register(Tags.database)
+def check_partitioned_audittrails_migrations(app_configs, databases=None, **kwargs):
+    """
+    Check that no migrations are applied to a partitioned audit trail table.
+
+    The migrations don't know that the primary key and unique constraints changed.
+    """
+    if (
+        not databases
+        or DEFAULT_DB_ALIAS not in databases
+        or connection.vendor != "postgresql"
+        or not apps.is_installed("vng_api_common.audittrails")
+    ):
+        return []
+
+    from .audittrails.partitioning import get_unapplied_migrations, is_partitioned
+
+    if not is_partitioned() or not (unapplied := get_unapplied_migrations()):
+        return []
+
+    return [
+        Error(
+            "The audit trail table is partitioned, the audittrails migrations "
+            f"{', '.join(unapplied)} can't be applied automatically",
+            hint=(
+                "Apply the changes to the partitioned table by hand and mark the "
+                "migrations as applied with `migrate audittrails --fake "
+                "--skip-checks`."
+            ),
+            id="vng_api_common.audittrails.E001",
+        )
+    ]
@@ -5,7 +5,8 @@ Interface to get a client object for a given URL.
 import logging
 
 from ape_pie import APIClient
-from requests import JSONDecodeError, RequestException, Response
+from requests import JSONDecodeError, Request, RequestException, Response
+from requests.utils import default_headers
 
 logger = logging.getLogger(__name__)
 
@@ -60,11 +61,15 @@ def get_client(
     """
     Get a client instance for the given URL.
     If no suitable client is found, ``None`` is returned.
+
+    Without ``client_kwargs``, the client of the service is shared by all callers
+    in the process, see :mod:`vng_api_common.client_registry`.
     """
     from zgw_consumers.client import build_client
-    from zgw_consumers.models import Service
 
-    service: Service | None = Service.get_service(url)
+    from .client_registry import registry
+
+    service = registry.get_service(url)
 
     if not service:
         logger.warning(f"No service configured for {url}")
@@ -72,4 +77,30 @@ def get_client(
             raise NoServiceConfigured(f"{url} API should be added to Service model")
         return
 
-    return build_client(service, client_factory=Client, **client_kwargs)
+    if client_kwargs:
+        return build_client(service, client_factory=Client, **client_kwargs)
+    return registry.get_client(service)
+
+
+def get_auth_headers(url: str) -> dict[str, str]:
+    """
+    Get the headers to authenticate against the service configured for the URL.
+
+    Meant for the ``get_auth`` argument of
+    :class:`vng_api_common.validators.URLValidator`. Returns an empty dict if no
+    service is configured for the URL.
+    """
+    from .client_registry import registry
+
+    service = registry.get_service(url)
+    if not service:
+        return {}
+
+    client = registry.get_client(service)
+    request = client.prepare_request(Request("GET", url))
+    defaults = default_headers()
+    return {
+        name: value
+        for name, value in request.headers.items()
+        if defaults.get(name) != value
+    }
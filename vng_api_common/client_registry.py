@@ -0,0 +1,220 @@
+"""
+Process-wide registry of API clients, see :func:`vng_api_common.client.get_client`.
+
+Building a client for a :class:`zgw_consumers.models.Service` creates a new
+``requests.Session`` with its own connection pool, so every call would pay for
+new TCP connections and TLS handshakes. The registry keeps one client per service,
+with a tuned connection pool, so keep-alive connections are reused.
+
+Resolving the service of a URL uses a prefix trie over the normalized ``api_root``
+of the services (:class:`ServiceIndex`), loaded once instead of querying the
+services for every URL.
+
+The index and the clients are dropped when a service changes, again when the
+change is committed, and after ``CLIENT_REGISTRY_TIMEOUT`` seconds (see
+:ref:`ref_settings`) to pick up changes made by other processes. While a
+transaction has uncommitted changes to the services, the registry is bypassed on
+its connection until the outermost atomic block exits, so nothing is cached that
+may be rolled back. Tests can start from an empty registry with
+:func:`clear_registry`.
+"""
+
+import threading
+import time
+from collections.abc import Iterable
+from urllib.parse import urlsplit, urlunsplit
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models.signals import post_delete, post_save
+
+from requests.adapters import HTTPAdapter
+from zgw_consumers.client import build_client
+from zgw_consumers.constants import AuthTypes
+from zgw_consumers.models import Service
+
+from .client import Client
+from .settings import get_setting
+
+_SERVICE = object()
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Lowercase the scheme and host of a URL, and drop the default port.
+    """
+    parsed = urlsplit(url)
+    netloc = parsed.netloc.lower()
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+    if port is not None and port == _DEFAULT_PORTS.get(parsed.scheme.lower()):
+        netloc = netloc.rsplit(":", 1)[0]
+    return urlunsplit(parsed._replace(scheme=parsed.scheme.lower(), netloc=netloc))
+
+
+class ServiceIndex:
+    """
+    Find the service with the longest ``api_root`` that is a prefix of a URL.
+
+    The normalized ``api_root`` values are compiled in a character trie, so a lookup
+    takes one step per character of the URL, regardless of the number of services.
+    The index is not modified after it is built, so it can be shared by threads.
+    """
+
+    def __init__(self, services: Iterable[Service]):
+        self._root: dict = {}
+        for service in services:
+            node = self._root
+            for char in normalize_url(service.api_root):
+                node = node.setdefault(char, {})
+            node.setdefault(_SERVICE, service)
+
+    def resolve(self, url: str) -> Service | None:
+        match = None
+        node = self._root
+        for char in normalize_url(url):
+            node = node.get(char)
+            if node is None:
+                break
+            match = node.get(_SERVICE, match)
+        return match
+
+
+class PooledClient(Client):
+    """
+    A client that is shared between callers and keeps its connections open.
+
+    :class:`ape_pie.APIClient` closes the session after every request outside of
+    a ``with`` block, and when the block exits. Shared clients leave that to the
+    registry, so using one in a ``with`` block is a no-op.
+    """
+
+    _in_context_manager = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class ClientRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index: ServiceIndex | None = None
+        self._loaded_at = 0.0
+        # service pk -> (client, moment the client expires)
+        self._clients: dict[int, tuple[PooledClient, float]] = {}
+        # per thread: database alias -> the outermost atomic block of the
+        # transaction with uncommitted changes to the services
+        self._uncommitted = threading.local()
+
+    @property
+    def is_enabled(self) -> bool:
+        return bool(get_setting("CLIENT_REGISTRY_TIMEOUT")) and (
+            not self._has_uncommitted_changes()
+        )
+
+    def _has_uncommitted_changes(self) -> bool:
+        blocks: dict = getattr(self._uncommitted, "blocks", {})
+        for alias, block in list(blocks.items()):
+            atomic_blocks = connections[alias].atomic_blocks
+            if atomic_blocks and atomic_blocks[0] is block:
+                return True
+            # the transaction was committed or rolled back
+            del blocks[alias]
+        return False
+
+    def _is_expired(self) -> bool:
+        timeout = get_setting("CLIENT_REGISTRY_TIMEOUT")
+        return time.monotonic() - self._loaded_at > timeout
+
+    def _get_index(self) -> ServiceIndex:
+        with self._lock:
+            if self._index is None or self._is_expired():
+                self._index = ServiceIndex(Service.objects.all())
+                self._clients = {}
+                self._loaded_at = time.monotonic()
+            return self._index
+
+    def get_service(self, url: str) -> Service | None:
+        if not self.is_enabled:
+            return Service.get_service(url)
+        return self._get_index().resolve(url)
+
+    def get_client(self, service: Service) -> Client:
+        if not self.is_enabled:
+            return build_client(service, client_factory=Client)
+
+        with self._lock:
+            client, expires = self._clients.get(service.pk, (None, 0.0))
+            if client is None or time.monotonic() > expires:
+                client = build_pooled_client(service)
+                self._clients[service.pk] = (client, get_expiry(service))
+            return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._index = None
+            self._clients = {}
+
+    def service_changed(self, using: str | None = None) -> None:
+        self.clear()
+
+        connection = connections[using or DEFAULT_DB_ALIAS]
+        if connection.in_atomic_block:
+            if not hasattr(self._uncommitted, "blocks"):
+                self._uncommitted.blocks = {}
+            self._uncommitted.blocks[connection.alias] = connection.atomic_blocks[0]
+        # other threads may have loaded the old services in the meantime
+        transaction.on_commit(self.clear, using=using)
+
+
+def get_expiry(service: Service) -> float:
+    """
+    Rebuild clients halfway the validity of their JWT, which is generated once.
+    """
+    lifetime = get_setting("CLIENT_REGISTRY_TIMEOUT")
+    if service.auth_type == AuthTypes.zgw and service.jwt_valid_for:
+        lifetime = min(lifetime, service.jwt_valid_for / 2)
+    return time.monotonic() + lifetime
+
+
+def build_pooled_client(service: Service) -> PooledClient:
+    """
+    Build a client with a connection pool sized for sharing between threads.
+    """
+    client = build_client(service, client_factory=PooledClient)
+    adapter = HTTPAdapter(
+        pool_connections=get_setting("CLIENT_POOL_CONNECTIONS"),
+        pool_maxsize=get_setting("CLIENT_POOL_MAXSIZE"),
+    )
+    client.mount("https://", adapter)
+    client.mount("http://", adapter)
+    return client
+
+
+registry = ClientRegistry()
+
+
+def clear_registry() -> None:
+    """
+    Drop the cached services and clients, e.g. between tests.
+    """
+    registry.clear()
+
+
+def invalidate_registry(sender, instance, using=None, **kwargs) -> None:
+    registry.service_changed(using=using)
+
+
+def connect_signals() -> None:
+    post_save.connect(
+        invalidate_registry, sender=Service, dispatch_uid="client_registry_save"
+    )
+    post_delete.connect(
+        invalidate_registry, sender=Service, dispatch_uid="client_registry_delete"
+    )
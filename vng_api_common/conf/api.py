@@ -24,12 +24,8 @@ SECURITY_DEFINITION_NAME = "JWT-Claims"
 
 BASE_REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "vng_api_common.schema.AutoSchema",
-    "DEFAULT_RENDERER_CLASSES": (
-        "djangorestframework_camel_case.render.CamelCaseJSONRenderer",
-    ),
-    "DEFAULT_PARSER_CLASSES": (
-        "djangorestframework_camel_case.parser.CamelCaseJSONParser",
-    ),
+    "DEFAULT_RENDERER_CLASSES": ("vng_api_common.renderers.CamelCaseORJSONRenderer",),
+    "DEFAULT_PARSER_CLASSES": ("vng_api_common.parsers.CamelCaseORJSONParser",),
     # there is no authentication of 'end-users', only authorization (via JWT)
     # of applications
     "DEFAULT_AUTHENTICATION_CLASSES": (),
@@ -1,9 +1,12 @@
 import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
 from urllib.parse import urlparse
 
-from django.core.exceptions import ValidationError
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.core.validators import URLValidator
 from django.db import models
+from django.db.models import Q
 from django.forms.widgets import URLInput
 from django.utils.translation import gettext_lazy as _
 
@@ -11,12 +14,101 @@ from django_filters import fields, filters
 from django_filters.constants import EMPTY_VALUES
 
 from .constants import FILTER_URL_DID_NOT_RESOLVE
-from .utils import NotAViewSet, get_resource_for_path
+from .utils import (
+    LookupPlan,
+    NotAViewSet,
+    _get_other_kwargs,
+    _normalize_lookup_value,
+    _strip_script_name,
+    get_lookup_plan,
+    get_resource_for_path,
+    resolve_path,
+)
 from .validators import validate_rsin
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class ResolvedURL:
+    """
+    A local resource URL, resolved to the lookup of the resource without
+    querying the database.
+    """
+
+    path: str
+    plan: LookupPlan
+    value: str
+    other_kwargs: tuple = ()
+
+
+def get_instance_lookup(
+    model: type[models.Model], instance_path: str
+) -> tuple[str, type[models.Model]] | None:
+    """
+    Translate an ``instance_path`` (``"zaak.zaaktype"``) to a lookup.
+
+    Returns the lookup and the model it points to, or ``None`` if the path goes
+    through attributes that are not relations.
+    """
+    bits = []
+    for bit in instance_path.split("."):
+        try:
+            field = model._meta.get_field(bit)
+        except FieldDoesNotExist:
+            return None
+        if not field.is_relation or field.related_model is None:
+            return None
+        model = field.related_model
+        bits.append(bit)
+    return "__".join(bits), model
+
+
+def get_url_filter(
+    field_name: str,
+    resolved_urls: Iterable[ResolvedURL],
+    model: type[models.Model],
+    instance_path: str | None = None,
+) -> Q:
+    """
+    Build the condition to filter ``field_name`` on the resources behind URLs.
+
+    The lookup values from the URLs are compared through a join
+    (``zaak__uuid__in=...``) where possible, otherwise the resources are selected
+    with a subquery of the queryset of the viewset.
+    """
+    # (plan, other URL kwargs) -> path of the first URL, lookup values
+    groups: dict[tuple, tuple[str, list[str]]] = {}
+    for resolved in resolved_urls:
+        _, values = groups.setdefault(
+            (resolved.plan, resolved.other_kwargs), (resolved.path, [])
+        )
+        values.append(resolved.value)
+
+    condition = Q()
+    for (plan, _), (path, values) in groups.items():
+        is_plain_queryset = plan.queryset is not None and not plan.queryset.query.where
+        if not instance_path and plan.model is model and is_plain_queryset:
+            lookup = field_name
+            if plan.lookup_field not in ("pk", model._meta.pk.name):
+                lookup = f"{field_name}__{plan.lookup_field}"
+            if len(values) == 1:
+                condition |= Q(**{lookup: values[0]})
+            else:
+                condition |= Q(**{f"{lookup}__in": values})
+            continue
+
+        queryset = plan.get_queryset(path)
+        target = "pk"
+        if instance_path:
+            target, _ = get_instance_lookup(queryset.model, instance_path)
+        subquery = queryset.filter(**{f"{plan.lookup_field}__in": values}).values(
+            target
+        )
+        condition |= Q(**{f"{field_name}__in": subquery})
+    return condition
+
+
 class URLModelChoiceField(fields.ModelChoiceField):
     widget = URLInput
 
@@ -28,10 +120,7 @@ class URLModelChoiceField(fields.ModelChoiceField):
     def _get_request(self):
         return None
 
-    def url_to_pk(self, url: str):
-        parsed = urlparse(url)
-        path = parsed.path
-
+    def _check_host(self, parsed) -> None:
         # this field only supports local FKs - so if we see a domain that does
         # not match the current host, this cannot possibly yield any results
         request = self._get_request()
@@ -40,6 +129,60 @@ class URLModelChoiceField(fields.ModelChoiceField):
             if parsed.netloc != host:
                 raise NotAViewSet("External URL cannot map to a local viewset")
 
+    def _check_type(self, model: type[models.Model]) -> None:
+        if self.queryset is None:
+            raise ValueError("queryset must be set before resolving URLs")
+        expected = self.queryset.model
+        if not issubclass(model, expected):
+            raise ValidationError(
+                _("Invalid resource type supplied, expected %r") % expected,
+                code="invalid-type",
+            )
+
+    def resolve_url(self, url: str) -> ResolvedURL | None:
+        """
+        Resolve a URL to the lookup of the resource, without database queries.
+
+        Returns ``None`` if the ``instance_path`` can't be expressed as a lookup,
+        in which case the resource must be fetched with :meth:`url_to_pk`.
+        """
+        parsed = urlparse(url)
+        self._check_host(parsed)
+        path = _strip_script_name(parsed.path)
+
+        callback, _, callback_kwargs = resolve_path(path)
+        if not hasattr(callback, "cls"):
+            raise NotAViewSet(f"Callback for {path} does not look like a viewset")
+
+        plan = get_lookup_plan(callback.cls)
+        try:
+            value = _normalize_lookup_value(
+                plan, callback_kwargs[plan.lookup_url_kwarg]
+            )
+        except ValidationError as exc:
+            # e.g. a malformed UUID, no resource can have it
+            raise models.ObjectDoesNotExist("Invalid lookup value") from exc
+
+        model = plan.model or plan.get_queryset(path).model
+        if self.instance_path:
+            instance_lookup = get_instance_lookup(model, self.instance_path)
+            if instance_lookup is None:
+                return None
+            _, model = instance_lookup
+
+        self._check_type(model)
+        return ResolvedURL(
+            path=path,
+            plan=plan,
+            value=value,
+            other_kwargs=_get_other_kwargs(plan, callback_kwargs),
+        )
+
+    def url_to_pk(self, url: str):
+        parsed = urlparse(url)
+        path = parsed.path
+        self._check_host(parsed)
+
         instance = get_resource_for_path(path)
         if self.instance_path:
             for bit in self.instance_path.split("."):
@@ -55,19 +198,24 @@ class URLModelChoiceField(fields.ModelChoiceField):
         return instance.pk
 
     def to_python(self, value: str):
-        if value is not None:
-            URLValidator()(value)
+        """
+        Resolve the URL to the lookup of the resource.
+
+        The resource itself is not fetched, the filter translates the lookup to a
+        join on the lookup field.
+        """
+        if value in self.empty_values:
+            return None
+        URLValidator()(value)
 
-        if value:
-            try:
-                value = self.url_to_pk(value)
-            except NotAViewSet:
-                logger.info("No %s found for URL %s", self.label, value)
-                return FILTER_URL_DID_NOT_RESOLVE
-            except models.ObjectDoesNotExist:
-                logger.info("No %s found for URL %s", self.label, value)
-                return FILTER_URL_DID_NOT_RESOLVE
-        return super().to_python(value)
+        try:
+            resolved = self.resolve_url(value)
+            if resolved is None:
+                return self.url_to_pk(value)
+        except (NotAViewSet, models.ObjectDoesNotExist):
+            logger.info("No %s found for URL %s", self.label, value)
+            return FILTER_URL_DID_NOT_RESOLVE
+        return resolved
 
 
 class URLModelChoiceFilter(filters.ModelChoiceFilter):
@@ -89,7 +237,60 @@ class URLModelChoiceFilter(filters.ModelChoiceFilter):
         # If the URL did not resolve to an instance, return no results
         if value == FILTER_URL_DID_NOT_RESOLVE:
             return qs.none()
-        return super().filter(qs, value)
+        if not isinstance(value, ResolvedURL):
+            return super().filter(qs, value)
+
+        condition = get_url_filter(
+            self.field_name,
+            [value],
+            self.field.queryset.model,
+            instance_path=self.instance_path,
+        )
+        qs = self.get_method(qs)(condition)
+        return qs.distinct() if self.distinct else qs
+
+
+class URLModelMultipleChoiceField(URLModelChoiceField):
+    """
+    Resolve a single URL of a comma separated list of URLs.
+    """
+
+
+class URLModelMultipleChoiceFilter(filters.BaseInFilter, URLModelChoiceFilter):
+    """
+    Filter on a comma separated list of resource URLs, e.g.
+    ``zaak__in=<url1>,<url2>``.
+
+    URLs that do not resolve to a local resource are ignored. No results are
+    returned if none of the URLs resolve.
+    """
+
+    field_class = URLModelMultipleChoiceField
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+
+        resolved_urls = [item for item in value if isinstance(item, ResolvedURL)]
+        pks = [
+            item
+            for item in value
+            if not isinstance(item, ResolvedURL) and item != FILTER_URL_DID_NOT_RESOLVE
+        ]
+        if not resolved_urls and not pks:
+            return qs.none()
+
+        condition = get_url_filter(
+            self.field_name,
+            resolved_urls,
+            self.field.queryset.model,
+            instance_path=self.instance_path,
+        )
+        if pks:
+            condition |= Q(**{f"{self.field_name}__in": pks})
+
+        qs = self.get_method(qs)(condition)
+        return qs.distinct() if self.distinct else qs
 
 
 class RSINFilter(filters.CharFilter):
@@ -7,10 +7,10 @@ from django.http import HttpRequest, QueryDict
 from django_filters.rest_framework import DjangoFilterBackend
 from djangorestframework_camel_case.parser import CamelCaseJSONParser
 from djangorestframework_camel_case.render import CamelCaseJSONRenderer
-from djangorestframework_camel_case.util import underscoreize
 from rest_framework.request import Request as DRFRequest
 from rest_framework.views import APIView
 
+from .camelize import underscoreize
 from .filtersets import FilterSet
 from .search import is_search_view
 
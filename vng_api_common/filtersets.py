@@ -6,7 +6,7 @@ from django.db import models
 from django_filters.rest_framework import filterset
 
 from .fields import RSINField
-from .filters import RSINFilter, URLModelChoiceFilter
+from .filters import RSINFilter, URLModelChoiceFilter, URLModelMultipleChoiceFilter
 
 FILTER_FOR_DBFIELD_DEFAULTS = deepcopy(filterset.FILTER_FOR_DBFIELD_DEFAULTS)
 FILTER_FOR_DBFIELD_DEFAULTS[models.ForeignKey]["filter_class"] = URLModelChoiceFilter
@@ -35,3 +35,13 @@ class FilterSet(filterset.FilterSet):
         if not filter_set.extra.get("help_text"):
             filter_set.extra["help_text"] = getattr(field, "help_text", None)
         return filter_set
+
+    @classmethod
+    def filter_for_lookup(cls, field, lookup_type):
+        """
+        Filter foreign keys on a list of resource URLs for ``in`` lookups.
+        """
+        filter_class, params = super().filter_for_lookup(field, lookup_type)
+        if lookup_type == "in" and issubclass(filter_class, URLModelChoiceFilter):
+            return URLModelMultipleChoiceFilter, params
+        return filter_class, params
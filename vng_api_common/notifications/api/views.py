@@ -1,6 +1,3 @@
-from django.conf import settings
-from django.utils.module_loading import import_string
-
 from drf_spectacular.utils import extend_schema
 from notifications_api_common.api.serializers import NotificatieSerializer
 from notifications_api_common.constants import SCOPE_NOTIFICATIES_PUBLICEREN_LABEL
@@ -11,6 +8,8 @@ from rest_framework.views import APIView
 from ...permissions import AuthScopesRequired
 from ...scopes import Scope
 from ...serializers import FoutSerializer, ValidatieFoutSerializer
+from ...settings import get_setting
+from ..inbox import enqueue_notification, get_notifications_handler
 
 
 class NotificationBaseView(APIView):
@@ -61,10 +60,9 @@ class NotificationView(NotificationBaseView):
         return self.post(request, *args, **kwargs)
 
     def handle_notification(self, message: dict) -> None:
-        _handler = getattr(
-            settings,
-            "DEFAULT_NOTIFICATIONS_HANDLER",
-            "vng_api_common.notifications.handlers.default",
-        )
-        handler = import_string(_handler)
+        if get_setting("NOTIFICATIONS_INBOX"):
+            enqueue_notification(message)
+            return
+
+        handler = get_notifications_handler()
         handler.handle(message)
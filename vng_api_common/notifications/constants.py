@@ -0,0 +1,8 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class InboxStatus(models.TextChoices):
+    pending = "pending", _("Pending")
+    processed = "processed", _("Processed")
+    failed = "failed", _("Failed")
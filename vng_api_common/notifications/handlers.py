@@ -1,12 +1,20 @@
 import logging
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+
+from django.db import transaction
 
 from djangorestframework_camel_case.util import underscoreize
 
 from ..authorizations.models import Applicatie
 from ..authorizations.serializers import ApplicatieUuidSerializer
+from ..authorizations.signals import applicaties_synchronized
 from ..client import get_client, to_internal_data
 from ..constants import CommonResourceAction
 from ..utils import get_uuid_from_path
+from .routing import Route
+
+logger = logging.getLogger(__name__)
 
 KANAAL_AUTORISATIES = "autorisaties"
 
@@ -29,40 +37,186 @@ class AuthHandler:
         return underscoreize(data)  # type: ignore
 
     def handle(self, message: dict) -> None:
-        uuid = get_uuid_from_path(message["resource_url"])
+        (error,) = self.handle_batch([message])
+        if error is not None:
+            raise error
+
+    def handle_batch(self, messages: Sequence[dict]) -> list[Exception | None]:
+        """
+        Synchronize the applicaties of a batch of notifications.
+
+        Only the latest notification per applicatie is applied. Every applicatie
+        is fetched once, and all changes are saved in a single transaction.
+
+        Returns the error per notification, ``None`` if it was applied. A
+        notification that was superseded gets the outcome of the latest one of its
+        applicatie.
+        """
+        latest: dict[str, dict] = {}
+        for message in messages:
+            uuid = get_uuid_from_path(message["resource_url"])
+            # move the applicatie to the end, to apply in order of the last action
+            latest.pop(uuid, None)
+            latest[uuid] = message
+
+        errors: dict[str, Exception] = {}
+        destroyed = [
+            uuid
+            for uuid, message in latest.items()
+            if message["actie"] == CommonResourceAction.destroy
+        ]
+        # fetch before starting the transaction, so no locks are held during the
+        # requests
+        applicaties_data = {}
+        for uuid, message in latest.items():
+            if message["actie"] == CommonResourceAction.destroy:
+                continue
+            try:
+                applicaties_data[uuid] = self._request_auth(message["resource_url"])
+            except Exception as exc:
+                logger.warning("Fetching applicatie %s failed", uuid, exc_info=True)
+                errors[uuid] = exc
+
+        with transaction.atomic():
+            if destroyed:
+                Applicatie.objects.filter(uuid__in=destroyed).delete()
+
+            existing = {
+                str(applicatie.uuid): applicatie
+                for applicatie in Applicatie.objects.filter(
+                    uuid__in=list(applicaties_data)
+                )
+            }
+            for uuid, applicatie_data in applicaties_data.items():
+                applicatie_data["uuid"] = uuid
+                applicatie_serializer = ApplicatieUuidSerializer(
+                    existing.get(uuid), data=applicatie_data
+                )
+                try:
+                    # a savepoint per applicatie, so a failure doesn't roll back
+                    # the others
+                    with transaction.atomic():
+                        applicatie_serializer.is_valid(raise_exception=True)
+                        applicatie_serializer.save()
+                except Exception as exc:
+                    logger.warning("Saving applicatie %s failed", uuid, exc_info=True)
+                    errors[uuid] = exc
+
+            uuids = [uuid for uuid in latest if uuid not in errors]
+            if uuids:
+                transaction.on_commit(
+                    lambda: applicaties_synchronized.send(
+                        sender=type(self), uuids=uuids
+                    )
+                )
+
+        return [
+            errors.get(get_uuid_from_path(message["resource_url"]))
+            for message in messages
+        ]
 
-        if message["actie"] == CommonResourceAction.destroy:
-            Applicatie.objects.filter(uuid=uuid).delete()
-            return
 
-        # get info
-        applicatie_data = self._request_auth(message["resource_url"])
-        applicatie_data["uuid"] = uuid
-
-        # update models
-        try:
-            applicatie = Applicatie.objects.get(uuid=uuid)
-        except Applicatie.DoesNotExist:
-            applicatie_serializer = ApplicatieUuidSerializer(data=applicatie_data)
-        else:
-            applicatie_serializer = ApplicatieUuidSerializer(
-                applicatie, data=applicatie_data
-            )
-        applicatie_serializer.is_valid()
-        applicatie_serializer.save()
+class RoutingHandler:
+    """
+    Dispatch notifications to the handlers of the matching routes.
 
+    ``config`` maps a kanaal to a handler, more specific routes are added with
+    ``routes`` or :meth:`register`. A notification is passed to every matching
+    route, notifications without a matching route go to the ``default`` handler.
+    """
 
-class RoutingHandler:
-    def __init__(self, config: dict, default=None):
+    def __init__(self, config: dict, default=None, routes: Iterable[Route] = ()):
         self.config = config
         self.default = default
+        self.routes: list[Route] = []
+        self._routes_by_kanaal: dict[str, list[Route]] = defaultdict(list)
+        self._wildcard_routes: list[Route] = []
+        self.dropped = 0
+
+        for kanaal, handler in config.items():
+            self.add_route(Route([handler], kanaal=kanaal))
+        for route in routes:
+            self.add_route(route)
+
+    def add_route(self, route: Route) -> Route:
+        self.routes.append(route)
+        if route.kanalen is None:
+            self._wildcard_routes.append(route)
+        else:
+            for kanaal in route.kanalen:
+                self._routes_by_kanaal[kanaal].append(route)
+        return route
+
+    def register(self, *handlers, **kwargs) -> Route:
+        """
+        Add a route for the handlers, see :class:`Route` for the arguments.
+        """
+        return self.add_route(Route(handlers, **kwargs))
+
+    def get_routes(self, message: dict) -> list[Route]:
+        candidates = self._routes_by_kanaal.get(message["kanaal"], [])
+        if self._wildcard_routes:
+            candidates = [*candidates, *self._wildcard_routes]
+        return [route for route in candidates if route.matches(message)]
 
     def handle(self, message: dict):
-        handler = self.config.get(message["kanaal"])
-        if handler is not None:
-            handler.handle(message)
+        routes = self.get_routes(message)
+        if routes:
+            # every route gets the notification, the first error of an inline
+            # route is raised afterwards
+            error = None
+            for route in routes:
+                try:
+                    route.dispatch(message)
+                except Exception as exc:
+                    error = error or exc
+            if error is not None:
+                raise error
         elif self.default:
             self.default.handle(message)
+        else:
+            self.dropped += 1
+
+    def handle_batch(self, messages: Sequence[dict]) -> list[Exception | None]:
+        """
+        Handle a batch of notifications, e.g. the ones claimed from the inbox.
+
+        The notifications of a route that runs its handlers inline are passed to
+        :meth:`Route.dispatch_batch` together, so the errors are known per
+        notification. Other routes get them as usual. Returns the error per
+        notification, ``None`` if it was handled.
+        """
+        errors: list[Exception | None] = [None] * len(messages)
+        batches: dict[Route, list[int]] = defaultdict(list)
+
+        for index, message in enumerate(messages):
+            routes = self.get_routes(message)
+            for route in routes:
+                if route.is_inline:
+                    batches[route].append(index)
+                else:
+                    route.dispatch(message)
+            if routes:
+                continue
+
+            if self.default:
+                try:
+                    with transaction.atomic():
+                        self.default.handle(message)
+                except Exception as exc:
+                    errors[index] = exc
+            else:
+                self.dropped += 1
+
+        for route, indexes in batches.items():
+            route_errors = route.dispatch_batch([messages[index] for index in indexes])
+            for index, error in zip(indexes, route_errors):
+                errors[index] = errors[index] or error
+        return errors
+
+    @property
+    def metrics(self) -> dict[str, dict]:
+        return {route.name: route.metrics.as_dict() for route in self.routes}
 
 
 log = LoggingHandler()
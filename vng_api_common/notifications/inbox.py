@@ -0,0 +1,274 @@
+"""
+Durable inbox for received notifications.
+
+With the ``NOTIFICATIONS_INBOX`` library setting enabled (see
+:ref:`ref_settings`), the notification webhook stores the validated notification
+in the :class:`NotificationInbox` table and responds immediately. The
+``process_notifications`` management command hands the stored notifications to
+the configured handler in batches (see :func:`handle_entries`), with retries and
+exponential backoff for notifications that fail.
+
+Every notification gets an idempotency key derived from its content, so
+notifications that are delivered again (e.g. because the delivery timed out) are
+ignored.
+"""
+
+import hashlib
+import json
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from notifications_api_common.api.serializers import NotificatieSerializer
+
+from .constants import InboxStatus
+from .models import NotificationInbox
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HANDLER = "vng_api_common.notifications.handlers.default"
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_ATTEMPTS = 5
+# seconds before the first retry, doubled for every next attempt
+DEFAULT_BACKOFF = 30
+# seconds a claimed notification is hidden from other workers
+DEFAULT_LEASE = 300
+
+
+@lru_cache(maxsize=None)
+def _import_handler(dotted_path: str):
+    return import_string(dotted_path)
+
+
+def get_notifications_handler():
+    """
+    Return the handler of the ``DEFAULT_NOTIFICATIONS_HANDLER`` setting.
+
+    The handler is imported once per dotted path.
+    """
+    dotted_path = getattr(settings, "DEFAULT_NOTIFICATIONS_HANDLER", DEFAULT_HANDLER)
+    return _import_handler(dotted_path)
+
+
+def get_idempotency_key(message: dict) -> str:
+    """
+    Derive a key from the content of the (validated) notification.
+    """
+    encoded = json.dumps(
+        message, cls=DjangoJSONEncoder, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def enqueue_notification(message: dict) -> bool:
+    """
+    Store a validated notification in the inbox.
+
+    Returns ``False`` if the notification was received before.
+    """
+    _, created = NotificationInbox.objects.get_or_create(
+        idempotency_key=get_idempotency_key(message),
+        defaults={"message": message},
+    )
+    return created
+
+
+def claim_notifications(
+    batch_size: int = DEFAULT_BATCH_SIZE, lease: int = DEFAULT_LEASE
+) -> list[NotificationInbox]:
+    """
+    Claim a batch of pending notifications that are due.
+
+    The claimed notifications are hidden from other workers for ``lease`` seconds,
+    after which they are picked up again if the worker did not finish them.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        entries = list(
+            NotificationInbox.objects.select_for_update(skip_locked=True)
+            .filter(status=InboxStatus.pending, available_at__lte=now)
+            .order_by("available_at", "pk")[:batch_size]
+        )
+        for entry in entries:
+            entry.attempts += 1
+            entry.available_at = now + timedelta(seconds=lease)
+        NotificationInbox.objects.bulk_update(entries, ["attempts", "available_at"])
+    return entries
+
+
+def _record_outcome(
+    entry: NotificationInbox,
+    error: Exception | None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    backoff: int = DEFAULT_BACKOFF,
+) -> bool:
+    if error is not None:
+        logger.warning(
+            "Handling notification %s failed (attempt %s)",
+            entry.pk,
+            entry.attempts,
+            exc_info=error,
+        )
+        entry.last_error = repr(error)
+        if entry.attempts >= max_attempts:
+            entry.status = InboxStatus.failed
+        else:
+            delay = backoff * 2 ** (entry.attempts - 1)
+            entry.available_at = timezone.now() + timedelta(seconds=delay)
+        entry.save(update_fields=["status", "available_at", "last_error"])
+        return False
+
+    entry.status = InboxStatus.processed
+    entry.processed = timezone.now()
+    entry.last_error = ""
+    entry.save(update_fields=["status", "processed", "last_error"])
+    return True
+
+
+def handle_entry(
+    entry: NotificationInbox,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    backoff: int = DEFAULT_BACKOFF,
+) -> bool:
+    """
+    Hand a claimed notification to the handler and record the outcome.
+
+    Returns whether the notification was handled.
+    """
+    serializer = NotificatieSerializer(data=entry.message)
+    try:
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            get_notifications_handler().handle(serializer.validated_data)
+    except Exception as exc:
+        return _record_outcome(entry, exc, max_attempts, backoff)
+    return _record_outcome(entry, None, max_attempts, backoff)
+
+
+def handle_entries(
+    entries: list[NotificationInbox],
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    backoff: int = DEFAULT_BACKOFF,
+) -> list[bool]:
+    """
+    Hand claimed notifications to the handler as a batch and record the outcome
+    of every notification.
+
+    Handlers with a ``handle_batch`` method, like the default
+    :class:`~vng_api_common.notifications.handlers.RoutingHandler`, get the
+    notifications together, so e.g. the notifications of the same applicatie are
+    coalesced. Other handlers get them one by one. Returns per notification
+    whether it was handled.
+    """
+    handler = get_notifications_handler()
+    if not hasattr(handler, "handle_batch"):
+        return [handle_entry(entry, max_attempts, backoff) for entry in entries]
+
+    errors: dict[int, Exception | None] = {}
+    valid_entries, messages = [], []
+    for entry in entries:
+        serializer = NotificatieSerializer(data=entry.message)
+        try:
+            serializer.is_valid(raise_exception=True)
+        except Exception as exc:
+            errors[entry.pk] = exc
+        else:
+            valid_entries.append(entry)
+            messages.append(serializer.validated_data)
+
+    if messages:
+        try:
+            batch_errors = handler.handle_batch(messages)
+        except Exception as exc:
+            batch_errors = [exc] * len(messages)
+        for entry, error in zip(valid_entries, batch_errors):
+            errors[entry.pk] = error
+
+    return [
+        _record_outcome(entry, errors[entry.pk], max_attempts, backoff)
+        for entry in entries
+    ]
+
+
+def _handle_in_thread(entries: list[NotificationInbox], **kwargs) -> list[bool]:
+    try:
+        return handle_entries(entries, **kwargs)
+    finally:
+        # worker threads have their own database connections
+        connections.close_all()
+
+
+def _partition(
+    entries: list[NotificationInbox], parts: int
+) -> list[list[NotificationInbox]]:
+    """
+    Split the entries in ``parts`` groups, keeping the notifications about the
+    same resource together and in order.
+    """
+    groups: dict[str, list[NotificationInbox]] = defaultdict(list)
+    for entry in entries:
+        groups[entry.message.get("resource_url", "")].append(entry)
+
+    partitions: list[list[NotificationInbox]] = [[] for _ in range(parts)]
+    for index, group in enumerate(groups.values()):
+        partitions[index % parts].extend(group)
+    return [partition for partition in partitions if partition]
+
+
+def process_inbox(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = 1,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    backoff: int = DEFAULT_BACKOFF,
+    lease: int = DEFAULT_LEASE,
+) -> tuple[int, int]:
+    """
+    Handle a batch of pending notifications, see :func:`handle_entries`.
+
+    With a ``concurrency`` above one, the notifications are split over a pool of
+    threads, the notifications about the same resource are handled by the same
+    thread. Returns the number of handled and failed notifications.
+    """
+    entries = claim_notifications(batch_size=batch_size, lease=lease)
+    if not entries:
+        return 0, 0
+
+    options = {"max_attempts": max_attempts, "backoff": backoff}
+    if concurrency <= 1:
+        results = handle_entries(entries, **options)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = [
+                result
+                for partition_results in executor.map(
+                    lambda partition: _handle_in_thread(partition, **options),
+                    _partition(entries, concurrency),
+                )
+                for result in partition_results
+            ]
+
+    handled = sum(results)
+    return handled, len(results) - handled
+
+
+def purge_inbox(retention_days: int) -> int:
+    """
+    Delete the processed notifications older than ``retention_days``.
+
+    Their idempotency keys are forgotten, so this bounds the period in which
+    redelivered notifications are recognized.
+    """
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    deleted, _ = NotificationInbox.objects.filter(
+        status=InboxStatus.processed, processed__lt=cutoff
+    ).delete()
+    return deleted
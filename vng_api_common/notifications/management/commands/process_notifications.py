@@ -0,0 +1,87 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...inbox import (
+    DEFAULT_BACKOFF,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_LEASE,
+    DEFAULT_MAX_ATTEMPTS,
+    process_inbox,
+    purge_inbox,
+)
+
+
+class Command(BaseCommand):
+    help = "Handle the notifications stored in the notification inbox."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of notifications to claim at once.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Number of notifications to handle in parallel.",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=DEFAULT_MAX_ATTEMPTS,
+            help="Number of attempts before a notification is marked as failed.",
+        )
+        parser.add_argument(
+            "--backoff",
+            type=int,
+            default=DEFAULT_BACKOFF,
+            help="Seconds before the first retry, doubled for every next retry.",
+        )
+        parser.add_argument(
+            "--lease",
+            type=int,
+            default=DEFAULT_LEASE,
+            help="Seconds before a notification claimed by a worker that did not "
+            "finish is handled again.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=None,
+            help="Keep running and check for new notifications at this interval "
+            "(in seconds). Without it, the command stops when no notifications "
+            "are due.",
+        )
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=7,
+            help="Days to keep handled notifications to recognize redeliveries.",
+        )
+
+    def handle(self, **options):
+        handled = failed = 0
+        while True:
+            batch_handled, batch_failed = process_inbox(
+                batch_size=options["batch_size"],
+                concurrency=options["concurrency"],
+                max_attempts=options["max_attempts"],
+                backoff=options["backoff"],
+                lease=options["lease"],
+            )
+            handled += batch_handled
+            failed += batch_failed
+            if batch_handled or batch_failed:
+                continue
+
+            purge_inbox(options["retention_days"])
+            if options["poll_interval"] is None:
+                break
+            time.sleep(options["poll_interval"])
+
+        self.stdout.write(
+            f"Handled {handled} notification(s), {failed} attempt(s) failed."
+        )
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:42
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0011_remove_subscription_config_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationInbox',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('idempotency_key', models.CharField(help_text='Hash van de notificatie, om opnieuw afgeleverde notificaties te herkennen.', max_length=64, unique=True, verbose_name='idempotency key')),
+                ('message', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='De gevalideerde notificatie.', verbose_name='message')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processed', 'Processed'), ('failed', 'Failed')], default='pending', max_length=20, verbose_name='status')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='attempts')),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Het moment vanaf wanneer de notificatie (opnieuw) verwerkt mag worden.', verbose_name='available at')),
+                ('last_error', models.TextField(blank=True, verbose_name='last error')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='created')),
+                ('processed', models.DateTimeField(blank=True, null=True, verbose_name='processed')),
+            ],
+            options={
+                'verbose_name': 'notification inbox entry',
+                'verbose_name_plural': 'notification inbox entries',
+                'ordering': ['pk'],
+                'indexes': [models.Index(condition=models.Q(('status', 'pending')), fields=['available_at'], name='notification_inbox_pending')],
+            },
+        ),
+    ]
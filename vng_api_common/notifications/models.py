@@ -0,0 +1,61 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from .constants import InboxStatus
+
+
+class NotificationInbox(models.Model):
+    """
+    Received notifications waiting to be handled.
+
+    Filled by the notification webhook if the ``NOTIFICATIONS_INBOX`` setting is
+    enabled, and processed by the ``process_notifications`` management command.
+    """
+
+    idempotency_key = models.CharField(
+        _("idempotency key"),
+        max_length=64,
+        unique=True,
+        help_text=_(
+            "Hash van de notificatie, om opnieuw afgeleverde notificaties te herkennen."
+        ),
+    )
+    message = models.JSONField(
+        _("message"),
+        encoder=DjangoJSONEncoder,
+        help_text=_("De gevalideerde notificatie."),
+    )
+    status = models.CharField(
+        _("status"),
+        max_length=20,
+        choices=InboxStatus.choices,
+        default=InboxStatus.pending,
+    )
+    attempts = models.PositiveIntegerField(_("attempts"), default=0)
+    available_at = models.DateTimeField(
+        _("available at"),
+        default=timezone.now,
+        help_text=_(
+            "Het moment vanaf wanneer de notificatie (opnieuw) verwerkt mag worden."
+        ),
+    )
+    last_error = models.TextField(_("last error"), blank=True)
+    created = models.DateTimeField(_("created"), auto_now_add=True)
+    processed = models.DateTimeField(_("processed"), null=True, blank=True)
+
+    class Meta:
+        ordering = ["pk"]
+        verbose_name = _("notification inbox entry")
+        verbose_name_plural = _("notification inbox entries")
+        indexes = [
+            models.Index(
+                fields=["available_at"],
+                condition=models.Q(status=InboxStatus.pending),
+                name="notification_inbox_pending",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.message.get('kanaal')} {self.message.get('resource_url')}"
@@ -0,0 +1,281 @@
+"""
+Routes and executors for :class:`vng_api_common.notifications.handlers.RoutingHandler`.
+
+A :class:`Route` selects notifications on kanaal, resource, actie and kenmerken,
+and passes them to one or more handlers with an executor:
+
+* :class:`InlineExecutor` runs the handlers immediately, errors propagate
+* :class:`ThreadPoolRouteExecutor` runs the handlers in a pool of threads
+* :class:`QueuedExecutor` runs the handlers in order in background worker threads,
+  from a bounded queue
+
+Errors of the handlers are counted in the :class:`RouteMetrics` of the route. A
+failing route doesn't keep a notification from the other routes: the
+:class:`~vng_api_common.notifications.handlers.RoutingHandler` raises the first
+error of an inline route after all routes got the notification. The background
+executors log the errors.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Collection, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+
+class InlineExecutor:
+    """
+    Run the handlers of a route in the calling thread.
+
+    Errors propagate, so the webhook doesn't acknowledge a notification that
+    could not be handled.
+    """
+
+    def submit(self, func: Callable, *args) -> None:
+        func(*args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+def _run_in_worker(func: Callable, *args) -> None:
+    try:
+        func(*args)
+    except Exception:
+        # the bound method of the route
+        route = getattr(func, "__self__", func)
+        logger.exception("Handling a notification failed in %r", route)
+    finally:
+        # worker threads have their own database connections
+        close_old_connections()
+
+
+class ThreadPoolRouteExecutor:
+    """
+    Run the handlers of a route in a pool of threads.
+
+    Errors are logged and counted in the metrics of the route.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="notifications"
+        )
+
+    def submit(self, func: Callable, *args) -> None:
+        self._executor.submit(_run_in_worker, func, *args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+class QueuedExecutor:
+    """
+    Run the handlers of a route from a bounded queue in background threads.
+
+    With a single worker, the notifications are handled in the order they were
+    received. Submitting blocks while the queue is full.
+    """
+
+    _stop = object()
+
+    def __init__(self, maxsize: int = 1000, workers: int = 1):
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._threads = [
+            threading.Thread(target=self._work, daemon=True) for _ in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is self._stop:
+                    return
+                _run_in_worker(*item)
+            finally:
+                self._queue.task_done()
+
+    def submit(self, func: Callable, *args) -> None:
+        self._queue.put((func, *args))
+
+    def join(self) -> None:
+        """
+        Wait until all queued notifications are handled.
+        """
+        self._queue.join()
+
+    def shutdown(self, wait: bool = True) -> None:
+        for _ in self._threads:
+            self._queue.put(self._stop)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
+class RouteMetrics:
+    """
+    Thread-safe counters of a route.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.matched = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.duration = 0.0
+
+    def record_match(self) -> None:
+        with self._lock:
+            self.matched += 1
+
+    def record_result(self, duration: float, success: bool) -> None:
+        with self._lock:
+            self.duration += duration
+            if success:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            handled = self.succeeded + self.failed
+            return {
+                "matched": self.matched,
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+                "duration": self.duration,
+                "average_duration": self.duration / handled if handled else None,
+            }
+
+
+def _as_collection(value: str | Iterable[str] | None) -> Collection[str] | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return frozenset([value])
+    return frozenset(value)
+
+
+class Route:
+    """
+    Pass the matching notifications to one or more handlers.
+
+    ``kanaal``, ``resource`` and ``actie`` take a value or a collection of values,
+    ``None`` matches everything. ``kenmerken`` maps a kenmerk to the expected
+    value, a collection of values or a callable that checks the value.
+    """
+
+    def __init__(
+        self,
+        handlers: Iterable,
+        kanaal: str | Iterable[str] | None = None,
+        resource: str | Iterable[str] | None = None,
+        actie: str | Iterable[str] | None = None,
+        kenmerken: dict[str, Any] | None = None,
+        executor=None,
+        name: str = "",
+    ):
+        self.handlers = list(handlers)
+        self.kanalen = _as_collection(kanaal)
+        self.resources = _as_collection(resource)
+        self.acties = _as_collection(actie)
+        self.kenmerken = kenmerken or {}
+        self.executor = executor or InlineExecutor()
+        self.name = name or ":".join(
+            ",".join(sorted(values)) if values else "*"
+            for values in (self.kanalen, self.resources, self.acties)
+        )
+        self.metrics = RouteMetrics()
+
+    def __repr__(self):
+        return f"<Route {self.name}>"
+
+    def matches(self, message: dict) -> bool:
+        if self.kanalen is not None and message["kanaal"] not in self.kanalen:
+            return False
+        if self.resources is not None and message["resource"] not in self.resources:
+            return False
+        if self.acties is not None and message["actie"] not in self.acties:
+            return False
+
+        kenmerken = message.get("kenmerken") or {}
+        for key, expected in self.kenmerken.items():
+            if key not in kenmerken:
+                return False
+            value = kenmerken[key]
+            if callable(expected):
+                if not expected(value):
+                    return False
+            elif isinstance(expected, Collection) and not isinstance(expected, str):
+                if value not in expected:
+                    return False
+            elif value != expected:
+                return False
+        return True
+
+    @property
+    def is_inline(self) -> bool:
+        return isinstance(self.executor, InlineExecutor)
+
+    def dispatch(self, message: dict) -> None:
+        self.metrics.record_match()
+        self.executor.submit(self._handle, message)
+
+    def dispatch_batch(self, messages: Sequence[dict]) -> list[Exception | None]:
+        """
+        Pass a batch of notifications to the handlers, in the calling thread.
+
+        Handlers with a ``handle_batch`` method get the notifications together,
+        the others one by one, each in its own transaction. Returns the first
+        error per notification, ``None`` if every handler handled it.
+        """
+        errors: list[Exception | None] = [None] * len(messages)
+        if not messages:
+            return errors
+
+        for _ in messages:
+            self.metrics.record_match()
+        for handler in self.handlers:
+            if hasattr(handler, "handle_batch"):
+                start = time.perf_counter()
+                handler_errors = handler.handle_batch(messages)
+                duration = (time.perf_counter() - start) / len(messages)
+                for index, error in enumerate(handler_errors):
+                    self.metrics.record_result(duration, error is None)
+                    errors[index] = errors[index] or error
+                continue
+
+            for index, message in enumerate(messages):
+                start = time.perf_counter()
+                try:
+                    with transaction.atomic():
+                        handler.handle(message)
+                except Exception as exc:
+                    self.metrics.record_result(time.perf_counter() - start, False)
+                    errors[index] = errors[index] or exc
+                else:
+                    self.metrics.record_result(time.perf_counter() - start, True)
+        return errors
+
+    def _handle(self, message: dict) -> None:
+        # a failing handler doesn't keep the message from the other handlers
+        error = None
+        for handler in self.handlers:
+            start = time.perf_counter()
+            try:
+                handler.handle(message)
+            except Exception as exc:
+                self.metrics.record_result(time.perf_counter() - start, False)
+                error = error or exc
+            else:
+                self.metrics.record_result(time.perf_counter() - start, True)
+        if error is not None:
+            raise error
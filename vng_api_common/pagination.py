@@ -1,13 +1,39 @@
+import hashlib
+import json
+from collections import namedtuple
+from functools import partial
+
+from django.core import signing
+from django.core.cache import caches
+from django.core.paginator import (
+    EmptyPage,
+    Page,
+    PageNotAnInteger,
+    Paginator as DjangoPaginator,
+)
+from django.db import connection, models
+from django.db.models import Q
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 # These strings are defined by rest_framework.pagination, but never translated
 FORCE_TRANSLATION_STRINGS = [
     _("A page number within the paginated result set."),
     _("Number of results to return per page."),
+    _("The pagination cursor value."),
+    _("Invalid cursor"),
 ]
 
+COUNT_EXACT = "exact"
+COUNT_ESTIMATE = "estimate"
+
+KeysetCursor = namedtuple("KeysetCursor", ["ordering", "position", "pk", "reverse"])
+
 
 class DynamicPageSizeMixin:
     page_size = 100
@@ -24,4 +50,332 @@ class DynamicPageSizeMixin:
         )
 
 
-class DynamicPageSizePagination(DynamicPageSizeMixin, PageNumberPagination): ...
+def get_count_estimate(queryset: models.QuerySet) -> int | None:
+    """
+    Estimate the number of records of a queryset from the table statistics.
+
+    Unfiltered querysets use the number of rows of the table in ``pg_class``, filtered
+    querysets the row estimate of the query planner. Only supported on PostgreSQL,
+    returns ``None`` if no estimate is available.
+    """
+    if connection.vendor != "postgresql":
+        return None
+
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            # tables that were never analyzed have -1 (or 0 in older versions)
+            # reltuples
+            estimate = row[0] if row else None
+        else:
+            sql, params = queryset.query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = plan[0]["Plan"]["Plan Rows"]
+
+    if estimate is None or estimate <= 0:
+        return None
+    return int(estimate)
+
+
+class PresetCountPaginator(DjangoPaginator):
+    """
+    Paginator that uses a count determined beforehand, if given.
+    """
+
+    def __init__(self, *args, count: int | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.preset_count = count
+
+    @cached_property
+    def count(self) -> int:
+        if self.preset_count is not None:
+            return self.preset_count
+        return super().count
+
+
+class EstimatedCountPaginator(PresetCountPaginator):
+    """
+    Paginator for a count that may be off.
+
+    Instead of comparing the page number with the number of pages, one record more
+    than the page size is fetched to find out if there is a next page.
+    """
+
+    def validate_number(self, number):
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        records = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not records and number > 1:
+            raise EmptyPage(_("That page contains no results"))
+
+        page = EstimatedCountPage(records[: self.per_page], number, self)
+        page.has_following = len(records) > self.per_page
+        return page
+
+
+class EstimatedCountPage(Page):
+    has_following = False
+
+    def has_next(self):
+        return self.has_following
+
+
+class DynamicPageSizePagination(DynamicPageSizeMixin, PageNumberPagination):
+    """
+    Page number pagination with a configurable strategy to count the results.
+
+    With :attr:`count_strategy` set to ``COUNT_ESTIMATE``, the count is estimated
+    by the database, unless the estimate is below :attr:`estimate_threshold`, in
+    which case the results are counted. A :attr:`count_cache_timeout` caches the
+    count for the executed query. The response indicates whether the count is
+    exact, unless the results are always counted.
+    """
+
+    count_strategy = COUNT_EXACT
+    # estimates below the threshold are replaced by an exact count
+    estimate_threshold = 10_000
+    # number of seconds to cache counts, ``None`` disables caching
+    count_cache_timeout: int | None = None
+    count_cache_alias = "default"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count_is_exact = True
+        if not self.reports_count_accuracy or not self.get_page_size(request):
+            return super().paginate_queryset(queryset, request, view=view)
+
+        count, self.count_is_exact = self.get_count(queryset)
+        paginator_class = (
+            PresetCountPaginator if self.count_is_exact else EstimatedCountPaginator
+        )
+        self.django_paginator_class = partial(paginator_class, count=count)
+        return super().paginate_queryset(queryset, request, view=view)
+
+    @property
+    def reports_count_accuracy(self) -> bool:
+        return (
+            self.count_strategy != COUNT_EXACT or self.count_cache_timeout is not None
+        )
+
+    def get_count(self, queryset: models.QuerySet) -> tuple[int, bool]:
+        """
+        Return the (possibly estimated) number of results and whether it is exact.
+        """
+        cache_key = None
+        if self.count_cache_timeout is not None:
+            cache = caches[self.count_cache_alias]
+            sql, params = queryset.query.sql_with_params()
+            digest = hashlib.sha256(f"{sql}|{params!r}".encode()).hexdigest()
+            cache_key = f"vng_api_common:pagination:count:{digest}"
+            if (count := cache.get(cache_key)) is not None:
+                # the results may have changed since the count was cached
+                return count, False
+
+        count, is_exact = None, True
+        if self.count_strategy == COUNT_ESTIMATE:
+            count = get_count_estimate(queryset)
+            if count is not None and count >= self.estimate_threshold:
+                is_exact = False
+            else:
+                count = None
+        if count is None:
+            count = queryset.count()
+
+        if cache_key is not None:
+            cache.set(cache_key, count, timeout=self.count_cache_timeout)
+        return count, is_exact
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.reports_count_accuracy:
+            response.data = {
+                "count": response.data["count"],
+                "count_is_exact": self.count_is_exact,
+                **response.data,
+            }
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        if self.reports_count_accuracy:
+            response_schema["properties"] = {
+                "count": response_schema["properties"]["count"],
+                "count_is_exact": {
+                    "type": "boolean",
+                    "description": _(
+                        "Geeft aan of het aantal resultaten exact is of een schatting."
+                    ),
+                },
+                **response_schema["properties"],
+            }
+        return response_schema
+
+
+class DynamicCursorPagination(DynamicPageSizeMixin, CursorPagination):
+    """
+    Keyset pagination with opaque, signed cursors.
+
+    Instead of counting the results and skipping the records of the previous pages
+    with an ``OFFSET``, pages continue after the ordering field value and primary key
+    of the last record of the previous page, so deep pages are as fast as the first
+    one.
+
+    The ordering of the queryset is used if it has one, otherwise
+    :attr:`ordering`. Only the first ordering field is used and it must not be
+    nullable; the primary key breaks ties.
+    """
+
+    ordering = "pk"
+    cursor_query_param = "cursor"
+    cursor_signing_salt = "vng_api_common.pagination.DynamicCursorPagination"
+    # include a ``count`` estimated from the table statistics in the response
+    estimate_count = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        self.count = get_count_estimate(queryset) if self.estimate_count else None
+
+        field_name, descending = self._get_ordering_field()
+        reverse = self.cursor is not None and self.cursor.reverse
+        # moving backwards flips the direction, the page is reversed afterwards
+        if reverse:
+            descending = not descending
+
+        prefix = "-" if descending else ""
+        order_by = [f"{prefix}{field_name}", f"{prefix}pk"]
+        queryset = queryset.order_by(*dict.fromkeys(order_by))
+
+        if self.cursor is not None:
+            lookup = "lt" if descending else "gt"
+            condition = Q(**{f"pk__{lookup}": self.cursor.pk})
+            if field_name != "pk":
+                condition = Q(**{f"{field_name}__{lookup}": self.cursor.position}) | (
+                    Q(**{field_name: self.cursor.position}) & condition
+                )
+            queryset = queryset.filter(condition)
+
+        results = list(queryset[: self.page_size + 1])
+        self.page = results[: self.page_size]
+        has_following = len(results) > self.page_size
+
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_following
+        else:
+            self.has_next, self.has_previous = has_following, self.cursor is not None
+
+        return self.page
+
+    def get_ordering(self, request, queryset, view):
+        ordering = queryset.query.order_by or (
+            queryset.query.default_ordering and queryset.model._meta.ordering
+        )
+        if ordering and isinstance(ordering[0], str) and "__" not in ordering[0]:
+            return tuple(ordering)
+        return super().get_ordering(request, queryset, view)
+
+    def _get_ordering_field(self) -> tuple[str, bool]:
+        ordering = self.ordering[0]
+        field_name = ordering.lstrip("-")
+        if field_name == "id":
+            field_name = "pk"
+        return field_name, ordering.startswith("-")
+
+    def _get_cursor_from_instance(self, instance, reverse: bool) -> KeysetCursor:
+        field_name, _ = self._get_ordering_field()
+        if isinstance(instance, dict):
+            pk, position = instance["pk"], instance.get(field_name)
+        else:
+            pk, position = instance.pk, getattr(instance, field_name)
+
+        # keep the position JSON serializable, lookups accept the string form
+        if not isinstance(position, int | float | str):
+            position = str(position)
+        return KeysetCursor(
+            ordering=self.ordering[0], position=position, pk=pk, reverse=reverse
+        )
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(
+            self._get_cursor_from_instance(self.page[-1], reverse=False)
+        )
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            # nothing to continue from, start over
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(
+            self._get_cursor_from_instance(self.page[0], reverse=True)
+        )
+
+    def decode_cursor(self, request) -> KeysetCursor | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            cursor = KeysetCursor(
+                *signing.loads(encoded, salt=self.cursor_signing_salt)
+            )
+        except (signing.BadSignature, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        # a cursor is only valid for the ordering it was created for
+        if cursor.ordering != self.ordering[0]:
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def encode_cursor(self, cursor: KeysetCursor) -> str:
+        encoded = signing.dumps(
+            list(cursor), salt=self.cursor_signing_salt, compress=True
+        )
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_paginated_response(self, data):
+        content = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        if self.estimate_count:
+            content = {"count": self.count, **content}
+        return Response(content)
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        if self.estimate_count:
+            response_schema["properties"] = {
+                "count": {
+                    "type": "integer",
+                    "nullable": True,
+                    "description": _("Geschat aantal resultaten."),
+                },
+                **response_schema["properties"],
+            }
+        return response_schema
@@ -0,0 +1,50 @@
+import codecs
+import json
+
+from django.conf import settings
+
+from djangorestframework_camel_case import parser
+from rest_framework.exceptions import ParseError
+
+from .camelize import underscoreize
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class CamelCaseJSONParser(parser.CamelCaseJSONParser):
+    """
+    Parse camelCase JSON using the cached key translations.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            data = stream.read().decode(encoding)
+            return underscoreize(json.loads(data), **self.json_underscoreize)
+        except ValueError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
+
+
+class CamelCaseORJSONParser(CamelCaseJSONParser):
+    """
+    Parse camelCase JSON with orjson, if it is installed.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        # orjson only decodes UTF-8
+        if orjson is None or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            data = orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
+        return underscoreize(data, **self.json_underscoreize)
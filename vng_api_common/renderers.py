@@ -0,0 +1,104 @@
+import math
+
+from dateutil.relativedelta import relativedelta
+from djangorestframework_camel_case import render
+from rest_framework.utils import encoders
+
+from .camelize import camelize
+from .serializers import format_relativedelta
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONEncoder(encoders.JSONEncoder):
+    """
+    DRF JSON encoder that also encodes ``relativedelta`` durations.
+    """
+
+    def default(self, obj):
+        if isinstance(obj, relativedelta) and format_relativedelta is not None:
+            return format_relativedelta(obj)
+        return super().default(obj)
+
+
+json_encoder = JSONEncoder()
+
+
+def _is_plain_float(value: float) -> bool:
+    """
+    Check if orjson renders the float like the standard library.
+
+    orjson uses a different exponent notation (``1e16`` instead of ``1e+16``) and
+    renders NaN and infinity as ``null``.
+    """
+    return math.isfinite(value) and (value == 0 or 1e-4 <= abs(value) < 1e16)
+
+
+def _has_special_floats(data) -> bool:
+    if isinstance(data, float):
+        return not _is_plain_float(data)
+    if isinstance(data, dict):
+        return any(
+            _has_special_floats(key) or _has_special_floats(value)
+            for key, value in data.items()
+        )
+    if isinstance(data, (list, tuple)):
+        return any(_has_special_floats(item) for item in data)
+    return False
+
+
+class CamelCaseJSONRenderer(render.CamelCaseJSONRenderer):
+    """
+    Render camelCase JSON using the cached key translations.
+    """
+
+    encoder_class = JSONEncoder
+
+    def render(self, data, *args, **kwargs):
+        # skip the camelization of the parent class
+        return super(render.CamelCaseJSONRenderer, self).render(
+            camelize(data, **self.json_underscoreize), *args, **kwargs
+        )
+
+
+class CamelCaseORJSONRenderer(CamelCaseJSONRenderer):
+    """
+    Render camelCase JSON with orjson, if it is installed.
+
+    The output is the same as that of :class:`CamelCaseJSONRenderer`: datetimes and
+    the types orjson does not handle natively are encoded by the same encoder.
+    Pretty printed, ASCII-only or non-compact output, and data orjson cannot encode
+    (like integers larger than 64 bits) or encodes differently (floats in exponent
+    notation, NaN and infinity) are rendered with the standard library instead.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        camelized = camelize(data, **self.json_underscoreize)
+        if _has_special_floats(camelized):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            rendered = orjson.dumps(
+                camelized,
+                default=json_encoder.default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # escape the line and paragraph separators, like the DRF renderer
+        return rendered.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
@@ -7,6 +7,7 @@ from drf_spectacular import openapi
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter
 from rest_framework import exceptions, serializers, status
+from rest_framework.pagination import CursorPagination
 
 from .audittrails.utils import _view_supports_audittrail
 from .caching.introspection import has_cache_header
@@ -231,6 +232,15 @@ class AutoSchema(openapi.AutoSchema):
             response["description"] = HTTP_STATUS_CODE_TITLES.get(int(status_code), "")
         return response
 
+    def get_paginated_name(self, serializer_name: str) -> str:
+        """
+        Distinguish cursor paginated lists, their envelope differs from the page
+        number paginated lists of the same serializer.
+        """
+        if isinstance(self._get_paginator(), CursorPagination):
+            return f"CursorPaginated{serializer_name}List"
+        return super().get_paginated_name(serializer_name)
+
     def get_override_parameters(self) -> list[OpenApiParameter]:  # type: ignore[override]
         """Add request and response headers"""
         version_headers = self.get_version_headers()
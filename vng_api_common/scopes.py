@@ -4,14 +4,105 @@ Define scopes to manage authorizations on API resources.
 Scope objects hold their own definition and documentation. Public scopes get
 added to the scope registry, which can be introspected for automatic
 documentation.
+
+Scope expressions are compiled once into a flat, disjunctive form (see
+:class:`CompiledScope`) so that permission checks don't need to walk the
+expression tree for every request.
 """
 
+import threading
+from collections.abc import Iterable
+
 OPERATOR_OR = "OR"
 OPERATOR_AND = "AND"
 
 
 SCOPE_REGISTRY: set["Scope"] = set()
 
+# scope labels are interned to bit positions, shared by all compiled scopes
+_LABEL_BITS: dict[str, int] = {}
+_LABEL_BITS_LOCK = threading.Lock()
+
+
+def _get_label_bit(label: str) -> int:
+    bit = _LABEL_BITS.get(label)
+    if bit is not None:
+        return bit
+
+    with _LABEL_BITS_LOCK:
+        return _LABEL_BITS.setdefault(label, 1 << len(_LABEL_BITS))
+
+
+def scopes_to_mask(labels: Iterable[str]) -> int:
+    """
+    Convert a flat collection of scope labels into a bitmask.
+
+    Labels that are not used in any compiled scope expression are ignored, as they
+    can never satisfy a scope requirement. Make sure the scope to check against is
+    compiled before converting the provided labels.
+    """
+    mask = 0
+    for label in labels:
+        mask |= _LABEL_BITS.get(label, 0)
+    return mask
+
+
+class CompiledScope:
+    """
+    Flat evaluation form of a (combined) :class:`Scope`.
+
+    The expression is normalized into an OR of AND-clauses, where each clause is a
+    bitmask of the required scope labels. A set of provided scopes satisfies the
+    expression if any clause is fully contained in it.
+
+    :arg clauses: the AND-clauses, as bitmasks.
+    :arg labels: all the labels occurring in the expression.
+    """
+
+    __slots__ = ("clauses", "labels")
+
+    def __init__(self, clauses: tuple[int, ...], labels: frozenset[str]):
+        self.clauses = clauses
+        self.labels = labels
+
+    def __repr__(self) -> str:
+        cls_name = self.__class__.__name__
+        return "<%s: labels=%r>" % (cls_name, sorted(self.labels))
+
+    @classmethod
+    def from_scope(cls, scope: "Scope") -> "CompiledScope":
+        clauses = cls._get_clauses(scope)
+        # absorption: ``A | (A & B)`` is equivalent to ``A``
+        reduced = tuple(
+            clause
+            for clause in sorted(set(clauses), key=int.bit_count)
+            if not any(other != clause and other & clause == other for other in clauses)
+        )
+        return cls(clauses=reduced, labels=frozenset(scope.get_labels()))
+
+    @classmethod
+    def _get_clauses(cls, scope: "Scope") -> list[int]:
+        if not scope.children:
+            return [_get_label_bit(scope.label)]
+
+        children_clauses = [cls._get_clauses(child) for child in scope.children]
+
+        if scope.operator == OPERATOR_OR:
+            return [clause for clauses in children_clauses for clause in clauses]
+        elif scope.operator == OPERATOR_AND:
+            result = [0]
+            for clauses in children_clauses:
+                result = [left | right for left in result for right in clauses]
+            return result
+        else:
+            raise ValueError(f"Unkonwn operator '{scope.operator}'")
+
+    def matches(self, mask: int) -> bool:
+        """
+        Test if the provided scopes ``mask`` satisfies the expression.
+        """
+        return any(clause & mask == clause for clause in self.clauses)
+
 
 class Scope:
     """
@@ -44,6 +135,8 @@ class Scope:
         self.children = []
         self.operator = None
 
+        self._compiled: CompiledScope | None = None
+
         # add to registry
         if not private:
             SCOPE_REGISTRY.add(self)
@@ -75,20 +168,27 @@ class Scope:
         new.operator = OPERATOR_AND
         return new
 
-    def is_contained_in(self, scope_set: list[str]) -> bool:
+    def get_labels(self) -> set[str]:
         """
-        Test if the flat ``scope_set`` encapsulate this scope.
+        Return the labels of all the (leaf) scopes in this scope expression.
         """
         if not self.children:
-            return self.label in scope_set
+            return {self.label}
+        return {label for child in self.children for label in child.get_labels()}
 
-        children_contained = (
-            child.is_contained_in(scope_set) for child in self.children
-        )
+    @property
+    def compiled(self) -> CompiledScope:
+        """
+        The compiled form of this scope, created on first access.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledScope.from_scope(self)
+        return self._compiled
 
-        if self.operator == OPERATOR_OR:
-            return any(children_contained)
-        elif self.operator == OPERATOR_AND:
-            return all(children_contained)
-        else:
-            raise ValueError(f"Unkonwn operator '{self.operator}'")
+    def is_contained_in(self, scope_set: Iterable[str]) -> bool:
+        """
+        Test if the flat ``scope_set`` encapsulate this scope.
+        """
+        # compile first, so that all the labels of this scope are interned
+        compiled = self.compiled
+        return compiled.matches(scopes_to_mask(scope_set))
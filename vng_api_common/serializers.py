@@ -1,6 +1,6 @@
 import inspect
 from collections import OrderedDict
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from functools import reduce
 from typing import TYPE_CHECKING, Any, cast
 
@@ -17,6 +17,7 @@ from rest_framework_nested.relations import NestedHyperlinkedRelatedField
 
 from .choices import TextChoicesWithDescriptions
 from .descriptors import GegevensGroepType
+from .validators import URLValidator, is_prefetching_urls, prefetch_urls
 
 if TYPE_CHECKING:
     from rest_framework.serializers import HyperlinkedRelatedField as _Base
@@ -28,6 +29,11 @@ if TYPE_CHECKING:
 else:
     _BaseNested = object
 
+if TYPE_CHECKING:
+    from rest_framework.serializers import BaseSerializer as _BaseSerializer
+else:
+    _BaseSerializer = object
+
 format_relativedelta: Callable[[relativedelta], str] | None
 parse_relativedelta: Callable[[str], relativedelta] | None
 
@@ -447,3 +453,70 @@ class CachedNestedHyperlinkedRelatedField(CacheMixin, NestedHyperlinkedRelatedFi
         for v in self.parent_lookup_kwargs.values():
             url = url.replace(v, str(get_nested_fk_attribute(obj, v)))
         return url
+
+
+def get_url_validations(
+    field: fields.Field, data: Any
+) -> list[tuple[URLValidator, str]]:
+    """
+    Collect the remote URL validators of a field or serializer, with the URLs
+    they will validate in the (unvalidated) data.
+
+    Nested serializers, ``many=True`` serializers and list fields are included.
+    """
+    if isinstance(field, (serializers.ListSerializer, serializers.ListField)):
+        if not isinstance(data, list):
+            return []
+        return [
+            validation
+            for item in data
+            for validation in get_url_validations(field.child, item)
+        ]
+
+    if isinstance(field, serializers.Serializer):
+        if not isinstance(data, Mapping):
+            return []
+        validations = []
+        for nested_field in field._writable_fields:
+            value = nested_field.get_value(data)
+            if value is not fields.empty and value is not None:
+                validations += get_url_validations(nested_field, value)
+        return validations
+
+    if not isinstance(data, str):
+        return []
+    if getattr(field, "trim_whitespace", False):
+        data = data.strip()
+    return [
+        (validator, data)
+        for validator in field.validators
+        if isinstance(validator, URLValidator)
+    ]
+
+
+class ConcurrentURLValidationMixin(_BaseSerializer):
+    """
+    Fetch the URLs of all remote URL validators of the serializer concurrently.
+
+    By default, every :class:`vng_api_common.validators.URLValidator` fetches its
+    URL when it runs, so validating a serializer with several URL fields takes the
+    sum of all round trips. With this mixin, the URLs of all fields (including
+    nested and ``many=True`` serializers) are fetched concurrently before the
+    validation starts. Validation errors are still reported per field.
+    """
+
+    def run_validation(self, data=fields.empty):
+        if data is fields.empty or is_prefetching_urls():
+            return super().run_validation(data)
+
+        with prefetch_urls(get_url_validations(self, data)):
+            return super().run_validation(data)
+
+
+class ConcurrentURLValidationListSerializer(
+    ConcurrentURLValidationMixin, serializers.ListSerializer
+):
+    """
+    ``list_serializer_class`` to fetch the URLs of all items concurrently when a
+    serializer is used with ``many=True``.
+    """
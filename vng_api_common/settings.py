@@ -15,6 +15,36 @@ _SETTINGS_NAMESPACE = "COMMONGROUND_API_COMMON"
 #:
 COMMONGROUND_API_COMMON = {
     "API_EXCEPTION_CAMELIZE": True,
+    # dotted path to the ``vng_api_common.audittrails.sinks.AuditSink`` subclass
+    # used to write audit trail records
+    "AUDITTRAIL_SINK": "vng_api_common.audittrails.sinks.DirectAuditSink",
+    # defer the deletion of the audit trails of a deleted main object to the
+    # ``purge_audittrails`` management command
+    "AUDITTRAIL_DEFERRED_PURGE": False,
+    # store received notifications in the inbox table and handle them with the
+    # ``process_notifications`` management command
+    "NOTIFICATIONS_INBOX": False,
+    # seconds to reuse the clients and the service index of ``get_client``, ``0``
+    # builds a new client for every call
+    "CLIENT_REGISTRY_TIMEOUT": 300,
+    # number of hosts and connections per host kept in the connection pool of a
+    # client
+    "CLIENT_POOL_CONNECTIONS": 10,
+    "CLIENT_POOL_MAXSIZE": 20,
+    # number of threads that fetch the URLs of remote URL validators concurrently,
+    # see ``vng_api_common.serializers.ConcurrentURLValidationMixin``
+    "URL_VALIDATION_MAX_WORKERS": 8,
+    # cache the responses fetched by remote URL validators, see
+    # ``vng_api_common.validation_cache``
+    "URL_VALIDATION_CACHE": False,
+    # maximum number of responses in the in-process cache
+    "URL_VALIDATION_CACHE_MAX_ENTRIES": 1000,
+    # alias of a Django cache to share the responses between processes, or ``None``
+    "URL_VALIDATION_CACHE_ALIAS": None,
+    # seconds a response without ``Cache-Control: max-age`` is fresh
+    "URL_VALIDATION_CACHE_TIMEOUT": 300,
+    # seconds a 404 or 410 response is cached
+    "URL_VALIDATION_CACHE_NEGATIVE_TIMEOUT": 30,
 }
 
 
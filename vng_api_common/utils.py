@@ -1,10 +1,14 @@
 import logging
 import re
 import uuid
-from typing import TYPE_CHECKING, Any, cast
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from django.apps import apps
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.http import HttpRequest
 from django.urls import Resolver404, ResolverMatch, get_resolver, get_script_prefix
@@ -23,7 +27,7 @@ except ImportError:
     )
 
 if TYPE_CHECKING:
-    from rest_framework.viewsets import ModelViewSet, ViewSet
+    from rest_framework.viewsets import ViewSet
 
 
 logger = logging.getLogger(__name__)
@@ -56,12 +60,64 @@ class NotAViewSet(Exception):
     pass
 
 
+RESOLVE_CACHE_SIZE = 2048
+
+
+@dataclass(frozen=True)
+class LookupPlan:
+    """
+    How to look up the instance behind a detail path of a viewset class.
+
+    ``queryset`` is ``None`` if the viewset customizes ``get_queryset``, in which
+    case the viewset must be instantiated to get the queryset.
+    """
+
+    model: type[models.Model] | None
+    lookup_field: str
+    lookup_url_kwarg: str
+    queryset: models.QuerySet | None
+
+    def get_queryset(self, path: str) -> models.QuerySet:
+        if self.queryset is not None:
+            return self.queryset.all()
+        return get_viewset_for_path(path).get_queryset()
+
+
+@lru_cache(maxsize=None)
+def get_lookup_plan(viewset_cls) -> LookupPlan:
+    """
+    Build the lookup plan of a viewset class, once.
+    """
+    # imported here, the generic views read the DRF settings on import
+    from rest_framework.generics import GenericAPIView
+
+    base_queryset = getattr(viewset_cls, "queryset", None)
+    queryset = None
+    if viewset_cls.get_queryset is GenericAPIView.get_queryset:
+        queryset = base_queryset
+
+    return LookupPlan(
+        model=base_queryset.model if base_queryset is not None else None,
+        lookup_field=viewset_cls.lookup_field,
+        lookup_url_kwarg=viewset_cls.lookup_url_kwarg or viewset_cls.lookup_field,
+        queryset=queryset,
+    )
+
+
+@lru_cache(maxsize=RESOLVE_CACHE_SIZE)
+def _resolve(path: str, resolver) -> ResolverMatch:
+    return resolver.resolve(path)
+
+
 def resolve_path(path: str, resolver=None, script_prefix=None) -> ResolverMatch:
+    """
+    Resolve a path, the results are cached per URL resolver.
+    """
     resolver = resolver or get_resolver()
     prefix = script_prefix or get_script_prefix()
     path = path.replace(prefix, "/", 1)
     try:
-        return resolver.resolve(path)
+        return _resolve(path, resolver)
     except Resolver404 as exc:
         raise models.ObjectDoesNotExist("URL did not resolve") from exc
 
@@ -80,29 +136,34 @@ def get_viewset_for_path(path: str, method="GET") -> "ViewSet":
     viewset.action_map = callback.actions
     viewset.request = HttpRequest()
     viewset.args = callback_args
-    viewset.kwargs = callback_kwargs
+    # the resolver match is cached, don't share the kwargs
+    viewset.kwargs = dict(callback_kwargs)
 
     viewset.action = viewset.action_map.get(method.lower())
 
     return viewset
 
 
+def _strip_script_name(path: str) -> str:
+    if settings.FORCE_SCRIPT_NAME and path.startswith(settings.FORCE_SCRIPT_NAME):
+        return path[len(settings.FORCE_SCRIPT_NAME) :]
+    return path
+
+
 def get_resource_for_path(path: str) -> models.Model:
     """
     Retrieve the API instance belonging to a (detail) path.
     """
-    if settings.FORCE_SCRIPT_NAME and path.startswith(settings.FORCE_SCRIPT_NAME):
-        prefix_length = len(settings.FORCE_SCRIPT_NAME)
-        path = path[prefix_length:]
+    path = _strip_script_name(path)
 
-    viewset = get_viewset_for_path(path)
-    viewset = cast("ModelViewSet", viewset)
+    callback, _, callback_kwargs = resolve_path(path)
+    if not hasattr(callback, "cls"):
+        raise NotAViewSet(f"Callback for {path} does not look like a viewset")
 
     # See rest_framework.mixins.RetieveModelMixin.get_object()
-    lookup_url_kwarg = viewset.lookup_url_kwarg or viewset.lookup_field
-    filter_kwargs = {viewset.lookup_field: viewset.kwargs[lookup_url_kwarg]}
-
-    return viewset.get_queryset().get(**filter_kwargs)
+    plan = get_lookup_plan(callback.cls)
+    queryset = plan.get_queryset(path)
+    return queryset.get(**{plan.lookup_field: callback_kwargs[plan.lookup_url_kwarg]})
 
 
 def get_resources_for_paths(paths: list[str]) -> models.QuerySet | None:
@@ -143,18 +204,21 @@ def get_resources_for_paths(paths: list[str]) -> models.QuerySet | None:
             raise NotAViewSet(f"Callback for {path} does not look like a viewset")
 
         viewset_cls = callback.cls
-        lookup_url_kwarg = viewset_cls.lookup_url_kwarg or viewset_cls.lookup_field
-        lookup_kwarg_values.append(callback_kwargs[lookup_url_kwarg])
+        plan = get_lookup_plan(viewset_cls)
+        lookup_kwarg_values.append(callback_kwargs[plan.lookup_url_kwarg])
 
     assert viewset_cls is not None
 
-    viewset = viewset_cls()
-    queryset = viewset.get_queryset()
+    if plan.queryset is not None:
+        queryset = plan.queryset.all()
+    else:
+        queryset = viewset_cls().get_queryset()
     # drop any joins or prefetch_related to speed things up even more
     queryset = queryset.select_related(None).prefetch_related(None)
 
-    lookup_field = viewset_cls.lookup_field
-    filtered_queryset = queryset.filter(**{f"{lookup_field}__in": lookup_kwarg_values})
+    filtered_queryset = queryset.filter(
+        **{f"{plan.lookup_field}__in": lookup_kwarg_values}
+    )
     if not len(filtered_queryset) == len(paths):
         raise RuntimeError(
             f"Some paths could not be resolved with viewset {viewset_cls} - are you sure "
@@ -163,6 +227,99 @@ def get_resources_for_paths(paths: list[str]) -> models.QuerySet | None:
     return filtered_queryset
 
 
+def _get_lookup_value(instance: models.Model, lookup_field: str) -> str:
+    value = instance
+    for bit in lookup_field.split("__"):
+        value = getattr(value, bit)
+    return str(value)
+
+
+def _normalize_lookup_value(plan: LookupPlan, value: str) -> str:
+    """
+    Convert a URL kwarg to the string form of the lookup field value.
+
+    Raises :class:`django.core.exceptions.ValidationError` for invalid values.
+    """
+    if plan.model is None or "__" in plan.lookup_field:
+        return value
+    field = plan.model._meta.get_field(
+        plan.model._meta.pk.name if plan.lookup_field == "pk" else plan.lookup_field
+    )
+    return str(field.to_python(value))
+
+
+def _get_other_kwargs(plan: LookupPlan, callback_kwargs: dict) -> tuple:
+    # viewsets with a custom queryset may filter on the other URL kwargs
+    if plan.queryset is not None:
+        return ()
+    return tuple(
+        sorted(
+            (kwarg, kwarg_value)
+            for kwarg, kwarg_value in callback_kwargs.items()
+            if kwarg != plan.lookup_url_kwarg
+        )
+    )
+
+
+def get_resources_by_path(paths: Iterable[str]) -> dict[str, models.Model | None]:
+    """
+    Retrieve the API instances belonging to (detail) paths of any resource type.
+
+    Unlike :func:`get_resources_for_paths`, the paths may point to different
+    resources. The paths are grouped by viewset and every group is fetched with a
+    single query. The returned dict follows the order of ``paths`` and maps the
+    paths that do not resolve to an instance to ``None``.
+    """
+    resolved: dict[str, models.Model | None] = {}
+    # (viewset class, other URL kwargs) -> local path of the first path, and the
+    # paths per lookup value
+    groups: dict[tuple, tuple[str, dict[str, list[str]]]] = {}
+
+    # NOTE: this doesn't support setting a different urlconf on the request
+    resolver = get_resolver()
+    prefix = get_script_prefix()
+
+    for path in paths:
+        if path in resolved:
+            continue
+        resolved[path] = None
+
+        local_path = _strip_script_name(path)
+        try:
+            callback, _, callback_kwargs = resolve_path(
+                local_path, resolver=resolver, script_prefix=prefix
+            )
+        except models.ObjectDoesNotExist:
+            continue
+        if not hasattr(callback, "cls"):
+            continue
+
+        plan = get_lookup_plan(callback.cls)
+        try:
+            value = _normalize_lookup_value(
+                plan, callback_kwargs[plan.lookup_url_kwarg]
+            )
+        except (KeyError, ValidationError):
+            continue
+
+        _, paths_by_value = groups.setdefault(
+            (callback.cls, _get_other_kwargs(plan, callback_kwargs)), (local_path, {})
+        )
+        paths_by_value.setdefault(value, []).append(path)
+
+    for (viewset_cls, _), (local_path, paths_by_value) in groups.items():
+        plan = get_lookup_plan(viewset_cls)
+        queryset = plan.get_queryset(local_path).filter(
+            **{f"{plan.lookup_field}__in": list(paths_by_value)}
+        )
+        for instance in queryset:
+            value = _get_lookup_value(instance, plan.lookup_field)
+            for path in paths_by_value.get(value, ()):
+                resolved[path] = instance
+
+    return resolved
+
+
 def underscore_to_camel(input_: str | int) -> str | int:
     """
     Convert a string from under_score to camelCase.
@@ -170,7 +327,12 @@ def underscore_to_camel(input_: str | int) -> str | int:
     if not isinstance(input_, str):
         return input_
 
-    return re.sub(RE_UNDERSCORE, _underscore_to_camel, input_)
+    return _underscore_str_to_camel(input_)
+
+
+@lru_cache(maxsize=1024)
+def _underscore_str_to_camel(input_: str) -> str:
+    return RE_UNDERSCORE.sub(_underscore_to_camel, input_)
 
 
 def get_uuid_from_path(path: str) -> str:
@@ -0,0 +1,294 @@
+"""
+Cache the responses fetched by :class:`vng_api_common.validators.URLValidator`.
+
+Remote resources that are validated, like zaaktypen and informatieobjecttypen,
+rarely change once they are published, but were fetched again for every
+validation. With ``URL_VALIDATION_CACHE`` enabled (see :ref:`ref_settings`), the
+responses are cached in an in-process LRU cache, and optionally in a Django cache
+(``URL_VALIDATION_CACHE_ALIAS``) that is shared between processes.
+
+Entries are keyed by the URL, the request kwargs and the identity of the
+credentials, so different credentials don't share entries. For a JWT, like the
+ones of ZGW auth, that is the issuer and the ``client_id`` rather than the token,
+which changes with every request. Cached responses are returned as
+``requests.Response`` objects. A response is fresh for the
+``max-age`` of its ``Cache-Control`` header, or ``URL_VALIDATION_CACHE_TIMEOUT``
+seconds without one, and is not cached with ``no-store``. Stale responses with an
+``ETag`` or ``Last-Modified`` header are revalidated with a conditional request.
+``404`` and ``410`` responses are cached for
+``URL_VALIDATION_CACHE_NEGATIVE_TIMEOUT`` seconds.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any
+
+from django.core.cache import caches
+
+import jwt
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .settings import get_setting
+
+STORED_HEADERS = ("Cache-Control", "Content-Type", "ETag", "Last-Modified")
+
+NEGATIVE_STATUS_CODES = (404, 410)
+
+
+def parse_cache_control(value: str) -> dict[str, str | None]:
+    directives = {}
+    for directive in value.split(","):
+        name, _, argument = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def get_freshness(status_code: int, headers) -> int | None:
+    """
+    Return the number of seconds a response is fresh, ``None`` if it can't be
+    cached.
+    """
+    directives = parse_cache_control(headers.get("Cache-Control", ""))
+    if "no-store" in directives:
+        return None
+
+    if status_code in NEGATIVE_STATUS_CODES:
+        return get_setting("URL_VALIDATION_CACHE_NEGATIVE_TIMEOUT")
+    if status_code != 200:
+        return None
+
+    if "no-cache" in directives:
+        return 0
+    try:
+        return max(int(directives["max-age"] or ""), 0)
+    except (KeyError, ValueError):
+        return get_setting("URL_VALIDATION_CACHE_TIMEOUT")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    The parts of a response that validators use, in a form that can be pickled.
+    """
+
+    url: str
+    status_code: int
+    content: bytes
+    headers: dict[str, str]
+    expires: float
+
+    @classmethod
+    def from_response(cls, url: str, response) -> "CachedResponse | None":
+        freshness = get_freshness(response.status_code, response.headers)
+        if freshness is None:
+            return None
+
+        entry = cls(
+            url=url,
+            status_code=response.status_code,
+            content=response.content,
+            headers={
+                name: response.headers[name]
+                for name in STORED_HEADERS
+                if name in response.headers
+            },
+            expires=time.time() + freshness,
+        )
+        if not freshness and not entry.get_conditional_headers():
+            return None
+        return entry
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.content
+        return response
+
+    def get_conditional_headers(self) -> dict[str, str]:
+        if self.status_code != 200:
+            return {}
+
+        headers = {}
+        if etag := self.headers.get("ETag"):
+            headers["If-None-Match"] = etag
+        if last_modified := self.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def revalidate(self, response) -> "CachedResponse":
+        """
+        Update the entry from a ``304 Not Modified`` response.
+        """
+        headers = {
+            **self.headers,
+            **{
+                name: response.headers[name]
+                for name in STORED_HEADERS
+                if name in response.headers
+            },
+        }
+        freshness = get_freshness(200, headers) or 0
+        return replace(self, headers=headers, expires=time.time() + freshness)
+
+
+class ValidationCache:
+    """
+    Thread-safe LRU cache of :class:`CachedResponse`, backed by an optional Django
+    cache.
+    """
+
+    key_prefix = "url-validation"
+
+    def __init__(self, max_entries: int, alias: str | None = None):
+        self.max_entries = max_entries
+        self.alias = alias
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_cache_key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        if self.alias is None:
+            return None
+
+        entry = caches[self.alias].get(self._get_cache_key(key))
+        if entry is not None:
+            self._store(key, entry)
+        return entry
+
+    def _store(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        self._store(key, entry)
+
+        if self.alias is not None:
+            timeout = max(entry.expires - time.time(), 0)
+            if entry.get_conditional_headers():
+                # keep stale entries around to revalidate them
+                timeout += get_setting("URL_VALIDATION_CACHE_TIMEOUT")
+            caches[self.alias].set(
+                self._get_cache_key(key), entry, timeout=max(int(timeout), 1)
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+        if self.alias is not None:
+            caches[self.alias].delete(self._get_cache_key(key))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache
+def _get_cache(max_entries: int, alias: str | None) -> ValidationCache:
+    return ValidationCache(max_entries, alias)
+
+
+def get_validation_cache() -> ValidationCache:
+    return _get_cache(
+        get_setting("URL_VALIDATION_CACHE_MAX_ENTRIES"),
+        get_setting("URL_VALIDATION_CACHE_ALIAS"),
+    )
+
+
+def get_auth_identity(authorization: str) -> str:
+    """
+    Return who the ``Authorization`` header authenticates.
+
+    A bearer JWT is identified by its issuer and ``client_id``, since a new token
+    is generated for every request. The signature is not verified: the token is
+    one of our own credentials.
+    """
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer":
+        return authorization
+
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        return authorization
+    return json.dumps([claims.get("iss"), claims.get("client_id")])
+
+
+def get_cache_key(url: str, kwargs: dict[str, Any]) -> str:
+    """
+    Key the entries by URL, request kwargs and the identity of the credentials.
+    """
+    headers = dict(kwargs.get("headers") or {})
+    authorization = ""
+    for name in list(headers):
+        if name.lower() == "authorization":
+            authorization = headers.pop(name)
+    data = json.dumps(
+        [url, {**kwargs, "headers": headers}, get_auth_identity(authorization)],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def cached_fetch(fetcher: Callable, url: str, **kwargs: Any) -> Any:
+    """
+    Fetch the URL with ``fetcher``, through the validation cache if it is enabled.
+
+    Returns the response of the fetcher, or a ``requests.Response`` rebuilt from
+    the cache.
+    """
+    if not get_setting("URL_VALIDATION_CACHE"):
+        return fetcher(url, **kwargs)
+
+    cache = get_validation_cache()
+    key = get_cache_key(url, kwargs)
+    entry = cache.get(key)
+    if entry is not None and entry.is_fresh:
+        return entry.to_response()
+
+    conditional_headers = entry.get_conditional_headers() if entry else {}
+    if conditional_headers:
+        headers = {**kwargs.get("headers", {}), **conditional_headers}
+        response = fetcher(url, **{**kwargs, "headers": headers})
+        if response.status_code == 304:
+            assert entry is not None
+            entry = entry.revalidate(response)
+            cache.set(key, entry)
+            return entry.to_response()
+    else:
+        response = fetcher(url, **kwargs)
+
+    new_entry = CachedResponse.from_response(url, response)
+    if new_entry is not None:
+        cache.set(key, new_entry)
+    elif entry is not None:
+        cache.delete(key)
+    return response
@@ -1,7 +1,10 @@
 import json
 import logging
 import re
-from collections.abc import Callable, MutableMapping
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime, timedelta
 from typing import Any, cast
 
@@ -16,6 +19,8 @@ from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers, validators
 
 from .oas import fetcher, obj_has_shape
+from .settings import get_setting
+from .validation_cache import cached_fetch
 
 logger = logging.getLogger(__name__)
 
@@ -148,6 +153,67 @@ def validate_non_negative_string(value: str) -> None:
         raise ValidationError(error_message)
 
 
+# (id of the validator, URL) -> the fetch of the URL with the kwargs of the validator
+_prefetched_responses: ContextVar[dict[tuple[int, str], Future] | None] = ContextVar(
+    "prefetched_responses", default=None
+)
+
+
+def _get_fetch_key(url: str, kwargs: dict[str, Any]) -> tuple[str, str]:
+    return url, json.dumps(kwargs, sort_keys=True, default=str)
+
+
+def is_prefetching_urls() -> bool:
+    return _prefetched_responses.get() is not None
+
+
+@contextmanager
+def prefetch_urls(
+    validations: Iterable[tuple["URLValidator", str]], max_workers: int | None = None
+) -> Iterator[None]:
+    """
+    Fetch the URLs of remote URL validators concurrently, in a bounded pool of
+    threads.
+
+    Within the block, the validators use the fetched responses instead of fetching
+    the URLs themselves, so the validation errors are raised where the validators
+    run. A URL that is validated more than once (with the same auth) is fetched
+    once.
+
+    :param validations: pairs of a validator and the URL it will validate.
+    :param max_workers: the size of the pool, defaults to the
+      ``URL_VALIDATION_MAX_WORKERS`` setting.
+    """
+    if is_prefetching_urls():
+        yield
+        return
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers or get_setting("URL_VALIDATION_MAX_WORKERS"),
+        thread_name_prefix="url-validation",
+    )
+    fetches: dict[tuple[str, str], Future] = {}
+    futures: dict[tuple[int, str], Future] = {}
+    for validator, url in validations:
+        try:
+            # computed once, the validator picks up the fetch by its id
+            kwargs = validator.get_fetch_kwargs(url)
+        except Exception:
+            # the validator raises the error when it runs
+            continue
+        key = _get_fetch_key(url, kwargs)
+        if key not in fetches:
+            fetches[key] = executor.submit(validator.fetch, url, **kwargs)
+        futures[(id(validator), url)] = fetches[key]
+
+    token = _prefetched_responses.set(futures)
+    try:
+        yield
+    finally:
+        _prefetched_responses.reset(token)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 class URLValidator:
     """
     Validate that the URL actually resolves to a HTTP 200
@@ -155,7 +221,8 @@ class URLValidator:
     Any extra init kwargs are passed down to the underlying ``link_fetcher``
 
     :param get_auth: a callable returning appropriate headers to authenticate
-      against the remote.
+      against the remote, e.g. :func:`vng_api_common.client.get_auth_headers` to
+      use the credentials of the configured service.
     """
 
     message = _(
@@ -171,21 +238,31 @@ class URLValidator:
         self.get_auth = get_auth
         self.extra = extra
 
-    def __call__(self, value: str) -> Any:
-        link_fetcher = import_string(settings.LINK_FETCHER)
-
+    def get_fetch_kwargs(self, value: str) -> dict[str, Any]:
         extra = self.extra.copy()
         # Handle auth for the remote URL
         if self.get_auth:
             auth_headers = self.get_auth(value)
 
-            headers = extra.setdefault("headers", {})
+            headers = extra.get("headers", {})
             assert isinstance(headers, dict)
 
-            headers.update(auth_headers)
+            extra["headers"] = {**headers, **auth_headers}
+        return extra
+
+    def fetch(self, value: str, **kwargs: Any) -> Any:
+        link_fetcher = import_string(settings.LINK_FETCHER)
+        return cached_fetch(link_fetcher, value, **kwargs)
+
+    def __call__(self, value: str) -> Any:
+        prefetched = (_prefetched_responses.get() or {}).get((id(self), value))
+        extra = self.get_fetch_kwargs(value) if prefetched is None else {}
 
         try:
-            response = link_fetcher(value, **extra)
+            if prefetched is not None:
+                response = prefetched.result()
+            else:
+                response = self.fetch(value, **extra)
         except Exception as exc:
             raise serializers.ValidationError(
                 _("The URL {url} could not be fetched. Exception: {exc}").format(
@@ -1,10 +1,14 @@
-from typing import TYPE_CHECKING
+from itertools import islice
+from typing import TYPE_CHECKING, Iterator
 
+from django.db.models import Case, QuerySet, When
+from django.http import StreamingHttpResponse
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework.exceptions import ValidationError
 from rest_framework.filters import OrderingFilter
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.settings import api_settings
 from rest_framework.viewsets import GenericViewSet
@@ -47,6 +51,10 @@ class CheckQueryParamsMixin(BaseViewSet):
                 known_params.add(self.paginator.page_query_param)
                 if self.paginator.page_size_query_param:
                     known_params.add(self.paginator.page_size_query_param)
+            elif isinstance(self.paginator, CursorPagination):
+                known_params.add(self.paginator.cursor_query_param)
+                if self.paginator.page_size_query_param:
+                    known_params.add(self.paginator.page_size_query_param)
             else:
                 raise NotImplementedError(
                     "Unknown paginator class: %s" % type(self.paginator)
@@ -72,3 +80,101 @@ class CheckQueryParamsMixin(BaseViewSet):
     def retrieve(self, request: Request, *args, **kwargs):
         self._check_query_params(request)
         return super().retrieve(request, *args, **kwargs)  # pyright: ignore
+
+
+class StreamingListMixin(BaseViewSet):
+    """
+    Stream list (and search) responses instead of rendering them in one go.
+
+    The records are fetched with ``.iterator()`` and serialized, camelized and
+    rendered per chunk of :attr:`streaming_chunk_size` records, so the memory usage
+    does not grow with the number of records. Pagination only fetches the primary
+    keys (and ordering fields) of the page, the response has the same envelope as a
+    regular paginated response.
+
+    The records are rendered with the renderer selected by the content negotiation.
+    Responses of non-JSON renderers (like the browsable API) are not streamed.
+
+    Errors raised while streaming can no longer change the status code of the
+    response.
+
+    Put this mixin after :class:`CheckQueryParamsMixin` in the bases, so the query
+    parameters are still checked, and before
+    :class:`vng_api_common.search.SearchMixin`, so search responses are streamed.
+    """
+
+    streaming_chunk_size = 100
+
+    def list(self, request: Request, *args, **kwargs):
+        if not isinstance(request.accepted_renderer, JSONRenderer):
+            return super().list(request, *args, **kwargs)  # pyright: ignore
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.get_streaming_response(queryset)
+
+    def get_search_output(self, queryset: QuerySet):
+        if not isinstance(self.request.accepted_renderer, JSONRenderer):
+            return super().get_search_output(queryset)  # pyright: ignore
+        return self.get_streaming_response(queryset)
+
+    def get_streaming_response(self, queryset: QuerySet) -> StreamingHttpResponse:
+        envelope = None
+        if self.paginator is not None:
+            page = self.paginate_queryset(self._get_pagination_queryset(queryset))
+            if page is not None:
+                envelope = self.get_paginated_response([]).data
+                pks = [row["pk"] for row in page]
+                # keep the order of the page
+                queryset = queryset.filter(pk__in=pks).order_by(
+                    Case(
+                        *[When(pk=pk, then=position) for position, pk in enumerate(pks)]
+                    )
+                )
+
+        renderer = self.request.accepted_renderer
+        return StreamingHttpResponse(
+            self._render_streaming_content(queryset, envelope),
+            content_type=(
+                f"{renderer.media_type}; charset={renderer.charset}"
+                if renderer.charset
+                else renderer.media_type
+            ),
+        )
+
+    def _get_pagination_queryset(self, queryset: QuerySet) -> QuerySet:
+        ordering = queryset.query.order_by or (
+            queryset.query.default_ordering and queryset.model._meta.ordering
+        )
+        fields = [
+            field.lstrip("-")
+            for field in ordering or ()
+            if isinstance(field, str) and "__" not in field
+        ]
+        return queryset.values(*dict.fromkeys(["pk", *fields]))
+
+    def _render_streaming_content(
+        self, queryset: QuerySet, envelope: dict | None
+    ) -> Iterator[bytes]:
+        renderer = self.request.accepted_renderer
+        media_type = self.request.accepted_media_type
+        renderer_context = self.get_renderer_context()
+
+        if envelope is None:
+            yield b"["
+        else:
+            envelope.pop("results")
+            rendered = renderer.render(envelope, media_type, renderer_context)
+            # open the results list in the rendered object
+            yield rendered.rstrip()[:-1] + (
+                b',"results":[' if envelope else b'"results":['
+            )
+
+        serializer = self.get_serializer(many=True)
+        records = queryset.iterator(chunk_size=self.streaming_chunk_size)
+        separator = b""
+        while chunk := list(islice(records, self.streaming_chunk_size)):
+            for item in serializer.to_representation(chunk):
+                yield separator + renderer.render(item, media_type, renderer_context)
+                separator = b","
+
+        yield b"]" if envelope is None else b"]}"